@@ -1,11 +1,12 @@
 import os
-from flask import Flask
+from flask import Flask, request
 from flask_restx import Api
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 
 # Import database
-from persistence.database import db
+from persistence.database import db, set_sqlite_pragmas, pin_to_primary, REPLICA_BIND
+from persistence.replica import ReplicaRefresher
 
 # Import route namespaces
 from api.routes.user_routes import user_ns
@@ -19,6 +20,18 @@ from api.config import config
 
 # Import services
 from business_logic.user_service import UserService
+from business_logic.response_cache import response_cache, InMemoryCacheBackend
+from business_logic.password_hasher import password_hasher
+from business_logic.identity_cache import identity_cache
+from business_logic.token_revocation import token_revocation_store
+from business_logic.amenity_index import amenity_index
+from business_logic.amenity_catalog import amenity_catalog
+from repositories.in_memory_repository import in_memory_repo
+from api.serialization import output_json
+from scripts.init_db import (
+    init_database, init_db_command, rebuild_search_index_command, prune_revoked_tokens_command
+)
+from scripts.generate_data import seed_synthetic_command
 
 # Global extensions
 jwt = JWTManager()
@@ -32,50 +45,96 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
+    # Reads can be served by a replica bound next to the primary
+    if app.config['SQLALCHEMY_REPLICA_URI']:
+        app.config['SQLALCHEMY_BINDS'] = {
+            **app.config.get('SQLALCHEMY_BINDS', {}),
+            REPLICA_BIND: app.config['SQLALCHEMY_REPLICA_URI']
+        }
+    
     # Initialize extensions with app
     db.init_app(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            set_sqlite_pragmas(engine, app.config['SQLITE_PRAGMAS'])
     jwt.init_app(app)
     bcrypt.init_app(app)
     
-    # Set bcrypt instance for UserService
-    UserService.set_bcrypt(bcrypt)
+    # Hash passwords on a bounded process pool; it is a drop-in for the
+    # Flask-Bcrypt instance UserService expects
+    password_hasher.configure(
+        rounds=app.config['BCRYPT_LOG_ROUNDS'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        timeout=app.config['PASSWORD_HASH_TIMEOUT']
+    )
+    UserService.set_bcrypt(password_hasher)
     
-    # Create tables and initial data
-    with app.app_context():
-        try:
-            print("🔧 Creating database tables...")
-            
-            # CRITICAL: Import all models BEFORE creating tables
-            # This ensures SQLAlchemy knows about all tables to create
-            from business_logic.models.user import User
-            from business_logic.models.place import Place
-            from business_logic.models.review import Review
-            from business_logic.models.amenity import Amenity
-            
-            # Now create all tables
-            db.create_all()
-            print("✅ Database tables created successfully")
-            
-            # Debug: Check what tables were actually created
-            import sqlalchemy
-            inspector = sqlalchemy.inspect(db.engine)
-            tables = inspector.get_table_names()
-            print(f"📋 Created tables: {tables}")
-            
-            # Insert initial data if needed
-            print("🔧 Creating initial data...")
-            try:
-                from scripts.init_db import create_initial_data
-                create_initial_data()
-            except ImportError:
-                print("⏳ Initial data script not found, skipping...")
-            except Exception as e:
-                print(f"⚠️ Error creating initial data: {e}")
-                print("⏳ Tables don't exist yet, skipping initial data creation")
-            
-        except Exception as e:
-            print(f"❌ Error during database initialization: {e}")
-            # Continue anyway for development
+    # Start every app with an empty response cache
+    response_cache.configure(
+        enabled=app.config['RESPONSE_CACHE_ENABLED'],
+        backend=InMemoryCacheBackend(
+            max_entries=app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+            ttl=app.config['RESPONSE_CACHE_TTL']
+        )
+    )
+    
+    # Start every app with an empty identity cache
+    identity_cache.configure(
+        backend=InMemoryCacheBackend(
+            max_entries=app.config['IDENTITY_CACHE_MAX_ENTRIES'],
+            ttl=app.config['IDENTITY_CACHE_TTL']
+        ),
+        sync_interval=app.config['IDENTITY_CACHE_SYNC_INTERVAL']
+    )
+    
+    # Start every app with an empty revocation store; it loads the
+    # revoked_tokens table on the first token check
+    token_revocation_store.configure(
+        capacity=app.config['TOKEN_REVOCATION_CAPACITY'],
+        error_rate=app.config['TOKEN_REVOCATION_ERROR_RATE'],
+        sync_interval=app.config['TOKEN_REVOCATION_SYNC_INTERVAL']
+    )
+    
+    # Start every app with an empty amenity index; it loads on the first
+    # amenity-filtered search
+    amenity_index.configure(
+        enabled=app.config['AMENITY_INDEX_ENABLED'],
+        sync_interval=app.config['AMENITY_INDEX_SYNC_INTERVAL']
+    )
+    
+    # The in-memory repository outlives apps; only its storage mode changes
+    in_memory_repo.configure(
+        concurrent=app.config['IN_MEMORY_REPO_CONCURRENT'],
+        stripes=app.config['IN_MEMORY_REPO_STRIPES']
+    )
+    
+    # Start every app with an empty amenity catalog cache
+    amenity_catalog.configure()
+    
+    # Schema creation and seeding are an explicit step (flask init-db);
+    # only the throwaway in-memory test database is set up here
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(rebuild_search_index_command)
+    app.cli.add_command(prune_revoked_tokens_command)
+    app.cli.add_command(seed_synthetic_command)
+    if app.config['INIT_DB_ON_STARTUP']:
+        with app.app_context():
+            init_database()
+    
+    # Keep a local SQLite replica roughly up to date
+    if app.config['REPLICA_REFRESH_INTERVAL'] > 0:
+        with app.app_context():
+            replica = db.engines.get(REPLICA_BIND)
+            if replica is not None and replica.dialect.name == 'sqlite':
+                refresher = ReplicaRefresher(db.engine, replica, app.config['REPLICA_REFRESH_INTERVAL'])
+                refresher.start()
+                app.extensions['replica_refresher'] = refresher
+    
+    @app.before_request
+    def route_reads():
+        """Let safe requests read from the replica; writes stay on the primary"""
+        pin_to_primary(request.method not in ('GET', 'HEAD', 'OPTIONS'))
     
     # Create API instance
     api = Api(
@@ -86,6 +145,7 @@ def create_app(config_name=None):
         doc='/api/v1/doc/',
         prefix='/api/v1'
     )
+    api.representation('application/json')(output_json)
     
     # Register namespaces
     api.add_namespace(auth_ns, path='/auth')
@@ -102,31 +162,55 @@ def create_app(config_name=None):
     def health():
         return {'status': 'healthy'}, 200
     
+    @app.route('/stats/cache')
+    def cache_stats():
+        return response_cache.stats(), 200
+    
+    @app.route('/stats/password-hasher')
+    def password_hasher_stats():
+        return password_hasher.stats(), 200
+    
+    @app.route('/stats/identity-cache')
+    def identity_cache_stats():
+        return identity_cache.stats(), 200
+    
+    @app.route('/stats/revoked-tokens')
+    def revoked_tokens_stats():
+        return token_revocation_store.stats(), 200
+    
+    @app.route('/stats/amenity-index')
+    def amenity_index_stats():
+        return amenity_index.stats(), 200
+    
+    @app.route('/stats/amenity-catalog')
+    def amenity_catalog_stats():
+        return amenity_catalog.stats(), 200
+    
     # JWT configuration
     @jwt.additional_claims_loader
     def add_claims_to_jwt(identity):
         """Add additional claims to JWT"""
-        from business_logic.user_service import UserService
-        user = UserService.get_user_by_id(identity)
+        user = UserService.get_identity(identity)
         if user:
-            return {
-                'is_admin': user.is_admin,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name
-            }
+            return user.claims()
         return {}
     
     @jwt.user_identity_loader
     def user_identity_lookup(user):
         """Define what goes into the JWT token as identity"""
-        return user.id
+        # Routes pass the user ID itself; accept a user object too
+        return getattr(user, 'id', user)
     
     @jwt.user_lookup_loader
     def user_lookup_callback(_jwt_header, jwt_data):
-        """Load user from JWT"""
+        """Load user from JWT, deferring the row until a handler needs it"""
         identity = jwt_data["sub"]
-        return UserService.get_user_by_id(identity)
+        return UserService.get_current_user(identity)
+    
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        """Reject tokens revoked through /auth/logout"""
+        return token_revocation_store.is_revoked(jwt_payload['jti'])
     
     # JWT error handlers
     @jwt.expired_token_loader
@@ -141,10 +225,13 @@ def create_app(config_name=None):
     def missing_token_callback(error):
         return {'error': 'Authorization token is required'}, 401
     
+    @jwt.revoked_token_loader
+    def revoked_token_callback(jwt_header, jwt_payload):
+        return {'error': 'Token has been revoked'}, 401
+    
     return app
 
-# Create the app instance
-app = create_app()
 
 if __name__ == '__main__':
+    app = create_app()
     app.run(debug=True, host='0.0.0.0', port=5000)
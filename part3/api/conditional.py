@@ -0,0 +1,40 @@
+import hashlib
+from datetime import timezone
+from flask import request
+from werkzeug.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Build an (unquoted) entity tag from validator parts and the query string"""
+    digest = hashlib.sha1(repr(parts).encode('utf-8'))
+    digest.update(request.query_string)
+    return digest.hexdigest()
+
+
+def is_not_modified(etag, last_modified):
+    """Check the request's conditional headers against the current validators
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when the client sent no entity tags, as RFC 7232 requires.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        # HTTP dates have one-second resolution
+        modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        return modified <= request.if_modified_since
+    return False
+
+
+def conditional(validators, *parts):
+    """Return (headers, not_modified) for (version parts, last modified) validators
+
+    The ETag is weak because it is derived from the data's version rather
+    than the exact response bytes.
+    """
+    version_parts, last_modified = validators
+    etag = make_etag(*parts, *version_parts)
+    headers = {'ETag': quote_etag(etag, weak=True)}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers, is_not_modified(etag, last_modified)
@@ -16,12 +16,79 @@ class Config:
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ['access', 'refresh']
     
+    # Revoked tokens: Bloom filter sizing and how often (seconds) each
+    # process picks up revocations made elsewhere and forgets expired ones
+    TOKEN_REVOCATION_CAPACITY = 100000
+    TOKEN_REVOCATION_ERROR_RATE = 0.001
+    TOKEN_REVOCATION_SYNC_INTERVAL = 5
+    
     # Database configuration
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///hbnb.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Optional read replica: SELECTs outside a write go there. With two
+    # SQLite files, a positive refresh interval copies the primary over
+    # the replica every that many seconds
+    SQLALCHEMY_REPLICA_URI = os.getenv('DATABASE_REPLICA_URL')
+    REPLICA_REFRESH_INTERVAL = float(os.getenv('REPLICA_REFRESH_INTERVAL', 0))
+    
+    # SQLite tuning, applied to every new connection: WAL lets readers run
+    # alongside the single writer, NORMAL sync is durable across app crashes
+    # in WAL mode, and busy_timeout makes writers wait instead of failing
+    # with "database is locked"
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,  # ms
+        'cache_size': -16000,  # KiB
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY'
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+        'connect_args': {'timeout': 5}
+    }
+    
+    # Create tables and seed data in create_app instead of `flask init-db`
+    INIT_DB_ON_STARTUP = False
+    
     # Bcrypt settings
     BCRYPT_LOG_ROUNDS = 12
+    
+    # Password hashing pool: 0 workers hashes on the request thread, and
+    # requests beyond MAX_PENDING queued or running operations get a 503
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 32))
+    PASSWORD_HASH_TIMEOUT = 10  # seconds
+    
+    # Response cache for public GET endpoints
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_MAX_ENTRIES = 1024
+    RESPONSE_CACHE_TTL = 60  # seconds
+    
+    # Identity cache used by the JWT claims and user lookup loaders. A
+    # process sees its own user writes at once; a write made by another
+    # process (e.g. an is_admin demotion) is seen within
+    # IDENTITY_CACHE_SYNC_INTERVAL seconds, plus replica lag if one is used
+    IDENTITY_CACHE_MAX_ENTRIES = 10000
+    IDENTITY_CACHE_TTL = 300  # seconds
+    IDENTITY_CACHE_SYNC_INTERVAL = 5  # seconds
+    
+    # In-memory amenity bitmask per place for amenity filters; seconds
+    # between picking up places changed by other processes
+    AMENITY_INDEX_ENABLED = True
+    AMENITY_INDEX_SYNC_INTERVAL = 5
+    
+    # In-memory repository (amenities): True switches to lock-striped
+    # copy-on-write storage that threaded servers can share; writes then
+    # copy their stripe, so the default is a plain dict per type
+    IN_MEMORY_REPO_CONCURRENT = False
+    IN_MEMORY_REPO_STRIPES = 64
+    
+    # Rows fetched per query when streaming a collection
+    STREAM_CHUNK_SIZE = 500
 
 
 class DevelopmentConfig(Config):
@@ -36,8 +103,12 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    INIT_DB_ON_STARTUP = True  # Each app gets a fresh in-memory database
+    # The in-memory database lives on one shared connection
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)  # Shorter for testing
     BCRYPT_LOG_ROUNDS = 4  # Faster hashing for tests
+    PASSWORD_HASH_WORKERS = 0
 
 
 class ProductionConfig(Config):
@@ -46,6 +117,17 @@ class ProductionConfig(Config):
     TESTING = False
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     BCRYPT_LOG_ROUNDS = 14  # More secure for production
+    SQLITE_PRAGMAS = {
+        **Config.SQLITE_PRAGMAS,
+        'cache_size': -64000,  # KiB
+        'mmap_size': 256 * 1024 * 1024
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'pool_size': 20,
+        'max_overflow': 20,
+        'pool_recycle': 3600
+    }
 
 
 config = {
@@ -0,0 +1,27 @@
+from flask import request
+from flask_restx import reqparse
+
+# Query parameters accepted by every read endpoint
+fieldset_parser = reqparse.RequestParser()
+fieldset_parser.add_argument('fields', type=str, required=False, location='args',
+                             help='Comma-separated attributes to return (id is always returned)')
+fieldset_parser.add_argument('include', type=str, required=False, location='args',
+                             help='Comma-separated relationships to embed; empty for none')
+
+
+def _names(value):
+    """Split a comma-separated query value, keeping None for 'not given'"""
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def requested_fieldset(facade):
+    """Validate ?fields= and ?include= through the entity's facade
+    
+    Returns an (attributes, relationships) pair for the service read
+    methods and to_dict(); raises ValueError for unknown names.
+    """
+    return facade.parse_fieldset(
+        _names(request.args.get('fields')), _names(request.args.get('include'))
+    )
@@ -2,6 +2,10 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from business_logic.amenity_facade import amenity_facade
+from business_logic.response_cache import response_cache, cache_key
+from api.conditional import conditional
+from api.fieldsets import fieldset_parser, requested_fieldset
+from business_logic.batch import batch_status
 
 # Create namespace
 amenity_ns = Namespace('amenities', description='Amenity operations')
@@ -26,11 +30,27 @@ amenity_ns.authorizations = authorizations
 @amenity_ns.route('/')
 class AmenityList(Resource):
     @amenity_ns.doc('list_amenities')
+    @amenity_ns.expect(fieldset_parser)
     def get(self):
         """Retrieve all amenities (public endpoint)"""
         try:
+            attributes, _ = requested_fieldset(amenity_facade)
+            headers, not_modified = conditional(amenity_facade.get_amenities_validators(), 'amenities')
+            if not_modified:
+                return None, 304, headers
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
             amenities = amenity_facade.get_all_amenities()
-            return [amenity.to_dict() for amenity in amenities], 200
+            payload = [amenity.to_dict(fields=attributes) for amenity in amenities]
+            response_cache.set(key, payload, {'amenities'}, generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -56,17 +76,40 @@ class AmenityList(Resource):
         except Exception as e:
             return {'error': str(e)}, 500
 
+@amenity_ns.route('/batch')
+class AmenityBatch(Resource):
+    @jwt_required()
+    @amenity_ns.expect([amenity_model])
+    @amenity_ns.doc('create_amenities', security='Bearer Auth')
+    def post(self):
+        """Create several amenities in one request (admin only)"""
+        try:
+            claims = get_jwt()
+            if not claims.get('is_admin', False):
+                return {'error': 'Only administrators can create amenities'}, 403
+            
+            _, results = amenity_facade.create_amenities(request.json)
+            return {'results': results}, batch_status(results)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception as e:
+            return {'error': str(e)}, 500
+
 @amenity_ns.route('/<string:amenity_id>')
 @amenity_ns.param('amenity_id', 'The amenity identifier')
 class Amenity(Resource):
     @amenity_ns.doc('get_amenity')
+    @amenity_ns.expect(fieldset_parser)
     def get(self, amenity_id):
         """Retrieve an amenity by ID (public endpoint)"""
         try:
+            attributes, _ = requested_fieldset(amenity_facade)
             amenity = amenity_facade.get_amenity(amenity_id)
             if amenity:
-                return amenity.to_dict(), 200
+                return amenity.to_dict(fields=attributes), 200
             return {'error': 'Amenity not found'}, 404
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -1,7 +1,9 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, get_jwt
 from business_logic.user_facade import user_facade
+from business_logic.token_revocation import token_revocation_store
+from business_logic.password_hasher import PasswordHasherBusy
 
 # Create namespace
 auth_ns = Namespace('auth', description='Authentication operations')
@@ -41,6 +43,8 @@ class Register(Resource):
             }, 201
         except ValueError as e:
             return {'error': str(e)}, 400
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
         except Exception as e:
             return {'error': str(e)}, 500
 
@@ -76,6 +80,24 @@ class Login(Resource):
             else:
                 return {'error': 'Invalid email or password'}, 401
         
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
+        except Exception as e:
+            return {'error': str(e)}, 500
+
+
+@auth_ns.route('/logout')
+class Logout(Resource):
+    @jwt_required(verify_type=False)
+    @auth_ns.doc('logout_user', security='Bearer Auth')
+    def post(self):
+        """Revoke the access or refresh token sent with the request"""
+        try:
+            token = get_jwt()
+            token_revocation_store.revoke(
+                token['jti'], token['exp'], token['type'], get_jwt_identity()
+            )
+            return {'message': 'Successfully logged out'}, 200
         except Exception as e:
             return {'error': str(e)}, 500
 
@@ -2,6 +2,11 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from business_logic.place_facade import place_facade
+from business_logic.response_cache import response_cache, cache_key
+from api.conditional import conditional
+from api.fieldsets import fieldset_parser, requested_fieldset
+from api.streaming import add_stream_argument, stream_format, stream_chunk_size, stream_response
+from business_logic.batch import batch_status
 
 # Create namespace
 place_ns = Namespace('places', description='Place operations')
@@ -38,15 +43,102 @@ authorizations = {
 
 place_ns.authorizations = authorizations
 
+# Query parameters for paginated place listings
+page_parser = fieldset_parser.copy()
+page_parser.add_argument('limit', type=int, required=False, location='args',
+                         help='Maximum number of places to return (1-100)')
+page_parser.add_argument('cursor', type=str, required=False, location='args',
+                         help='Opaque cursor returned as next_cursor by the previous page')
+
+# Query parameters for the place listing, which can also stream everything
+list_parser = add_stream_argument(page_parser.copy())
+
+# Query parameters for place search (pagination arguments included)
+search_parser = page_parser.copy()
+search_parser.add_argument('q', type=str, required=False, location='args',
+                           help='Keywords matched against titles, descriptions and review text; '
+                                'results are ranked by relevance')
+search_parser.add_argument('min_price', type=float, required=False, location='args',
+                           help='Minimum price per night')
+search_parser.add_argument('max_price', type=float, required=False, location='args',
+                           help='Maximum price per night')
+search_parser.add_argument('min_lat', type=float, required=False, location='args',
+                           help='Southern edge of the bounding box')
+search_parser.add_argument('max_lat', type=float, required=False, location='args',
+                           help='Northern edge of the bounding box')
+search_parser.add_argument('min_lon', type=float, required=False, location='args',
+                           help='Western edge of the bounding box')
+search_parser.add_argument('max_lon', type=float, required=False, location='args',
+                           help='Eastern edge of the bounding box')
+search_parser.add_argument('amenities', type=str, action='split', required=False, location='args',
+                           help='Comma-separated amenity IDs; places must have all of them')
+
+# Query parameters for radius search
+nearby_parser = fieldset_parser.copy()
+nearby_parser.add_argument('lat', type=float, required=True, location='args',
+                           help='Latitude of the search centre')
+nearby_parser.add_argument('lon', type=float, required=True, location='args',
+                           help='Longitude of the search centre')
+nearby_parser.add_argument('radius_km', type=float, required=True, location='args',
+                           help='Search radius in kilometres (at most 100)')
+nearby_parser.add_argument('limit', type=int, required=False, location='args',
+                           help='Maximum number of places to return (1-100)')
+
+
+def listing_tags(places, relationships=None):
+    """Response cache tags for a listing showing the given places"""
+    tags = {'places', 'amenities'}
+    show_owner = relationships is None or 'owner' in relationships
+    for place in places:
+        tags.add(f'place:{place.id}')
+        if show_owner:
+            tags.add(f'user:{place.owner_id}')
+    return tags
+
 
 @place_ns.route('/')
 class PlaceList(Resource):
     @place_ns.doc('list_places')
+    @place_ns.expect(list_parser)
     def get(self):
-        """Retrieve all places (public endpoint)"""
+        """Retrieve a page of places, or stream them all (public endpoint)"""
+        args = list_parser.parse_args()
         try:
-            places = place_facade.get_all_places()
-            return [place.to_dict() for place in places], 200
+            attributes, relationships = fieldset = requested_fieldset(place_facade)
+            fmt = stream_format()
+            headers, not_modified = conditional(place_facade.get_places_validators(), 'places', fmt)
+            if not_modified:
+                return None, 304, headers
+            
+            if fmt:
+                return stream_response(
+                    place_facade.iter_places(stream_chunk_size(), fieldset),
+                    lambda place: place.to_dict(
+                        include_reviews=False, fields=attributes, include=relationships
+                    ),
+                    fmt, headers
+                )
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            places, next_cursor = place_facade.get_places_page(
+                args['limit'], args['cursor'], eager=True, fieldset=fieldset
+            )
+            payload = {
+                'data': [
+                    place.to_dict(include_reviews=False, fields=attributes, include=relationships)
+                    for place in places
+                ],
+                'next_cursor': next_cursor
+            }
+            response_cache.set(key, payload, listing_tags(places, relationships), generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -71,17 +163,139 @@ class PlaceList(Resource):
             return {'error': str(e)}, 500
 
 
+@place_ns.route('/batch')
+class PlaceBatch(Resource):
+    @jwt_required()
+    @place_ns.expect([place_model])
+    @place_ns.doc('create_places', security='Bearer Auth')
+    def post(self):
+        """Create several places in one request (authenticated users only)"""
+        try:
+            current_user_id = get_jwt_identity()
+            _, results = place_facade.create_places(request.json, current_user_id)
+            return {'results': results}, batch_status(results)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception as e:
+            return {'error': str(e)}, 500
+
+
+@place_ns.route('/search')
+class PlaceSearch(Resource):
+    @place_ns.doc('search_places')
+    @place_ns.expect(search_parser)
+    def get(self):
+        """Search places by keywords, price, bounding box and amenities (public endpoint)"""
+        args = search_parser.parse_args()
+        try:
+            attributes, relationships = fieldset = requested_fieldset(place_facade)
+            headers, not_modified = conditional(
+                place_facade.get_places_validators(with_reviews=args['q'] is not None), 'places/search'
+            )
+            if not_modified:
+                return None, 304, headers
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            places, next_cursor = place_facade.search_places(
+                args, args['limit'], args['cursor'], eager=True, fieldset=fieldset
+            )
+            payload = {
+                'data': [
+                    place.to_dict(include_reviews=False, fields=attributes, include=relationships)
+                    for place in places
+                ],
+                'next_cursor': next_cursor
+            }
+            tags = listing_tags(places, relationships)
+            if args['q'] is not None:
+                # Review text is searched too
+                tags.add('reviews')
+            response_cache.set(key, payload, tags, generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception as e:
+            return {'error': str(e)}, 500
+
+
+@place_ns.route('/nearby')
+class PlaceNearby(Resource):
+    @place_ns.doc('find_places_nearby')
+    @place_ns.expect(nearby_parser)
+    def get(self):
+        """Retrieve the nearest places within a radius (public endpoint)"""
+        args = nearby_parser.parse_args()
+        try:
+            attributes, relationships = fieldset = requested_fieldset(place_facade)
+            headers, not_modified = conditional(place_facade.get_places_validators(), 'places/nearby')
+            if not_modified:
+                return None, 304, headers
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            results = place_facade.find_places_nearby(
+                args['lat'], args['lon'], args['radius_km'], args['limit'],
+                eager=True, fieldset=fieldset
+            )
+            data = []
+            for place, distance in results:
+                place_dict = place.to_dict(
+                    include_reviews=False, fields=attributes, include=relationships
+                )
+                place_dict['distance_km'] = round(distance, 3)
+                data.append(place_dict)
+            payload = {'data': data}
+            tags = listing_tags((place for place, _ in results), relationships)
+            response_cache.set(key, payload, tags, generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception as e:
+            return {'error': str(e)}, 500
+
+
 @place_ns.route('/<string:place_id>')
 @place_ns.param('place_id', 'The place identifier')
 class Place(Resource):
     @place_ns.doc('get_place')
+    @place_ns.expect(fieldset_parser)
     def get(self, place_id):
         """Retrieve a place by ID (public endpoint)"""
         try:
-            place = place_facade.get_place(place_id)
+            attributes, relationships = fieldset = requested_fieldset(place_facade)
+            validators = place_facade.get_place_validators(place_id)
+            if validators is None:
+                return {'error': 'Place not found'}, 404
+            headers, not_modified = conditional(validators, 'place', place_id)
+            if not_modified:
+                return None, 304, headers
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            place = place_facade.get_place(place_id, eager=True, fieldset=fieldset)
             if place:
-                return place.to_dict(), 200
+                payload = place.to_dict(fields=attributes, include=relationships)
+                tags = {f'place:{place.id}', 'amenities'}
+                if relationships is None or 'owner' in relationships:
+                    tags.add(f'user:{place.owner_id}')
+                response_cache.set(key, payload, tags, generation)
+                return payload, 200, headers
             return {'error': 'Place not found'}, 404
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -2,6 +2,11 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from business_logic.review_facade import review_facade
+from business_logic.response_cache import response_cache, cache_key
+from api.conditional import conditional
+from api.fieldsets import fieldset_parser, requested_fieldset
+from api.streaming import stream_parser, stream_format, stream_chunk_size, stream_response
+from business_logic.batch import batch_status
 
 # Create namespace
 review_ns = Namespace('reviews', description='Review operations')
@@ -32,14 +37,52 @@ authorizations = {
 review_ns.authorizations = authorizations
 
 
+def listing_tags(reviews, relationships, *tags):
+    """Response cache tags for a listing showing the given reviews"""
+    tags = set(tags)
+    show_place = relationships is None or 'place' in relationships
+    show_user = relationships is None or 'user' in relationships
+    for review in reviews:
+        if show_place:
+            tags.add(f'place:{review.place_id}')
+        if show_user:
+            tags.add(f'user:{review.user_id}')
+    return tags
+
+
 @review_ns.route('/')
 class ReviewList(Resource):
     @review_ns.doc('list_reviews')
+    @review_ns.expect(stream_parser)
     def get(self):
         """Retrieve all reviews (public endpoint)"""
         try:
-            reviews = review_facade.get_all_reviews()
-            return [review.to_dict() for review in reviews], 200
+            attributes, relationships = fieldset = requested_fieldset(review_facade)
+            fmt = stream_format()
+            headers, not_modified = conditional(review_facade.get_reviews_validators(), 'reviews', fmt)
+            if not_modified:
+                return None, 304, headers
+            
+            if fmt:
+                return stream_response(
+                    review_facade.iter_reviews(stream_chunk_size(), fieldset),
+                    lambda review: review.to_dict(fields=attributes, include=relationships),
+                    fmt, headers
+                )
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            reviews = review_facade.get_all_reviews(eager=True, fieldset=fieldset)
+            payload = [review.to_dict(fields=attributes, include=relationships) for review in reviews]
+            tags = listing_tags(reviews, relationships, 'reviews')
+            response_cache.set(key, payload, tags, generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -64,17 +107,45 @@ class ReviewList(Resource):
             return {'error': str(e)}, 500
 
 
+@review_ns.route('/batch')
+class ReviewBatch(Resource):
+    @jwt_required()
+    @review_ns.expect([review_model])
+    @review_ns.doc('create_reviews', security='Bearer Auth')
+    def post(self):
+        """Create several reviews in one request (authenticated users only)"""
+        try:
+            current_user_id = get_jwt_identity()
+            _, results = review_facade.create_reviews(request.json, current_user_id)
+            return {'results': results}, batch_status(results)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception as e:
+            return {'error': str(e)}, 500
+
+
 @review_ns.route('/<string:review_id>')
 @review_ns.param('review_id', 'The review identifier')
 class Review(Resource):
     @review_ns.doc('get_review')
+    @review_ns.expect(fieldset_parser)
     def get(self, review_id):
         """Retrieve a review by ID (public endpoint)"""
         try:
-            review = review_facade.get_review(review_id)
+            attributes, relationships = fieldset = requested_fieldset(review_facade)
+            validators = review_facade.get_review_validators(review_id)
+            if validators is None:
+                return {'error': 'Review not found'}, 404
+            headers, not_modified = conditional(validators, 'review', review_id)
+            if not_modified:
+                return None, 304, headers
+            
+            review = review_facade.get_review(review_id, eager=True, fieldset=fieldset)
             if review:
-                return review.to_dict(), 200
+                return review.to_dict(fields=attributes, include=relationships), 200, headers
             return {'error': 'Review not found'}, 404
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -141,10 +212,29 @@ class Review(Resource):
 @review_ns.param('place_id', 'The place identifier')
 class PlaceReviews(Resource):
     @review_ns.doc('get_place_reviews')
+    @review_ns.expect(fieldset_parser)
     def get(self, place_id):
         """Retrieve all reviews for a specific place (public endpoint)"""
         try:
-            reviews = review_facade.get_reviews_by_place(place_id)
-            return [review.to_dict() for review in reviews], 200
+            attributes, relationships = fieldset = requested_fieldset(review_facade)
+            headers, not_modified = conditional(
+                review_facade.get_reviews_validators(), 'place_reviews', place_id
+            )
+            if not_modified:
+                return None, 304, headers
+            
+            key = cache_key(request.path, request.args, headers['ETag'])
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached, 200, headers
+            generation = response_cache.generation()
+            
+            reviews = review_facade.get_reviews_by_place(place_id, eager=True, fieldset=fieldset)
+            payload = [review.to_dict(fields=attributes, include=relationships) for review in reviews]
+            tags = listing_tags(reviews, relationships, f'place_reviews:{place_id}')
+            response_cache.set(key, payload, tags, generation)
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
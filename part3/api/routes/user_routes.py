@@ -2,6 +2,10 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from business_logic.user_facade import user_facade
+from business_logic.password_hasher import PasswordHasherBusy
+from api.conditional import conditional
+from api.fieldsets import fieldset_parser, requested_fieldset
+from api.streaming import stream_parser, stream_format, stream_chunk_size, stream_response
 
 # Create namespace
 user_ns = Namespace('users', description='User operations')
@@ -45,11 +49,28 @@ user_ns.authorizations = authorizations
 @user_ns.route('/')
 class UserList(Resource):
     @user_ns.doc('list_users')
+    @user_ns.expect(stream_parser)
     def get(self):
         """Retrieve all users (public endpoint)"""
         try:
-            users = user_facade.get_all_users()
-            return [user.to_dict() for user in users], 200
+            attributes, relationships = fieldset = requested_fieldset(user_facade)
+            fmt = stream_format()
+            headers, not_modified = conditional(user_facade.get_users_validators(), 'users', fmt)
+            if not_modified:
+                return None, 304, headers
+            
+            if fmt:
+                return stream_response(
+                    user_facade.iter_users(stream_chunk_size(), fieldset),
+                    lambda user: user.to_dict(fields=attributes, include=relationships),
+                    fmt, headers
+                )
+            
+            users = user_facade.get_all_users(eager=True, fieldset=fieldset)
+            payload = [user.to_dict(fields=attributes, include=relationships) for user in users]
+            return payload, 200, headers
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -75,6 +96,8 @@ class UserList(Resource):
             }, 201
         except ValueError as e:
             return {'error': str(e)}, 400
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
         except Exception as e:
             return {'error': str(e)}, 500
 
@@ -82,13 +105,24 @@ class UserList(Resource):
 @user_ns.param('user_id', 'The user identifier')
 class User(Resource):
     @user_ns.doc('get_user')
+    @user_ns.expect(fieldset_parser)
     def get(self, user_id):
         """Retrieve a user by ID (public endpoint)"""
         try:
-            user = user_facade.get_user(user_id)
+            attributes, relationships = fieldset = requested_fieldset(user_facade)
+            validators = user_facade.get_user_validators(user_id)
+            if validators is None:
+                return {'error': 'User not found'}, 404
+            headers, not_modified = conditional(validators, 'user', user_id)
+            if not_modified:
+                return None, 304, headers
+            
+            user = user_facade.get_user(user_id, eager=True, fieldset=fieldset)
             if user:
-                return user.to_dict(), 200
+                return user.to_dict(fields=attributes, include=relationships), 200, headers
             return {'error': 'User not found'}, 404
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'error': str(e)}, 500
     
@@ -136,5 +170,7 @@ class User(Resource):
             
         except ValueError as e:
             return {'error': str(e)}, 400
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
         except Exception as e:
             return {'error': str(e)}, 500
@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+from flask import make_response
+from sqlalchemy.engine import Row
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def _default(value):
+    """Encode what the JSON encoder does not know natively"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, Row):
+        return {key: _default(item) if isinstance(item, datetime) else item
+                for key, item in value._mapping.items()}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """Encode data as compact UTF-8 JSON
+    
+    Models are encoded through to_dict() and Core rows as {column: value}.
+    orjson is used when installed; the stdlib fallback emits the same bytes
+    for the values the API returns.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(
+        data, default=_default, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTx representation writing the encoded bytes to the response"""
+    response = make_response(dumps(data), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
@@ -0,0 +1,64 @@
+from flask import Response, current_app, request, stream_with_context
+from api.serialization import dumps
+from api.fieldsets import fieldset_parser
+
+JSON_MIMETYPE = 'application/json'
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def add_stream_argument(parser):
+    """Document the ?stream= switch on a listing's query parser"""
+    parser.add_argument('stream', type=str, required=False, location='args',
+                        help='true to stream every row as a JSON array; '
+                             'send Accept: application/x-ndjson for NDJSON')
+    return parser
+
+
+# Query parameters for streamable listings
+stream_parser = add_stream_argument(fieldset_parser.copy())
+
+
+def stream_format():
+    """Return 'ndjson' or 'json' for a streamed listing, or None to respond normally
+    
+    NDJSON is chosen by content negotiation (Accept: application/x-ndjson);
+    a streamed JSON array is requested with ?stream=true.
+    """
+    if request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+        return 'ndjson'
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return 'json'
+    return None
+
+
+def stream_chunk_size():
+    """Rows fetched per query while streaming"""
+    return current_app.config['STREAM_CHUNK_SIZE']
+
+
+def stream_response(chunks, serialize, fmt, headers=None):
+    """Stream chunks of objects as a JSON array or as NDJSON
+    
+    Each chunk is encoded and sent before the next is fetched, so memory
+    stays flat whatever the collection size. The status is sent before the
+    first row, so a database error midway truncates the body instead.
+    """
+    def generate():
+        if fmt == 'ndjson':
+            for chunk in chunks:
+                yield b''.join(dumps(serialize(obj)) + b'\n' for obj in chunk)
+            return
+        separator = b'['
+        for chunk in chunks:
+            parts = []
+            for obj in chunk:
+                parts.append(separator)
+                parts.append(dumps(serialize(obj)))
+                separator = b','
+            yield b''.join(parts)
+        yield b'[]' if separator == b'[' else b']'
+    
+    mimetype = NDJSON_MIMETYPE if fmt == 'ndjson' else JSON_MIMETYPE
+    response = Response(stream_with_context(generate()), mimetype=mimetype, headers=headers)
+    response.vary.add('Accept')
+    return response
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Read throughput of the in-memory repository under concurrent writers
+
+Readers list, look up by ID and by indexed attribute while writers add,
+update and delete reviews. Runs the plain and the concurrent storage and
+counts reads that raised or saw a write half-applied:
+
+    python -m benchmarks.in_memory_concurrency --readers 8 --writers 2 --seconds 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.in_memory_repository import InMemoryRepository, DEFAULT_STRIPES
+from business_logic.models.review import Review
+
+OBJECTS = 5000
+PLACES = 500
+
+
+def prepare(repo):
+    """Fill the repository with reviews spread over PLACES places"""
+    reviews = repo.add_all(Review('Seed review', 1 + i % 5, f'place-{i % PLACES}', f'user-{i % 50}')
+                           for i in range(OBJECTS))
+    return [review.id for review in reviews]
+
+
+def run(concurrent, readers, writers, seconds, stripes):
+    """Return (reads, writes, errors, torn reads) for one storage mode"""
+    repo = InMemoryRepository(concurrent=concurrent, stripes=stripes)
+    ids = prepare(repo)
+    counts = {'reads': 0, 'writes': 0, 'errors': 0, 'torn': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def count(key, amount=1):
+        with lock:
+            counts[key] += amount
+
+    def reader():
+        rng = random.Random()
+        reads = 0
+        while time.monotonic() < deadline:
+            try:
+                # Writers add and remove reviews in pairs for one place, so
+                # a consistent listing never has more than one odd place per writer
+                pairs = {}
+                for review in repo.get_all('Review'):
+                    if review.user_id == 'writer':
+                        pairs[review.place_id] = pairs.get(review.place_id, 0) + 1
+                if sum(1 for total in pairs.values() if total == 1) > writers:
+                    count('torn')
+                repo.get('Review', rng.choice(ids))
+                repo.get_by_attribute('Review', 'place_id', f'place-{rng.randrange(PLACES)}')
+                reads += 1
+            except Exception:
+                count('errors')
+        count('reads', reads)
+
+    def writer(number):
+        rng = random.Random()
+        writes = 0
+        round_number = 0
+        while time.monotonic() < deadline:
+            try:
+                place_id = f'writer-{number}-{round_number}'
+                pair = [repo.add(Review('New review', 5, place_id, 'writer')) for _ in range(2)]
+                review = repo.get('Review', rng.choice(ids))
+                if review is not None:
+                    repo.update(review)
+                for new_review in pair:
+                    repo.delete('Review', new_review.id)
+                writes += 5
+                round_number += 1
+            except Exception:
+                count('errors')
+        count('writes', writes)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(number,)) for number in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--stripes', type=int, default=DEFAULT_STRIPES)
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {OBJECTS} objects, {args.seconds:g}s per run")
+    print(f"{'storage':<12}{'reads/s':>12}{'writes/s':>12}{'errors':>10}{'torn':>10}")
+    for name, concurrent in (('plain', False), ('concurrent', True)):
+        counts = run(concurrent, args.readers, args.writers, args.seconds, args.stripes)
+        print(f"{name:<12}{counts['reads'] / args.seconds:>12.0f}"
+              f"{counts['writes'] / args.seconds:>12.0f}"
+              f"{counts['errors']:>10}{counts['torn']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for repositories, services, serializers and JWT handling
+
+Each benchmark runs against a synthetic dataset of a fixed size in an
+in-memory database. Results can be saved as JSON and compared against a
+stored baseline; the run fails when any median regresses by more than
+the threshold:
+
+    python -m benchmarks.micro --size small --save benchmarks/baseline.json
+    python -m benchmarks.micro --size small --compare benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy
+from flask_jwt_extended import create_access_token, decode_token, verify_jwt_in_request
+from api.app import create_app
+from api.serialization import dumps
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.review import Review
+from business_logic.review_service import ReviewService
+from repositories.user_repository import UserRepository
+from repositories.place_repository import PlaceRepository
+from repositories.review_repository import ReviewRepository
+from scripts.generate_data import generate_dataset
+
+# (users, places, reviews) per dataset size
+SIZES = {
+    'small': (500, 200, 5000),
+    'medium': (5000, 2000, 50000),
+    'large': (50000, 20000, 500000),
+}
+
+SEED = 42
+
+BENCHMARKS = {}
+
+
+def benchmark(name, fresh_session=True):
+    """Register a benchmark: a setup(ctx, calls) that returns the timed callable
+
+    With fresh_session the session is discarded (untimed) before every
+    call, as it is between requests, so reads are not served from the
+    identity map.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, fresh_session)
+        return setup
+    return register
+
+
+class Context:
+    """Dataset IDs shared by the benchmarks"""
+
+    def __init__(self, app, seed):
+        self.app = app
+        self.rng = random.Random(seed)
+        self.user_ids = db.session.scalars(db.select(User.id).where(User.is_admin.is_(False))).all()
+        self.place_ids = db.session.scalars(db.select(Place.id)).all()
+        self.reviews = db.session.execute(db.select(Review.id, Review.user_id, Review.place_id)).all()
+        self.owner_ids = db.session.scalars(db.select(Place.owner_id).distinct()).all()
+        self.emails = db.session.scalars(db.select(User.email).where(User.is_admin.is_(False))).all()
+        self._counter = itertools.count()
+
+    def pick(self, values):
+        return self.rng.choice(values)
+
+    def unique(self):
+        return next(self._counter)
+
+    def new_user(self):
+        return User('Bench', 'User', f'bench{self.unique()}@example.com', 'password123')
+
+
+# Repositories
+
+@benchmark('repository.add')
+def bench_repository_add(ctx, calls):
+    repository = UserRepository()
+    return lambda: repository.add(ctx.new_user())
+
+
+@benchmark('repository.get')
+def bench_repository_get(ctx, calls):
+    repository = PlaceRepository()
+    return lambda: repository.get(ctx.pick(ctx.place_ids))
+
+
+@benchmark('repository.get_all')
+def bench_repository_get_all(ctx, calls):
+    repository = PlaceRepository()
+    return repository.get_all
+
+
+@benchmark('repository.update')
+def bench_repository_update(ctx, calls):
+    repository = UserRepository()
+
+    def update():
+        user = repository.get(ctx.pick(ctx.user_ids))
+        user.update(first_name=f'Bench{ctx.unique()}')
+        repository.update(user)
+    return update
+
+
+@benchmark('repository.delete')
+def bench_repository_delete(ctx, calls):
+    repository = UserRepository()
+    users = [ctx.new_user() for _ in range(calls)]
+    repository.add_all(users)
+    user_ids = [user.id for user in users]
+    return lambda: repository.delete(user_ids.pop())
+
+
+@benchmark('repository.get_by_email')
+def bench_get_by_email(ctx, calls):
+    repository = UserRepository()
+    return lambda: repository.get_by_email(ctx.pick(ctx.emails))
+
+
+@benchmark('repository.get_by_owner')
+def bench_get_by_owner(ctx, calls):
+    repository = PlaceRepository()
+    return lambda: repository.get_by_owner(ctx.pick(ctx.owner_ids))
+
+
+@benchmark('repository.get_by_place')
+def bench_get_by_place(ctx, calls):
+    repository = ReviewRepository()
+    return lambda: repository.get_by_place(ctx.pick(ctx.place_ids))
+
+
+@benchmark('repository.get_by_user_and_place')
+def bench_get_by_user_and_place(ctx, calls):
+    repository = ReviewRepository()
+
+    def lookup():
+        _, user_id, place_id = ctx.pick(ctx.reviews)
+        return repository.get_by_user_and_place(user_id, place_id)
+    return lookup
+
+
+# Services
+
+@benchmark('review_service.create_review')
+def bench_create_review(ctx, calls):
+    # A fresh reviewer per call, so every review passes validation
+    users = [ctx.new_user() for _ in range(calls)]
+    UserRepository().add_all(users)
+    user_ids = [user.id for user in users]
+
+    def create():
+        ReviewService.create_review({
+            'text': 'Benchmark stay', 'rating': 4,
+            'place_id': ctx.pick(ctx.place_ids), 'user_id': user_ids.pop()
+        })
+    return create
+
+
+@benchmark('review_service.create_review_rejected')
+def bench_create_review_rejected(ctx, calls):
+    def create():
+        _, user_id, place_id = ctx.pick(ctx.reviews)
+        try:
+            ReviewService.create_review({
+                'text': 'Again', 'rating': 3, 'place_id': place_id, 'user_id': user_id
+            })
+        except ValueError:
+            pass
+    return create
+
+
+# Serialization
+
+@benchmark('serialize.place_to_dict', fresh_session=False)
+def bench_place_to_dict(ctx, calls):
+    repository = PlaceRepository()
+    place = repository.get(ctx.pick(ctx.place_ids), options=repository.serialization_options())
+    return place.to_dict
+
+
+@benchmark('serialize.review_to_dict', fresh_session=False)
+def bench_review_to_dict(ctx, calls):
+    repository = ReviewRepository()
+    review = repository.get(ctx.pick(ctx.reviews)[0], options=repository.serialization_options())
+    return review.to_dict
+
+
+@benchmark('serialize.user_to_dict', fresh_session=False)
+def bench_user_to_dict(ctx, calls):
+    repository = UserRepository()
+    user = repository.get(ctx.pick(ctx.user_ids), options=repository.serialization_options())
+    return user.to_dict
+
+
+@benchmark('serialize.place_page_dumps', fresh_session=False)
+def bench_place_page_dumps(ctx, calls):
+    repository = PlaceRepository()
+    places, _ = repository.get_page(50, options=repository.serialization_options(include_reviews=False))
+    return lambda: dumps([place.to_dict(include_reviews=False) for place in places])
+
+
+# JWT
+
+@benchmark('jwt.issue', fresh_session=False)
+def bench_jwt_issue(ctx, calls):
+    return lambda: create_access_token(identity=ctx.pick(ctx.user_ids))
+
+
+@benchmark('jwt.decode', fresh_session=False)
+def bench_jwt_decode(ctx, calls):
+    tokens = [create_access_token(identity=user_id) for user_id in ctx.user_ids[:100]]
+    return lambda: decode_token(ctx.pick(tokens))
+
+
+@benchmark('jwt.verify_request', fresh_session=False)
+def bench_jwt_verify_request(ctx, calls):
+    tokens = [create_access_token(identity=user_id) for user_id in ctx.user_ids[:100]]
+
+    def verify():
+        headers = {'Authorization': f'Bearer {ctx.pick(tokens)}'}
+        with ctx.app.test_request_context(headers=headers):
+            verify_jwt_in_request()
+    return verify
+
+
+def run_benchmark(ctx, name, calls, warmup):
+    """Time calls of one benchmark, returning per-call statistics in microseconds"""
+    setup, fresh_session = BENCHMARKS[name]
+    fn = setup(ctx, calls + warmup)
+    timings = []
+    for index in range(calls + warmup):
+        if fresh_session:
+            db.session.remove()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            timings.append(elapsed * 1e6)
+    db.session.remove()
+    timings.sort()
+    return {
+        'calls': calls,
+        'median_us': round(statistics.median(timings), 2),
+        'mean_us': round(statistics.fmean(timings), 2),
+        'p95_us': round(timings[int(len(timings) * 0.95) - 1], 2),
+        'min_us': round(timings[0], 2),
+    }
+
+
+def run_suite(size='small', calls=200, warmup=20, selected=None, progress=None):
+    """Load the dataset and run the selected benchmarks, returning a results document"""
+    users, places, reviews = SIZES[size]
+    app = create_app('testing')
+    with app.app_context():
+        generate_dataset(users, places, reviews, seed=SEED, batch_size=10000)
+        ctx = Context(app, SEED)
+        results = {}
+        for name in BENCHMARKS:
+            if selected and not any(name.startswith(prefix) for prefix in selected):
+                continue
+            results[name] = run_benchmark(ctx, name, calls, warmup)
+            if progress is not None:
+                progress(name, results[name])
+    return {
+        'meta': {
+            'size': size,
+            'dataset': {'users': users, 'places': places, 'reviews': reviews, 'seed': SEED},
+            'calls': calls,
+            'python': platform.python_version(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return [(name, baseline median, current median, change)] and the regressed names"""
+    rows = []
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            rows.append((name, None, result['median_us'], None))
+            continue
+        change = result['median_us'] / previous['median_us'] - 1
+        rows.append((name, previous['median_us'], result['median_us'], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', choices=SIZES, default='small')
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--only', nargs='*', help='Run benchmarks whose names start with these prefixes')
+    parser.add_argument('--save', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed median slowdown before failing (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    def progress(name, result):
+        print(f"{name:<42}{result['median_us']:>12.1f} us  (p95 {result['p95_us']:.1f})")
+
+    current = run_suite(args.size, args.calls, args.warmup, args.only, progress)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"💾 Results saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline['meta']['size'] != current['meta']['size']:
+            print(f"⚠️ Baseline is for size '{baseline['meta']['size']}'")
+        rows, regressions = compare(current, baseline, args.threshold)
+        print(f"\n{'benchmark':<42}{'baseline':>12}{'current':>12}{'change':>10}")
+        for name, before, after, change in rows:
+            before_text = f'{before:.1f}' if before is not None else '-'
+            change_text = f'{change:+.1%}' if change is not None else 'new'
+            flag = '  ❌' if name in regressions else ''
+            print(f"{name:<42}{before_text:>12}{after:>12.1f}{change_text:>10}{flag}")
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) slower than the {args.threshold:.0%} threshold")
+            sys.exit(1)
+        print(f"\n✅ No regressions over {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
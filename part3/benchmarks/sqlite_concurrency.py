@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Mixed read/write throughput of a file-backed SQLite database
+
+Runs the same workload against an engine with SQLite's defaults and one
+built from Config.SQLITE_PRAGMAS / SQLALCHEMY_ENGINE_OPTIONS:
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 2 --seconds 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from api.config import ProductionConfig
+from persistence.database import set_sqlite_pragmas
+
+ROWS = 5000
+
+
+def build_engine(path, tuned):
+    """Create an engine with default settings or the production tuning"""
+    if not tuned:
+        return create_engine(f'sqlite:///{path}')
+    engine = create_engine(f'sqlite:///{path}', **ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS)
+    set_sqlite_pragmas(engine, ProductionConfig.SQLITE_PRAGMAS)
+    return engine
+
+
+def prepare(engine):
+    """Create and fill a small places-like table"""
+    with engine.begin() as conn:
+        conn.execute(text(
+            'CREATE TABLE places (id VARCHAR(36) PRIMARY KEY, title TEXT, '
+            'price FLOAT, review_count INTEGER DEFAULT 0)'
+        ))
+        conn.execute(
+            text('INSERT INTO places (id, title, price) VALUES (:id, :title, :price)'),
+            [{'id': str(uuid.uuid4()), 'title': f'Place {i}', 'price': float(i % 300)}
+             for i in range(ROWS)]
+        )
+        return [row[0] for row in conn.execute(text('SELECT id FROM places'))]
+
+
+def run(tuned, readers, writers, seconds):
+    """Return (reads, writes, lock errors, other errors) for one configuration"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(os.path.join(tmp, 'bench.db'), tuned)
+        ids = prepare(engine)
+        counts = {'reads': 0, 'writes': 0, 'locked': 0, 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.monotonic() + seconds
+
+        def count(key):
+            with lock:
+                counts[key] += 1
+
+        def reader():
+            rng = random.Random()
+            while time.monotonic() < deadline:
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(text('SELECT * FROM places WHERE id = :id'),
+                                     {'id': rng.choice(ids)}).one()
+                        conn.execute(text('SELECT count(*), avg(price) FROM places '
+                                          'WHERE price BETWEEN :low AND :high'),
+                                     {'low': 50, 'high': 150}).one()
+                    count('reads')
+                except OperationalError as e:
+                    count('locked' if 'locked' in str(e) else 'errors')
+
+        def writer():
+            rng = random.Random()
+            while time.monotonic() < deadline:
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(text('UPDATE places SET review_count = review_count + 1 '
+                                          'WHERE id = :id'), {'id': rng.choice(ids)})
+                        conn.execute(text('INSERT INTO places (id, title, price) '
+                                          'VALUES (:id, :title, :price)'),
+                                     {'id': str(uuid.uuid4()), 'title': 'New', 'price': 10.0})
+                    count('writes')
+                except OperationalError as e:
+                    count('locked' if 'locked' in str(e) else 'errors')
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s per run")
+    print(f"{'engine':<10}{'reads/s':>12}{'writes/s':>12}{'locked':>10}{'errors':>10}")
+    for name, tuned in (('default', False), ('tuned', True)):
+        counts = run(tuned, args.readers, args.writers, args.seconds)
+        print(f"{name:<10}{counts['reads'] / args.seconds:>12.0f}"
+              f"{counts['writes'] / args.seconds:>12.0f}"
+              f"{counts['locked']:>10}{counts['errors']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Cold-start cost of a worker: importing the app and building it
+
+Each run is a fresh interpreter, like a newly forked worker without
+preloading. Exits non-zero when the median create_app() time is over
+the budget:
+
+    python -m benchmarks.startup --runs 5 --budget-ms 50
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import json, time
+start = time.perf_counter()
+from api.app import create_app
+imported = time.perf_counter()
+create_app({config!r})
+built = time.perf_counter()
+print(json.dumps({{'import_ms': (imported - start) * 1000, 'create_app_ms': (built - imported) * 1000}}))
+'''
+
+
+def measure(config_name):
+    """Time one import + create_app in a new interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(config=config_name)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--config', default='production')
+    parser.add_argument('--budget-ms', type=float, default=50)
+    args = parser.parse_args()
+
+    samples = [measure(args.config) for _ in range(args.runs)]
+    import_ms = statistics.median(sample['import_ms'] for sample in samples)
+    create_ms = statistics.median(sample['create_app_ms'] for sample in samples)
+    print(f"{args.runs} runs, '{args.config}' config (medians)")
+    print(f"  import api.app  {import_ms:8.1f} ms")
+    print(f"  create_app()    {create_ms:8.1f} ms  (budget {args.budget_ms:g} ms)")
+    if create_ms > args.budget_ms:
+        print("❌ create_app() is over budget")
+        sys.exit(1)
+    print("✅ create_app() is within budget")
+
+
+if __name__ == '__main__':
+    main()
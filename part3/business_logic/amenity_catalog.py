@@ -0,0 +1,90 @@
+import threading
+from repositories.amenity_repository import AmenityRepository
+
+
+class AmenityCatalog:
+    """Process-wide read-through cache of the amenity catalog by ID and by name
+
+    The whole catalog loads on the first lookup and stays in memory until
+    AmenityService invalidates it after a write. Lookups read an immutable
+    snapshot without taking the lock; a generation counter stops a load
+    that started before an invalidation from publishing stale maps.
+    """
+
+    def __init__(self, loader=None):
+        self.configure(loader)
+
+    def configure(self, loader=None):
+        """Drop the cached catalog; it loads again on the next lookup"""
+        self._loader = loader or (lambda: AmenityRepository().get_all())
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._generation = 0
+        self.hits = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def get(self, amenity_id):
+        """Return the amenity with this ID, or None"""
+        by_id, _ = self._maps()
+        return by_id.get(amenity_id)
+
+    def get_by_name(self, name):
+        """Return the amenity with this exact name, or None"""
+        _, by_name = self._maps()
+        return by_name.get(name)
+
+    def get_many(self, amenity_ids):
+        """Return the known amenities among amenity_ids, in request order"""
+        by_id, _ = self._maps()
+        amenities = []
+        for amenity_id in amenity_ids:
+            amenity = by_id.get(amenity_id)
+            if amenity is not None:
+                amenities.append(amenity)
+        return amenities
+
+    def get_all(self):
+        """Return every amenity"""
+        by_id, _ = self._maps()
+        return list(by_id.values())
+
+    def invalidate(self):
+        """Forget the catalog after an amenity write"""
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+            self.invalidations += 1
+
+    def stats(self):
+        """Return size and load counters"""
+        snapshot = self._snapshot
+        return {
+            'loaded': snapshot is not None,
+            'amenities': len(snapshot[0]) if snapshot else 0,
+            'hits': self.hits,
+            'loads': self.loads,
+            'invalidations': self.invalidations
+        }
+
+    def _maps(self):
+        """Current (by_id, by_name) snapshot, loading it on a miss"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+        generation = self._generation
+        amenities = self._loader()
+        snapshot = (
+            {amenity.id: amenity for amenity in amenities},
+            {amenity.name: amenity for amenity in amenities}
+        )
+        with self._lock:
+            if generation == self._generation:
+                self._snapshot = snapshot
+            self.loads += 1
+        return snapshot
+
+
+# Global amenity catalog instance
+amenity_catalog = AmenityCatalog()
@@ -11,6 +11,14 @@ class AmenityFacade:
         """Create a new amenity"""
         return self.amenity_service.create_amenity(amenity_data)
     
+    def create_amenities(self, amenities_data):
+        """Create several amenities"""
+        return self.amenity_service.create_amenities(amenities_data)
+    
+    def parse_fieldset(self, fields=None, include=None):
+        """Validate requested amenity fields"""
+        return self.amenity_service.parse_fieldset(fields, include)
+    
     def get_amenity(self, amenity_id):
         """Get an amenity by ID"""
         return self.amenity_service.get_amenity_by_id(amenity_id)
@@ -22,6 +30,10 @@ class AmenityFacade:
     def update_amenity(self, amenity_id, amenity_data):
         """Update an amenity"""
         return self.amenity_service.update_amenity(amenity_id, amenity_data)
+    
+    def get_amenities_validators(self):
+        """Get HTTP cache validators for amenity listings"""
+        return self.amenity_service.get_amenities_validators()
 
 
 # Global facade instance
@@ -0,0 +1,225 @@
+import bisect
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from repositories.place_repository import PlaceRepository
+
+# Places updated this long before the last sync are read again, so rows
+# committed late by another process are not missed
+SYNC_OVERLAP = timedelta(seconds=30)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class AmenityBitmapIndex:
+    """In-memory amenity bitmask per place, for "has all of these amenities" filters
+
+    Each amenity gets a bit; places are kept in (created_at, id) order with
+    their masks in a parallel array, so a filtered page is a bitwise test
+    over the array from the cursor onwards and never reads place_amenities.
+    The index loads on first use. PlaceService updates it after its own
+    writes, and every sync_interval seconds it reloads places other
+    processes changed since the last sync. Loads and syncs query and build
+    without the lock and only take it to publish the result, so lookups
+    never wait on SQL.
+    """
+
+    def __init__(self, enabled=True, sync_interval=5):
+        self.configure(enabled, sync_interval)
+
+    def configure(self, enabled=True, sync_interval=5):
+        """Reset the index; it loads from the database on the next query"""
+        self.enabled = enabled
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._bits_lock = threading.Lock()
+        self._bits = {}
+        self._created = array('q')
+        self._ids = []
+        self._masks = []
+        self._loaded = False
+        self._synced_until = None
+        self._next_sync = 0.0
+        self.loads = 0
+        self.syncs = 0
+
+    def mask(self, amenity_ids):
+        """Bitmask requiring every amenity in amenity_ids, or None if one is unknown"""
+        self._refresh()
+        mask = 0
+        for amenity_id in set(amenity_ids):
+            bit = self._bits.get(amenity_id)
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+
+    def matching(self, mask, after=None, count=100, scan=None):
+        """Up to count (created_at, id) keys of places having every bit in mask
+
+        Keys come in (created_at, id) order, starting after the given
+        keyset position. At most scan places are examined, which bounds
+        the time the lock is held. Returns (keys, resume): the position to
+        continue after, or None once the end of the index was reached.
+        """
+        self._refresh()
+        with self._lock:
+            start = 0 if after is None else self._position(_micros(after[0]), after[1], after=True)
+            masks = self._masks
+            ids = self._ids
+            created = self._created
+            end = len(masks) if scan is None else min(len(masks), start + scan)
+            keys = []
+            for index in range(start, end):
+                if masks[index] & mask == mask:
+                    keys.append((_datetime(created[index]), ids[index]))
+                    if len(keys) == count:
+                        return keys, keys[-1]
+            if end == len(masks):
+                return keys, None
+            return keys, (_datetime(created[end - 1]), ids[end - 1])
+
+    def set_amenities(self, place_id, created_at, amenity_ids):
+        """Record a place's current amenities after a local write"""
+        if not self.enabled or not self._loaded:
+            return
+        created, mask = _micros(created_at), self._mask_for(amenity_ids)
+        with self._lock:
+            self._set(place_id, created, mask)
+
+    def sync(self):
+        """Reload places changed by other processes since the last sync"""
+        repository = PlaceRepository()
+        with self._lock:
+            # Set first so concurrent callers do not start their own sync
+            self._next_sync = time.monotonic() + self.sync_interval
+            since = self._synced_until - SYNC_OVERLAP if self._synced_until else None
+        rows = repository.get_index_rows(since)
+        masks = self._masks_by_place(
+            repository.get_amenity_links([place_id for place_id, _, _ in rows])
+        )
+        changes = [
+            (place_id, _micros(created_at), masks.get(place_id, 0))
+            for place_id, created_at, _ in rows
+        ]
+        with self._lock:
+            for place_id, created, mask in changes:
+                self._set(place_id, created, mask)
+            for _, _, updated_at in rows:
+                self._advance(updated_at)
+            self.syncs += 1
+
+    def load(self):
+        """Build the whole index from the places and place_amenities tables"""
+        repository = PlaceRepository()
+        self._next_sync = time.monotonic() + self.sync_interval
+        masks = self._masks_by_place(repository.get_amenity_links())
+        created = array('q')
+        ids = []
+        place_masks = []
+        synced_until = None
+        for place_id, created_at, updated_at in repository.get_index_rows():
+            created.append(_micros(created_at))
+            ids.append(place_id)
+            place_masks.append(masks.get(place_id, 0))
+            if updated_at is not None and (synced_until is None or updated_at > synced_until):
+                synced_until = updated_at
+        # Local writes made while this ran are read again by the next sync
+        with self._lock:
+            self._created = created
+            self._ids = ids
+            self._masks = place_masks
+            self._advance(synced_until)
+            self._loaded = True
+            self.loads += 1
+
+    def stats(self):
+        """Return size and refresh counters"""
+        return {
+            'enabled': self.enabled,
+            'loaded': self._loaded,
+            'places': len(self._ids),
+            'amenities': len(self._bits),
+            'loads': self.loads,
+            'syncs': self.syncs,
+            'sync_interval': self.sync_interval
+        }
+
+    def _refresh(self):
+        """Load on first use, then sync every sync_interval seconds"""
+        if not self._loaded:
+            # Callers arriving during the first load wait for it, not redo it
+            with self._load_lock:
+                if not self._loaded:
+                    self.load()
+        elif time.monotonic() >= self._next_sync:
+            self.sync()
+
+    def _bit(self, amenity_id):
+        """The amenity's bit, assigning the next free one
+
+        Bits are only ever added, so lookups read the dict without a lock.
+        """
+        bit = self._bits.get(amenity_id)
+        if bit is None:
+            with self._bits_lock:
+                bit = self._bits.get(amenity_id)
+                if bit is None:
+                    bit = self._bits[amenity_id] = 1 << len(self._bits)
+        return bit
+
+    def _mask_for(self, amenity_ids):
+        mask = 0
+        for amenity_id in amenity_ids:
+            mask |= self._bit(amenity_id)
+        return mask
+
+    def _masks_by_place(self, links):
+        """{place_id: mask} from (place_id, amenity_id) rows"""
+        masks = {}
+        for place_id, amenity_id in links:
+            masks[place_id] = masks.get(place_id, 0) | self._bit(amenity_id)
+        return masks
+
+    def _position(self, created, place_id, after=False):
+        """Index of the (created, place_id) key, or of the first key past it"""
+        index = bisect.bisect_left(self._created, created)
+        ids = self._ids
+        end = len(ids)
+        while index < end and self._created[index] == created and ids[index] < place_id:
+            index += 1
+        if after and index < end and self._created[index] == created and ids[index] == place_id:
+            index += 1
+        return index
+
+    def _set(self, place_id, created, mask):
+        """Insert or replace one place's mask (lock must be held)"""
+        index = self._position(created, place_id)
+        if index < len(self._ids) and self._ids[index] == place_id and self._created[index] == created:
+            self._masks[index] = mask
+        else:
+            self._created.insert(index, created)
+            self._ids.insert(index, place_id)
+            self._masks.insert(index, mask)
+
+    def _advance(self, updated_at):
+        """Move the sync watermark forward (lock must be held)"""
+        if updated_at is not None and (self._synced_until is None or updated_at > self._synced_until):
+            self._synced_until = updated_at
+
+
+def _micros(value):
+    """Naive UTC datetime as integer microseconds, exact for ordering"""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _datetime(micros):
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+# Global amenity index instance
+amenity_index = AmenityBitmapIndex()
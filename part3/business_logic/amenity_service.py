@@ -1,5 +1,9 @@
 from business_logic.models.amenity import Amenity
 from repositories.amenity_repository import AmenityRepository
+from business_logic.amenity_catalog import amenity_catalog
+from business_logic.collection_version_service import CollectionVersionService
+from business_logic.response_cache import response_cache
+from business_logic.batch import check_batch, check_item
 
 class AmenityService:
     """Service class for amenity-related business logic"""
@@ -10,40 +14,87 @@ class AmenityService:
         repository = AmenityRepository()
         
         # Check if amenity with same name already exists
-        existing_amenity = repository.get_by_name(amenity_data.get('name', ''))
+        existing_amenity = amenity_catalog.get_by_name(amenity_data.get('name', ''))
         if existing_amenity:
             raise ValueError("Amenity with this name already exists")
         
         # Create new amenity
         amenity = Amenity(name=amenity_data.get('name'))
-        return repository.add(amenity)
+        amenity = repository.add(amenity)
+        amenity_catalog.invalidate()
+        CollectionVersionService.bump('amenities', commit=True)
+        response_cache.invalidate('amenities')
+        return amenity
+    
+    @staticmethod
+    def create_amenities(amenities_data):
+        """Create several amenities, reporting a result per item
+        
+        Names must be unique across existing amenities and the batch itself.
+        """
+        check_batch(amenities_data)
+        repository = AmenityRepository()
+        
+        amenities = []
+        results = []
+        names = set()
+        for index, amenity_data in enumerate(amenities_data):
+            try:
+                check_item(amenity_data)
+                amenity = Amenity(name=amenity_data.get('name'))
+                if amenity.name in names or amenity_catalog.get_by_name(amenity.name):
+                    raise ValueError("Amenity with this name already exists")
+            except (ValueError, TypeError) as e:
+                results.append({'index': index, 'status': 'error', 'error': str(e)})
+                continue
+            names.add(amenity.name)
+            amenities.append(repository.add(amenity))
+            results.append({'index': index, 'status': 'created', 'id': amenity.id})
+        
+        if amenities:
+            amenity_catalog.invalidate()
+            CollectionVersionService.bump('amenities', commit=True)
+            response_cache.invalidate('amenities')
+        return amenities, results
+    
+    @staticmethod
+    def parse_fieldset(fields=None, include=None):
+        """Validate requested amenity fields"""
+        return Amenity.parse_fieldset(fields, include)
     
     @staticmethod
     def get_amenity_by_id(amenity_id):
         """Get an amenity by ID"""
-        repository = AmenityRepository()
-        return repository.get(amenity_id)
+        return amenity_catalog.get(amenity_id)
     
     @staticmethod
     def get_all_amenities():
         """Get all amenities"""
-        repository = AmenityRepository()
-        return repository.get_all()
+        return amenity_catalog.get_all()
     
     @staticmethod
     def update_amenity(amenity_id, amenity_data):
         """Update an amenity"""
         repository = AmenityRepository()
-        amenity = repository.get(amenity_id)
+        amenity = amenity_catalog.get(amenity_id)
         if not amenity:
             return None
         
         # Check if name is being changed and if new name already exists
         if 'name' in amenity_data and amenity_data['name'].strip() != amenity.name:
-            existing_amenity = repository.get_by_name(amenity_data['name'])
+            existing_amenity = amenity_catalog.get_by_name(amenity_data['name'])
             if existing_amenity:
                 raise ValueError("Amenity with this name already exists")
         
         # Update amenity
         amenity.update(**amenity_data)
-        return repository.update(amenity)
+        amenity = repository.update(amenity)
+        amenity_catalog.invalidate()
+        CollectionVersionService.bump('amenities', commit=True)
+        response_cache.invalidate('amenities')
+        return amenity
+    
+    @staticmethod
+    def get_amenities_validators():
+        """Get (version parts, last modified) for amenity listings"""
+        return CollectionVersionService.get_validators('amenities')
@@ -0,0 +1,25 @@
+MAX_BATCH_SIZE = 1000
+
+
+def check_batch(items):
+    """Validate the shape of a batch request body"""
+    if not isinstance(items, list):
+        raise ValueError("Batch body must be a JSON array")
+    if not items:
+        raise ValueError("Batch must contain at least one item")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"Batch cannot contain more than {MAX_BATCH_SIZE} items")
+
+
+def check_item(item):
+    """Validate that one batch item is a JSON object"""
+    if not isinstance(item, dict):
+        raise ValueError("Item must be a JSON object")
+
+
+def batch_status(results):
+    """HTTP status for per-item results: 201 all created, 207 mixed, 400 none"""
+    created = sum(1 for result in results if result['status'] == 'created')
+    if created == len(results):
+        return 201
+    return 207 if created else 400
@@ -0,0 +1,22 @@
+from repositories.collection_version_repository import CollectionVersionRepository
+
+class CollectionVersionService:
+    """Service class for collection change tracking used by HTTP validators"""
+    
+    @staticmethod
+    def bump(*names, commit=False):
+        """Record a write to the named collections"""
+        repository = CollectionVersionRepository()
+        repository.bump(names, commit=commit)
+    
+    @staticmethod
+    def get_validators(*names):
+        """Get (version parts, last modified) describing the named collections
+        
+        Collections that were never written report version 0.
+        """
+        repository = CollectionVersionRepository()
+        versions = repository.get_versions(names)
+        parts = tuple((name, versions.get(name, (0, None))[0]) for name in names)
+        stamps = [updated_at for _, updated_at in versions.values() if updated_at]
+        return parts, max(stamps) if stamps else None
@@ -0,0 +1,95 @@
+import math
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+PRECISION = 12
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+# Upper bound on prefix ranges scanned for one radius query
+MAX_COVER_CELLS = 16
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    """Encode a coordinate as a geohash string"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """Return the (height, width) in degrees of a geohash cell"""
+    lat_bits = (5 * precision) // 2
+    lon_bits = 5 * precision - lat_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometres between two coordinates"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (math.sin(d_phi / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """Return (min_lat, max_lat, min_lon, max_lon) enclosing a circle
+
+    Longitudes may fall outside [-180, 180] when the circle crosses the
+    antimeridian; callers wrap them when sampling cells.
+    """
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    min_lat = max(-90.0, latitude - d_lat)
+    max_lat = min(90.0, latitude + d_lat)
+    # Longitude degrees shrink towards the poles; near them cover every longitude
+    widest = max(abs(min_lat), abs(max_lat))
+    cos_lat = math.cos(math.radians(widest))
+    if widest >= 90.0 or radius_km / (KM_PER_DEGREE_LAT * cos_lat) >= 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    d_lon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    return min_lat, max_lat, longitude - d_lon, longitude + d_lon
+
+
+def covering_cells(latitude, longitude, radius_km, max_cells=MAX_COVER_CELLS):
+    """Return geohash prefixes whose cells together cover a circle
+
+    Picks the longest prefix for which the covering set stays within
+    max_cells, so each prefix becomes one cheap range scan on the index.
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    for precision in range(PRECISION, 0, -1):
+        height, width = cell_size(precision)
+        rows = int((max_lat - min_lat) / height) + 2
+        cols = int((max_lon - min_lon) / width) + 2
+        if rows * cols > max_cells * 4:
+            continue
+        cells = set()
+        for row in range(rows):
+            lat = min(max_lat, min_lat + row * height)
+            for col in range(cols):
+                lon = min(max_lon, min_lon + col * width)
+                wrapped = (lon + 180.0) % 360.0 - 180.0
+                cells.add(encode(lat, wrapped, precision))
+        if len(cells) <= max_cells:
+            return sorted(cells)
+    return sorted(BASE32)
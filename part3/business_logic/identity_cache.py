@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import namedtuple
+from business_logic.response_cache import InMemoryCacheBackend
+from repositories.collection_version_repository import CollectionVersionRepository
+
+
+class UserIdentity(namedtuple('UserIdentity', 'id email first_name last_name is_admin')):
+    """The user columns JWT handling needs, detached from any session"""
+    __slots__ = ()
+
+    def claims(self):
+        """Return the additional claims stored in issued tokens"""
+        return {
+            'is_admin': self.is_admin,
+            'email': self.email,
+            'first_name': self.first_name,
+            'last_name': self.last_name
+        }
+
+
+class IdentityCache:
+    """TTL-bounded cache of user identities keyed by user ID
+
+    Entries are invalidated by UserService.update_user after it commits; a
+    generation counter stops a lookup that read the row before an update
+    from caching it after that update's invalidation. Writes in other
+    processes are caught by checking the users collection version every
+    sync_interval seconds and dropping every entry when it moved.
+    """
+
+    def __init__(self, backend=None, sync_interval=5):
+        self.backend = backend or InMemoryCacheBackend(max_entries=10000, ttl=300)
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.sync_interval = sync_interval
+        self._version = None
+        self._next_sync = 0.0
+        self.syncs = 0
+
+    def configure(self, backend=None, sync_interval=5):
+        """Swap the backend and start from an empty cache"""
+        if backend is not None:
+            self.backend = backend
+        self.sync_interval = sync_interval
+        self._version = None
+        self._next_sync = 0.0
+        self.syncs = 0
+        self.backend.clear()
+
+    def get(self, user_id, loader):
+        """Return the identity for user_id, calling loader(user_id) on a miss"""
+        if time.monotonic() >= self._next_sync:
+            self.sync()
+        identity = self.backend.get(user_id)
+        if identity is not None:
+            return identity
+        generation = self._generation
+        row = loader(user_id)
+        if row is None:
+            return None
+        identity = UserIdentity(*row)
+        with self._lock:
+            if generation == self._generation:
+                self.backend.set(user_id, identity, (user_id,))
+        return identity
+
+    def invalidate(self, user_id):
+        """Drop the cached identity of one user"""
+        with self._lock:
+            self._generation += 1
+            self.backend.invalidate((user_id,))
+
+    def sync(self):
+        """Drop every entry if a user was written anywhere since the last sync"""
+        with self._lock:
+            # Set first so concurrent callers do not start their own sync
+            self._next_sync = time.monotonic() + self.sync_interval
+        versions = CollectionVersionRepository().get_versions(('users',))
+        version = versions.get('users', (0, None))[0]
+        with self._lock:
+            if version != self._version:
+                self._generation += 1
+                self.backend.clear()
+                self._version = version
+            self.syncs += 1
+
+    def stats(self):
+        """Return the backend's counters"""
+        return {**self.backend.stats(), 'syncs': self.syncs, 'sync_interval': self.sync_interval}
+
+
+class CurrentUser:
+    """Stand-in for the authenticated user that defers loading the row
+
+    Identity fields come from the cache; the first access to anything else
+    loads the User model through the given loader.
+    """
+
+    def __init__(self, identity, loader):
+        self._identity = identity
+        self._loader = loader
+        self._user = None
+
+    def __getattr__(self, name):
+        if name in UserIdentity._fields:
+            return getattr(self._identity, name)
+        if self._user is None:
+            self._user = self._loader(self._identity.id)
+        return getattr(self._user, name)
+
+
+# Global identity cache instance
+identity_cache = IdentityCache()
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, inspect
 from persistence.database import db
 
 class BaseModel(db.Model):
@@ -9,6 +9,13 @@ class BaseModel(db.Model):
     
     __abstract__ = True
     
+    # Column attributes left out of to_dict()
+    __serialize_exclude__ = ()
+    # Relationships to_dict() can embed, selectable through ?include=
+    __serialize_relationships__ = ()
+    # Derived to_dict() keys and the columns they are computed from
+    __serialize_computed__ = {}
+    
     id: Mapped[str] = mapped_column(
         String(60), 
         primary_key=True, 
@@ -31,12 +38,64 @@ class BaseModel(db.Model):
                 setattr(self, key, value)
         self.updated_at = datetime.utcnow()
     
-    def to_dict(self):
-        """Convert model to dictionary representation"""
+    @classmethod
+    def serialized_columns(cls):
+        """Column attribute names written by to_dict(), computed once per class"""
+        columns = cls.__dict__.get('_serialized_columns')
+        if columns is None:
+            columns = tuple(
+                attr.key for attr in inspect(cls).column_attrs
+                if attr.key not in cls.__serialize_exclude__
+            )
+            cls._serialized_columns = columns
+        return columns
+    
+    @classmethod
+    def parse_fieldset(cls, fields=None, include=None):
+        """Validate requested field and relationship names
+        
+        Returns an (attributes, relationships) pair of frozensets, where
+        None keeps the default. The id is always part of the attributes.
+        """
+        attributes = relationships = None
+        if fields is not None:
+            unknown = set(fields) - set(cls.serialized_columns()) - set(cls.__serialize_computed__)
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+            attributes = frozenset(fields) | {'id'}
+        if include is not None:
+            unknown = set(include) - set(cls.__serialize_relationships__)
+            if unknown:
+                raise ValueError(f"Unknown relationships: {', '.join(sorted(unknown))}")
+            relationships = frozenset(include)
+        return attributes, relationships
+    
+    @classmethod
+    def columns_to_load(cls, attributes, relationships=()):
+        """Column names a query must load to serialize the given fieldset
+        
+        Besides the requested columns this covers the inputs of computed
+        fields, the keys the relationships join on and created_at, which
+        pagination cursors are built from.
+        """
+        columns = {'id', 'created_at'} | (set(attributes) & set(cls.serialized_columns()))
+        for name in set(attributes) & set(cls.__serialize_computed__):
+            columns.update(cls.__serialize_computed__[name])
+        mapper = inspect(cls)
+        for name in relationships:
+            columns.update(column.key for column in mapper.relationships[name].local_columns)
+        return columns
+    
+    def to_dict(self, fields=None):
+        """Convert model to dictionary representation
+        
+        fields limits the output to those attribute names when given.
+        """
         result = {}
-        for key, value in self.__dict__.items():
-            if key.startswith('_'):
+        for key in self.serialized_columns():
+            if fields is not None and key not in fields:
                 continue
+            value = getattr(self, key)
             if isinstance(value, datetime):
                 result[key] = value.isoformat()
             else:
@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, DateTime
+from persistence.database import db
+
+class CollectionVersion(db.Model):
+    """Change counter for a collection, bumped on every write to it"""
+    
+    __tablename__ = 'collection_versions'
+    
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    
+    def __repr__(self):
+        return f"<CollectionVersion {self.name} v{self.version}>"
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Float, ForeignKey, Table, Column
+from sqlalchemy import String, Text, Float, Integer, ForeignKey, Table, Column, Index
 from business_logic.models.base_model import BaseModel
+from business_logic import geohash
 
 # Association table for many-to-many relationship between places and amenities
 # Fixed for SQLAlchemy 2.0 - use Column instead of mapped_column for association tables
@@ -8,21 +9,57 @@ place_amenities = Table(
     'place_amenities',
     BaseModel.metadata,
     Column('place_id', String(60), ForeignKey('places.id'), primary_key=True),
-    Column('amenity_id', String(60), ForeignKey('amenities.id'), primary_key=True)
+    Column('amenity_id', String(60), ForeignKey('amenities.id'), primary_key=True),
+    # Amenity filters look up places by amenity, which the primary key can't serve
+    Index('idx_place_amenities_amenity_id', 'amenity_id', 'place_id')
 )
 
+# Valid review ratings, one histogram bucket each
+RATINGS = range(1, 6)
+
+# Columns rating_summary() reads
+RATING_COLUMNS = ('review_count', 'rating_sum') + tuple(f'rating_count_{rating}' for rating in RATINGS)
+
 class Place(BaseModel):
     """Place model class with SQLAlchemy mapping"""
     
     __tablename__ = 'places'
+    # Raw histogram columns; to_dict() shows them as rating_histogram
+    __serialize_exclude__ = tuple(f'rating_count_{rating}' for rating in RATINGS)
+    __serialize_relationships__ = ('owner', 'amenities', 'reviews')
+    __serialize_computed__ = {
+        'average_rating': RATING_COLUMNS,
+        'rating_histogram': RATING_COLUMNS,
+    }
+    __table_args__ = (
+        # Keyset pagination walks places in (created_at, id) order
+        Index('idx_places_created_at_id', 'created_at', 'id'),
+        # Range filters used by place search
+        Index('idx_places_price', 'price'),
+        Index('idx_places_latitude_longitude', 'latitude', 'longitude'),
+        # Radius search scans geohash prefixes and reads coordinates from the index
+        Index('idx_places_geohash', 'geohash', 'latitude', 'longitude'),
+        # The amenity index picks up places changed by other processes
+        Index('idx_places_updated_at', 'updated_at'),
+    )
     
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     price: Mapped[float] = mapped_column(Float, nullable=False)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    geohash: Mapped[str] = mapped_column(String(12), nullable=True)
     owner_id: Mapped[str] = mapped_column(String(60), ForeignKey('users.id'), nullable=False)
     
+    # Rating aggregates, maintained by ReviewService so listings never scan reviews
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_count_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_count_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_count_3: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_count_4: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    rating_count_5: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    
     # Relationships
     owner = relationship("User", back_populates="places")
     amenities = relationship("Amenity", secondary=place_amenities, back_populates="places")
@@ -35,6 +72,11 @@ class Place(BaseModel):
         self.price = self._validate_price(price)
         self.latitude = self._validate_latitude(latitude)
         self.longitude = self._validate_longitude(longitude)
+        self.geohash = geohash.encode(self.latitude, self.longitude)
+        self.review_count = 0
+        self.rating_sum = 0
+        for rating in RATINGS:
+            setattr(self, f'rating_count_{rating}', 0)
         self.owner = owner
         self.owner_id = owner.id
     
@@ -100,20 +142,67 @@ class Place(BaseModel):
         if review in self.reviews:
             self.reviews.remove(review)
     
-    def to_dict(self):
-        """Convert place to dictionary"""
-        place_dict = super().to_dict()
-        place_dict['owner'] = {
-            'id': self.owner.id,
-            'first_name': self.owner.first_name,
-            'last_name': self.owner.last_name,
-            'email': self.owner.email
-        } if self.owner else None
-        place_dict['amenities'] = [
-            {'id': amenity.id, 'name': amenity.name} 
-            for amenity in self.amenities
-        ] if self.amenities else []
-        place_dict['reviews'] = [review.id for review in self.reviews] if self.reviews else []
+    def adjust_ratings(self, deltas):
+        """Apply {rating: delta} changes to the stored rating aggregates
+        
+        The changes are written as in-database increments, so concurrent
+        reviews of the same place cannot overwrite each other's counts.
+        """
+        deltas = {rating: delta for rating, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        self.review_count = Place.review_count + sum(deltas.values())
+        self.rating_sum = Place.rating_sum + sum(rating * delta for rating, delta in deltas.items())
+        for rating, delta in deltas.items():
+            column = f'rating_count_{rating}'
+            setattr(self, column, getattr(Place, column) + delta)
+    
+    def rating_summary(self):
+        """Return the review count, average rating and rating histogram"""
+        return {
+            'review_count': self.review_count,
+            'average_rating': round(self.rating_sum / self.review_count, 2) if self.review_count else None,
+            'rating_histogram': {
+                str(rating): getattr(self, f'rating_count_{rating}') for rating in RATINGS
+            }
+        }
+    
+    @classmethod
+    def default_relationships(cls, include_reviews=True):
+        """Relationships to_dict() embeds when ?include= is not given"""
+        if include_reviews:
+            return cls.__serialize_relationships__
+        return ('owner', 'amenities')
+    
+    def to_dict(self, include_reviews=True, fields=None, include=None):
+        """Convert place to dictionary
+        
+        Listings pass include_reviews=False to skip the per-place review IDs
+        and rely on the stored rating aggregates instead. fields and include
+        restrict the attributes and relationships, as parse_fieldset() returns.
+        """
+        if include is None:
+            include = self.default_relationships(include_reviews)
+        place_dict = super().to_dict(fields)
+        if fields is None or not fields.isdisjoint(self.__serialize_computed__):
+            place_dict.update(
+                (key, value) for key, value in self.rating_summary().items()
+                if fields is None or key in fields
+            )
+        if 'owner' in include:
+            place_dict['owner'] = {
+                'id': self.owner.id,
+                'first_name': self.owner.first_name,
+                'last_name': self.owner.last_name,
+                'email': self.owner.email
+            } if self.owner else None
+        if 'amenities' in include:
+            place_dict['amenities'] = [
+                {'id': amenity.id, 'name': amenity.name} 
+                for amenity in self.amenities
+            ] if self.amenities else []
+        if 'reviews' in include:
+            place_dict['reviews'] = [review.id for review in self.reviews] if self.reviews else []
         return place_dict
     
     def update(self, **kwargs):
@@ -136,5 +225,14 @@ class Place(BaseModel):
         kwargs.pop('owner_id', None)
         kwargs.pop('amenities', None)
         kwargs.pop('reviews', None)
+        kwargs.pop('geohash', None)
+        kwargs.pop('review_count', None)
+        kwargs.pop('rating_sum', None)
+        for rating in RATINGS:
+            kwargs.pop(f'rating_count_{rating}', None)
         
         super().update(**kwargs)
+        
+        # Keep the geohash in step with the coordinates
+        if 'latitude' in kwargs or 'longitude' in kwargs:
+            self.geohash = geohash.encode(self.latitude, self.longitude)
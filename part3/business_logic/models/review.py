@@ -1,11 +1,18 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Integer, ForeignKey
+from sqlalchemy import String, Text, Integer, ForeignKey, Index
 from business_logic.models.base_model import BaseModel
 
 class Review(BaseModel):
     """Review model class with SQLAlchemy mapping"""
     
     __tablename__ = 'reviews'
+    __serialize_relationships__ = ('place', 'user')
+    __table_args__ = (
+        # Streamed listings walk reviews in (created_at, id) order
+        Index('idx_reviews_created_at_id', 'created_at', 'id'),
+        # Per-place review lookups and search reindexing
+        Index('idx_reviews_place_id', 'place_id'),
+    )
     
     text: Mapped[str] = mapped_column(Text, nullable=False)
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -41,18 +48,22 @@ class Review(BaseModel):
             raise ValueError("Rating must be between 1 and 5")
         return rating
     
-    def to_dict(self):
+    def to_dict(self, fields=None, include=None):
         """Convert review to dictionary"""
-        review_dict = super().to_dict()
-        review_dict['place'] = {
-            'id': self.place.id,
-            'title': self.place.title
-        } if self.place else None
-        review_dict['user'] = {
-            'id': self.user.id,
-            'first_name': self.user.first_name,
-            'last_name': self.user.last_name
-        } if self.user else None
+        if include is None:
+            include = self.__serialize_relationships__
+        review_dict = super().to_dict(fields)
+        if 'place' in include:
+            review_dict['place'] = {
+                'id': self.place.id,
+                'title': self.place.title
+            } if self.place else None
+        if 'user' in include:
+            review_dict['user'] = {
+                'id': self.user.id,
+                'first_name': self.user.first_name,
+                'last_name': self.user.last_name
+            } if self.user else None
         return review_dict
     
     def update(self, **kwargs):
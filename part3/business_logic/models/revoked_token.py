@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, Index
+from persistence.database import db
+
+class RevokedToken(db.Model):
+    """JWT revoked before its expiry, kept until the token would expire anyway"""
+    
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        # Stores catch up on revocations made by other processes
+        Index('idx_revoked_tokens_revoked_at', 'revoked_at'),
+        Index('idx_revoked_tokens_expires_at', 'expires_at'),
+    )
+    
+    jti: Mapped[str] = mapped_column(String(36), primary_key=True)
+    token_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    user_id: Mapped[str] = mapped_column(String(60), nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<RevokedToken {self.jti} ({self.token_type})>"
@@ -1,12 +1,18 @@
 import re
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, Index
 from business_logic.models.base_model import BaseModel
 
 class User(BaseModel):
     """User model class with SQLAlchemy mapping"""
     
     __tablename__ = 'users'
+    __serialize_exclude__ = ('password',)
+    __serialize_relationships__ = ('places', 'reviews')
+    __table_args__ = (
+        # Streamed listings walk users in (created_at, id) order
+        Index('idx_users_created_at_id', 'created_at', 'id'),
+    )
     
     first_name: Mapped[str] = mapped_column(String(50), nullable=False)
     last_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -62,12 +68,15 @@ class User(BaseModel):
         """Check if provided password matches the hashed password"""
         return bcrypt.check_password_hash(self.password, password)
     
-    def to_dict(self):
+    def to_dict(self, fields=None, include=None):
         """Convert user to dictionary, excluding password"""
-        user_dict = super().to_dict()
-        user_dict.pop('password', None)
-        user_dict['places'] = [place.id for place in self.places] if self.places else []
-        user_dict['reviews'] = [review.id for review in self.reviews] if self.reviews else []
+        if include is None:
+            include = self.__serialize_relationships__
+        user_dict = super().to_dict(fields)
+        if 'places' in include:
+            user_dict['places'] = [place.id for place in self.places] if self.places else []
+        if 'reviews' in include:
+            user_dict['reviews'] = [review.id for review in self.reviews] if self.reviews else []
         return user_dict
     
     def update(self, **kwargs):
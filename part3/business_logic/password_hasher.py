@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt
+
+# Latency samples kept for the percentile metrics
+LATENCY_WINDOW = 1000
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated or does not answer in time"""
+
+
+def _hash_password(password, rounds):
+    """Hash a password with bcrypt (runs in a pool worker)"""
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check_password(pw_hash, password):
+    """Check a password against a bcrypt hash (runs in a pool worker)"""
+    if isinstance(pw_hash, str):
+        pw_hash = pw_hash.encode('utf-8')
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    return bcrypt.checkpw(password, pw_hash)
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification on a bounded process pool
+    
+    Exposes the same generate_password_hash/check_password_hash methods as
+    Flask-Bcrypt, so it can be handed to UserService in its place. The
+    request thread waits on the result without holding a CPU, and once
+    max_pending operations are queued or running, new ones fail fast with
+    PasswordHasherBusy instead of piling up. workers=0 hashes inline.
+    """
+
+    def __init__(self, rounds=12, workers=0, max_pending=32, timeout=10):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._generation = 0
+        self.configure(rounds, workers, max_pending, timeout)
+
+    def configure(self, rounds=12, workers=0, max_pending=32, timeout=10):
+        """Apply new settings, replacing the pool and resetting the metrics"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self.rounds = rounds
+            self.workers = workers
+            self.max_pending = max_pending
+            self.timeout = timeout
+            # Operations still running from before are not counted back
+            self._generation += 1
+            self._pending = 0
+            self._completed = 0
+            self._rejected = 0
+            self._timeouts = 0
+            self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def generate_password_hash(self, password):
+        """Return the bcrypt hash of password as bytes"""
+        return self._run(_hash_password, password, self.rounds)
+
+    def check_password_hash(self, pw_hash, password):
+        """Return whether password matches pw_hash"""
+        return self._run(_check_password, pw_hash, password)
+
+    def stats(self):
+        """Return queue depth, throughput and latency metrics"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'in_flight': self._pending,
+                'queued': max(0, self._pending - self.workers) if self.workers else 0,
+                'completed': self._completed,
+                'rejected': self._rejected,
+                'timeouts': self._timeouts,
+                'latency_ms': {
+                    'p50': _percentile_ms(latencies, 0.50),
+                    'p95': _percentile_ms(latencies, 0.95),
+                    'max': _percentile_ms(latencies, 1.0),
+                }
+            }
+
+    def _run(self, fn, *args):
+        """Run fn on the pool, or inline without workers, enforcing the bound"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusy("Too many password operations in progress, retry shortly")
+            self._pending += 1
+            generation = self._generation
+            executor = self._get_executor() if self.workers else None
+        started = time.monotonic()
+        if executor is None:
+            try:
+                result = fn(*args)
+            finally:
+                self._release(generation)
+            self._record(started)
+            return result
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            self._release(generation)
+            raise
+        # cancel() cannot stop bcrypt once a worker runs it, so the slot is
+        # only given back when the operation really finishes
+        future.add_done_callback(lambda _: self._release(generation))
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timeouts += 1
+            raise PasswordHasherBusy("Password hashing timed out, retry shortly")
+        self._record(started)
+        return result
+
+    def _release(self, generation):
+        """Give back one pending slot, unless configure() reset the count since"""
+        with self._lock:
+            if generation == self._generation:
+                self._pending -= 1
+
+    def _record(self, started):
+        """Count one successful operation and its latency"""
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._completed += 1
+            self._latencies.append(elapsed)
+
+    def _get_executor(self):
+        """Create the process pool on first use (lock must be held)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+def _percentile_ms(sorted_values, fraction):
+    """Nearest-rank percentile of sorted seconds, in milliseconds"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 2)
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher()
@@ -11,17 +11,52 @@ class PlaceFacade:
         """Create a new place"""
         return self.place_service.create_place(place_data)
     
-    def get_place(self, place_id):
+    def create_places(self, places_data, owner_id):
+        """Create several places in one transaction"""
+        return self.place_service.create_places(places_data, owner_id)
+    
+    def parse_fieldset(self, fields=None, include=None):
+        """Validate requested place fields and relationships"""
+        return self.place_service.parse_fieldset(fields, include)
+    
+    def get_place(self, place_id, eager=False, fieldset=None):
         """Get a place by ID"""
-        return self.place_service.get_place_by_id(place_id)
+        return self.place_service.get_place_by_id(place_id, eager, fieldset)
     
-    def get_all_places(self):
+    def get_all_places(self, eager=False):
         """Get all places"""
-        return self.place_service.get_all_places()
+        return self.place_service.get_all_places(eager)
+    
+    def get_places_page(self, limit=None, cursor=None, eager=False, fieldset=None):
+        """Get one page of places and the cursor for the next one"""
+        return self.place_service.get_places_page(limit, cursor, eager, fieldset)
+    
+    def iter_places(self, chunk_size, fieldset=None):
+        """Yield every place in chunks"""
+        return self.place_service.iter_places(chunk_size, fieldset)
+    
+    def search_places(self, filters, limit=None, cursor=None, eager=False, fieldset=None):
+        """Search places and return one page plus the next cursor"""
+        return self.place_service.search_places(filters, limit, cursor, eager, fieldset)
+    
+    def find_places_nearby(self, latitude, longitude, radius_km, limit=None, eager=False,
+                           fieldset=None):
+        """Get the nearest places within a radius with their distances"""
+        return self.place_service.find_places_nearby(
+            latitude, longitude, radius_km, limit, eager, fieldset
+        )
     
     def update_place(self, place_id, place_data):
         """Update a place"""
         return self.place_service.update_place(place_id, place_data)
+    
+    def get_place_validators(self, place_id):
+        """Get HTTP cache validators for a place"""
+        return self.place_service.get_place_validators(place_id)
+    
+    def get_places_validators(self, with_reviews=False):
+        """Get HTTP cache validators for place listings"""
+        return self.place_service.get_places_validators(with_reviews)
 
 
 # Global facade instance
@@ -1,7 +1,27 @@
 from business_logic.models.place import Place
+from business_logic.collection_version_service import CollectionVersionService
+from business_logic.response_cache import response_cache
+from business_logic.amenity_index import amenity_index
+from business_logic.amenity_catalog import amenity_catalog
 from repositories.place_repository import PlaceRepository
 from repositories.user_repository import UserRepository
-from repositories.amenity_repository import AmenityRepository
+from repositories.search_repository import PlaceSearchRepository, build_match_terms
+from repositories.pagination import clamp_limit, decode_cursor, encode_cursor
+from business_logic.batch import check_batch, check_item
+from persistence.unit_of_work import unit_of_work
+
+# Most amenity index candidates checked against the other filters per query
+MAX_CANDIDATE_CHUNK = 1000
+
+# When the other filters are selective, a page can take many candidate
+# chunks; past this many candidates (or places scanned in the index) the
+# rest of the page comes from the SQL join instead
+MAX_INDEX_CANDIDATES = 2000
+MAX_INDEX_SCAN = 50000
+
+# Largest radius for nearby searches; every place in range is loaded and
+# measured before the nearest are kept
+MAX_RADIUS_KM = 100
 
 class PlaceService:
     """Service class for place-related business logic"""
@@ -11,7 +31,6 @@ class PlaceService:
         """Create a new place"""
         place_repo = PlaceRepository()
         user_repo = UserRepository()
-        amenity_repo = AmenityRepository()
         
         # Get owner
         owner_id = place_data.get('owner_id')
@@ -19,58 +38,294 @@ class PlaceService:
         if not owner:
             raise ValueError("Owner not found")
         
-        # Create new place
-        place = Place(
-            title=place_data.get('title'),
-            description=place_data.get('description', ''),
-            price=place_data.get('price'),
-            latitude=place_data.get('latitude'),
-            longitude=place_data.get('longitude'),
-            owner=owner
-        )
+        with unit_of_work():
+            # Create new place
+            place = Place(
+                title=place_data.get('title'),
+                description=place_data.get('description', ''),
+                price=place_data.get('price'),
+                latitude=place_data.get('latitude'),
+                longitude=place_data.get('longitude'),
+                owner=owner
+            )
+            
+            # Add amenities if provided
+            for amenity in amenity_catalog.get_many(place_data.get('amenities', [])):
+                place.add_amenity(amenity)
+            
+            CollectionVersionService.bump('places')
+            place = place_repo.add(place)
+            PlaceSearchRepository().reindex([place.id])
+            indexed = (place.id, place.created_at, [amenity.id for amenity in place.amenities])
+        amenity_index.set_amenities(*indexed)
+        response_cache.invalidate('places')
+        return place
+    
+    @staticmethod
+    def create_places(places_data, owner_id):
+        """Create several places for one owner in a single transaction
+        
+        Each item is validated on its own; invalid items are reported and
+        skipped while the valid ones are inserted together. Returns the
+        created places and one result per item, in request order.
+        """
+        check_batch(places_data)
+        place_repo = PlaceRepository()
+        owner = UserRepository().get(owner_id)
+        if not owner:
+            raise ValueError("Owner not found")
         
-        # Add amenities if provided
-        amenity_ids = place_data.get('amenities', [])
-        for amenity_id in amenity_ids:
-            amenity = amenity_repo.get(amenity_id)
-            if amenity:
+        places = []
+        results = []
+        for index, place_data in enumerate(places_data):
+            try:
+                check_item(place_data)
+                place = Place(
+                    title=place_data.get('title'),
+                    description=place_data.get('description', ''),
+                    price=place_data.get('price'),
+                    latitude=place_data.get('latitude'),
+                    longitude=place_data.get('longitude'),
+                    owner=owner
+                )
+            except (ValueError, TypeError) as e:
+                results.append({'index': index, 'status': 'error', 'error': str(e)})
+                continue
+            for amenity in amenity_catalog.get_many(place_data.get('amenities', [])):
                 place.add_amenity(amenity)
+            places.append(place)
+            results.append({'index': index, 'status': 'created', 'place': place})
         
-        return place_repo.add(place)
+        if places:
+            with unit_of_work():
+                CollectionVersionService.bump('places')
+                place_repo.add_all(places)
+                PlaceSearchRepository().reindex(place.id for place in places)
+                indexed = [(place.id, place.created_at, [amenity.id for amenity in place.amenities])
+                           for place in places]
+            for entry in indexed:
+                amenity_index.set_amenities(*entry)
+            response_cache.invalidate('places')
+        # IDs are only final once the batch is flushed
+        for result in results:
+            if 'place' in result:
+                result['id'] = result.pop('place').id
+        return places, results
     
     @staticmethod
-    def get_place_by_id(place_id):
-        """Get a place by ID"""
+    def parse_fieldset(fields=None, include=None):
+        """Validate requested place fields and relationships"""
+        return Place.parse_fieldset(fields, include)
+    
+    @staticmethod
+    def get_place_by_id(place_id, eager=False, fieldset=None):
+        """Get a place by ID, eager-loading relationships if requested"""
         repository = PlaceRepository()
-        return repository.get(place_id)
+        options = repository.serialization_options(fieldset=fieldset) if eager else None
+        return repository.get(place_id, options=options)
     
     @staticmethod
-    def get_all_places():
+    def get_all_places(eager=False):
         """Get all places"""
         repository = PlaceRepository()
-        return repository.get_all()
+        options = repository.serialization_options() if eager else None
+        return repository.get_all(options=options)
+    
+    @staticmethod
+    def get_places_page(limit=None, cursor=None, eager=False, fieldset=None):
+        """Get one page of places using keyset pagination"""
+        repository = PlaceRepository()
+        options = repository.serialization_options(
+            include_reviews=False, fieldset=fieldset
+        ) if eager else None
+        return repository.get_page(clamp_limit(limit), cursor, options=options)
+    
+    @staticmethod
+    def iter_places(chunk_size, fieldset=None):
+        """Yield every place in chunks for streamed listings"""
+        repository = PlaceRepository()
+        options = repository.serialization_options(include_reviews=False, fieldset=fieldset)
+        return repository.iter_chunks(chunk_size, options=options)
+    
+    @staticmethod
+    def search_places(filters, limit=None, cursor=None, eager=False, fieldset=None):
+        """Get one page of places matching keywords, price, bounding box and amenity filters
+        
+        With a q keyword query, results are ranked by relevance instead of
+        creation order.
+        """
+        repository = PlaceRepository()
+        
+        match = None
+        if filters.get('q') is not None:
+            match = build_match_terms(filters['q'])
+            if match is None:
+                raise ValueError("Search query must contain at least one word")
+        
+        min_price = filters.get('min_price')
+        max_price = filters.get('max_price')
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price cannot be greater than max_price")
+        
+        # A bounding box needs all four edges
+        edges = [filters.get(key) for key in ('min_lat', 'max_lat', 'min_lon', 'max_lon')]
+        bounds = None
+        if any(edge is not None for edge in edges):
+            if any(edge is None for edge in edges):
+                raise ValueError("Bounding box requires min_lat, max_lat, min_lon and max_lon")
+            min_lat, max_lat, min_lon, max_lon = edges
+            if min_lat > max_lat or min_lon > max_lon:
+                raise ValueError("Bounding box minimums cannot exceed maximums")
+            bounds = tuple(edges)
+        
+        options = repository.serialization_options(
+            include_reviews=False, fieldset=fieldset
+        ) if eager else None
+        amenity_ids = filters.get('amenities')
+        if amenity_ids and match is None and amenity_index.enabled:
+            return PlaceService._search_by_amenity_index(
+                repository, amenity_ids, clamp_limit(limit), cursor, options,
+                min_price=min_price, max_price=max_price, bounds=bounds
+            )
+        return repository.search(
+            clamp_limit(limit), cursor,
+            min_price=min_price,
+            max_price=max_price,
+            bounds=bounds,
+            amenity_ids=filters.get('amenities'),
+            match=match,
+            options=options
+        )
+    
+    @staticmethod
+    def _search_by_amenity_index(repository, amenity_ids, limit, cursor, options, **filters):
+        """Get one page of places having every amenity, using the in-memory bitmap index
+        
+        Candidates come from the index in (created_at, id) order; the other
+        filters are applied to them in chunks that grow until the page fills.
+        After MAX_INDEX_CANDIDATES candidates, or a scan of MAX_INDEX_SCAN
+        places that found too few, the page is finished with the SQL join
+        from where the index stopped.
+        """
+        mask = amenity_index.mask(amenity_ids)
+        if mask is None:
+            return [], None
+        after = decode_cursor(cursor) if cursor else None
+        places = []
+        chunk_size = limit + 1
+        candidates = 0
+        fallback = False
+        while len(places) <= limit:
+            if candidates >= MAX_INDEX_CANDIDATES:
+                fallback = True
+                break
+            keys, resume = amenity_index.matching(mask, after, chunk_size, MAX_INDEX_SCAN)
+            if keys:
+                found, _ = repository.search(
+                    limit + 1 - len(places), place_ids=[place_id for _, place_id in keys],
+                    options=options, **filters
+                )
+                places.extend(found)
+                candidates += len(keys)
+            if resume is None:
+                break
+            after = resume
+            if len(keys) < chunk_size:
+                # The scan limit was hit first
+                fallback = True
+                break
+            chunk_size = min(chunk_size * 2, MAX_CANDIDATE_CHUNK)
+        if fallback and len(places) <= limit:
+            found, _ = repository.search(
+                limit + 1 - len(places), encode_cursor(*after),
+                amenity_ids=amenity_ids, options=options, **filters
+            )
+            places.extend(found)
+        
+        next_cursor = None
+        if len(places) > limit:
+            places = places[:limit]
+            last = places[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return places, next_cursor
+    
+    @staticmethod
+    def find_places_nearby(latitude, longitude, radius_km, limit=None, eager=False,
+                           fieldset=None):
+        """Get the nearest places within a radius as (place, distance_km) pairs"""
+        repository = PlaceRepository()
+        
+        if latitude is None or longitude is None or radius_km is None:
+            raise ValueError("lat, lon and radius_km are required")
+        if latitude < -90 or latitude > 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        if longitude < -180 or longitude > 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        if radius_km <= 0:
+            raise ValueError("Radius must be greater than 0")
+        if radius_km > MAX_RADIUS_KM:
+            raise ValueError(f"Radius must be at most {MAX_RADIUS_KM} km")
+        
+        options = repository.serialization_options(
+            include_reviews=False, fieldset=fieldset
+        ) if eager else None
+        return repository.find_within_radius(
+            latitude, longitude, radius_km, clamp_limit(limit), options=options
+        )
     
     @staticmethod
     def update_place(place_id, place_data):
         """Update a place"""
         place_repo = PlaceRepository()
-        amenity_repo = AmenityRepository()
         
         place = place_repo.get(place_id)
         if not place:
             return None
         
-        # Handle amenities update
-        if 'amenities' in place_data:
-            amenity_ids = place_data.pop('amenities')
-            # Clear current amenities
-            place.amenities.clear()
-            # Add new amenities
-            for amenity_id in amenity_ids:
-                amenity = amenity_repo.get(amenity_id)
-                if amenity:
+        indexed = None
+        with unit_of_work():
+            # Handle amenities update
+            if 'amenities' in place_data:
+                amenity_ids = place_data.pop('amenities')
+                # Clear current amenities
+                place.amenities.clear()
+                # Add new amenities
+                for amenity in amenity_catalog.get_many(amenity_ids):
                     place.add_amenity(amenity)
+                indexed = (place.id, place.created_at, [amenity.id for amenity in place.amenities])
+            
+            # Update place
+            place.update(**place_data)
+            CollectionVersionService.bump('places')
+            place = place_repo.update(place)
+            if 'title' in place_data or 'description' in place_data:
+                PlaceSearchRepository().reindex([place_id])
+        if indexed is not None:
+            amenity_index.set_amenities(*indexed)
+        response_cache.invalidate('places', f'place:{place_id}')
+        return place
+    
+    @staticmethod
+    def get_place_validators(place_id):
+        """Get (version parts, last modified) for a place, or None if missing
+        
+        Covers everything Place.to_dict() shows: the place row (including
+        rating aggregates), its owner and the amenity catalog.
+        """
+        repository = PlaceRepository()
+        times = repository.get_modification_times(place_id)
+        if times is None:
+            return None
+        parts, amenities_modified = CollectionVersionService.get_validators('amenities')
+        stamps = [stamp for stamp in (*times, amenities_modified) if stamp]
+        return tuple(times) + parts, max(stamps) if stamps else None
+    
+    @staticmethod
+    def get_places_validators(with_reviews=False):
+        """Get (version parts, last modified) for place listings
         
-        # Update place
-        place.update(**place_data)
-        return place_repo.update(place)
+        Keyword searches also match review text, so they pass with_reviews.
+        """
+        if with_reviews:
+            return CollectionVersionService.get_validators('places', 'users', 'amenities', 'reviews')
+        return CollectionVersionService.get_validators('places', 'users', 'amenities')
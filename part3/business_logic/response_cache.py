@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class InMemoryCacheBackend:
+    """Size-bounded LRU cache with per-entry TTL and tag-based invalidation
+
+    Any object with the same get/set/invalidate/clear/stats methods can be
+    plugged into ResponseCache instead, e.g. a shared Redis-backed store.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, tags, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, tags=()):
+        """Store value under key, remembering which tags it depends on"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, frozenset(tags), time.monotonic() + self.ttl)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tags):
+        """Drop every entry that depends on any of the given tags"""
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl
+            }
+
+    def _remove(self, key):
+        """Remove one entry and its tag references (lock must be held)"""
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class ResponseCache:
+    """Cache of public GET responses, invalidated by service-layer writes
+
+    Entries are tagged with what they show ('places', 'place:<id>',
+    'user:<id>', ...) and services invalidate those tags after committing.
+    A generation counter stops a request that read data before a write
+    from caching it after that write's invalidation.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or InMemoryCacheBackend()
+        self.enabled = True
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def configure(self, enabled=True, backend=None):
+        """Swap the backend and start from an empty cache"""
+        self.enabled = enabled
+        if backend is not None:
+            self.backend = backend
+        self.backend.clear()
+
+    def generation(self):
+        """Snapshot to pass to set(), taken before reading the data"""
+        return self._generation
+
+    def get(self, key):
+        """Return a cached response or None"""
+        if not self.enabled:
+            return None
+        return self.backend.get(key)
+
+    def set(self, key, value, tags, generation):
+        """Cache a response unless something was invalidated since generation"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation == self._generation:
+                self.backend.set(key, value, tags)
+
+    def invalidate(self, *tags):
+        """Drop cached responses depending on any of the tags"""
+        with self._lock:
+            self._generation += 1
+            self.backend.invalidate(tags)
+
+    def stats(self):
+        """Return the backend's counters"""
+        stats = self.backend.stats()
+        stats['enabled'] = self.enabled
+        return stats
+
+
+def cache_key(path, args, etag=None):
+    """Build a cache key from a route path, its query arguments and ETag
+
+    The ETag comes from the shared collection versions, so a write made by
+    another worker (or not yet on the replica a response was read from)
+    leads to a different key instead of a cached body from before it.
+    """
+    query = '&'.join(f'{name}={value}' for name, value in sorted(args.items(multi=True)))
+    key = f'{path}?{query}'
+    return key if etag is None else f'{key}#{etag}'
+
+
+# Global response cache instance
+response_cache = ResponseCache()
@@ -11,17 +11,29 @@ class ReviewFacade:
         """Create a new review"""
         return self.review_service.create_review(review_data)
     
-    def get_review(self, review_id):
+    def create_reviews(self, reviews_data, user_id):
+        """Create several reviews in one transaction"""
+        return self.review_service.create_reviews(reviews_data, user_id)
+    
+    def parse_fieldset(self, fields=None, include=None):
+        """Validate requested review fields and relationships"""
+        return self.review_service.parse_fieldset(fields, include)
+    
+    def get_review(self, review_id, eager=False, fieldset=None):
         """Get a review by ID"""
-        return self.review_service.get_review_by_id(review_id)
+        return self.review_service.get_review_by_id(review_id, eager, fieldset)
     
-    def get_all_reviews(self):
+    def get_all_reviews(self, eager=False, fieldset=None):
         """Get all reviews"""
-        return self.review_service.get_all_reviews()
+        return self.review_service.get_all_reviews(eager, fieldset)
+    
+    def iter_reviews(self, chunk_size, fieldset=None):
+        """Yield every review in chunks"""
+        return self.review_service.iter_reviews(chunk_size, fieldset)
     
-    def get_reviews_by_place(self, place_id):
+    def get_reviews_by_place(self, place_id, eager=False, fieldset=None):
         """Get all reviews for a place"""
-        return self.review_service.get_reviews_by_place(place_id)
+        return self.review_service.get_reviews_by_place(place_id, eager, fieldset)
     
     def update_review(self, review_id, review_data):
         """Update a review"""
@@ -30,6 +42,14 @@ class ReviewFacade:
     def delete_review(self, review_id):
         """Delete a review"""
         return self.review_service.delete_review(review_id)
+    
+    def get_review_validators(self, review_id):
+        """Get HTTP cache validators for a review"""
+        return self.review_service.get_review_validators(review_id)
+    
+    def get_reviews_validators(self):
+        """Get HTTP cache validators for review listings"""
+        return self.review_service.get_reviews_validators()
 
 
 # Global facade instance
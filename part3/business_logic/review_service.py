@@ -1,7 +1,13 @@
 from business_logic.models.review import Review
 from business_logic.place_service import PlaceService
+from business_logic.collection_version_service import CollectionVersionService
+from business_logic.response_cache import response_cache
 from repositories.review_repository import ReviewRepository
 from repositories.user_repository import UserRepository
+from repositories.place_repository import PlaceRepository
+from repositories.search_repository import PlaceSearchRepository
+from business_logic.batch import check_batch, check_item
+from persistence.unit_of_work import unit_of_work
 
 class ReviewService:
     """Service class for review-related business logic"""
@@ -42,25 +48,112 @@ class ReviewService:
             user_id=user_id
         )
         
-        return review_repo.add(review)
+        with unit_of_work():
+            place.adjust_ratings({review.rating: 1})
+            CollectionVersionService.bump('reviews', 'places')
+            review = review_repo.add(review)
+            PlaceSearchRepository().reindex_reviews([(review.id, place_id)])
+        response_cache.invalidate('reviews', f'place:{place_id}', f'place_reviews:{place_id}')
+        return review
     
     @staticmethod
-    def get_review_by_id(review_id):
-        """Get a review by ID"""
+    def create_reviews(reviews_data, user_id):
+        """Create several reviews by one user in a single transaction
+        
+        Places and the user's existing reviews are looked up once for the
+        whole batch, and each place's rating aggregates are adjusted once.
+        Returns the created reviews and one result per item, in request order.
+        """
+        check_batch(reviews_data)
+        review_repo = ReviewRepository()
+        if not UserRepository().get(user_id):
+            raise ValueError("User not found")
+        
+        place_ids = {item.get('place_id') for item in reviews_data if isinstance(item, dict)}
+        place_ids.discard(None)
+        places = {place.id: place for place in PlaceRepository().get_many(place_ids)}
+        reviewed = review_repo.get_reviewed_place_ids(user_id, places)
+        
+        reviews = []
+        results = []
+        deltas = {}
+        for index, review_data in enumerate(reviews_data):
+            try:
+                check_item(review_data)
+                place_id = review_data.get('place_id')
+                place = places.get(place_id)
+                if not place:
+                    raise ValueError("Place not found")
+                if place.owner_id == user_id:
+                    raise ValueError("You cannot review your own place")
+                if place_id in reviewed:
+                    raise ValueError("You have already reviewed this place")
+                review = Review(
+                    text=review_data.get('text'),
+                    rating=review_data.get('rating'),
+                    place_id=place_id,
+                    user_id=user_id
+                )
+            except (ValueError, TypeError) as e:
+                results.append({'index': index, 'status': 'error', 'error': str(e)})
+                continue
+            reviewed.add(place_id)
+            place_deltas = deltas.setdefault(place_id, {})
+            place_deltas[review.rating] = place_deltas.get(review.rating, 0) + 1
+            reviews.append(review)
+            results.append({'index': index, 'status': 'created', 'review': review})
+        
+        if reviews:
+            with unit_of_work():
+                for place_id, place_deltas in deltas.items():
+                    places[place_id].adjust_ratings(place_deltas)
+                CollectionVersionService.bump('reviews', 'places')
+                review_repo.add_all(reviews)
+                PlaceSearchRepository().reindex_reviews(
+                    (review.id, review.place_id) for review in reviews
+                )
+            tags = ['reviews']
+            for place_id in deltas:
+                tags.extend([f'place:{place_id}', f'place_reviews:{place_id}'])
+            response_cache.invalidate(*tags)
+        # IDs are only final once the batch is flushed
+        for result in results:
+            if 'review' in result:
+                result['id'] = result.pop('review').id
+        return reviews, results
+    
+    @staticmethod
+    def parse_fieldset(fields=None, include=None):
+        """Validate requested review fields and relationships"""
+        return Review.parse_fieldset(fields, include)
+    
+    @staticmethod
+    def get_review_by_id(review_id, eager=False, fieldset=None):
+        """Get a review by ID, eager-loading relationships if requested"""
         repository = ReviewRepository()
-        return repository.get(review_id)
+        options = repository.serialization_options(fieldset) if eager else None
+        return repository.get(review_id, options=options)
     
     @staticmethod
-    def get_all_reviews():
+    def get_all_reviews(eager=False, fieldset=None):
         """Get all reviews"""
         repository = ReviewRepository()
-        return repository.get_all()
+        options = repository.serialization_options(fieldset) if eager else None
+        return repository.get_all(options=options)
+    
+    @staticmethod
+    def iter_reviews(chunk_size, fieldset=None):
+        """Yield every review in chunks for streamed listings"""
+        repository = ReviewRepository()
+        options = repository.serialization_options(fieldset)
+        return repository.iter_chunks(chunk_size, options=options)
     
     @staticmethod
-    def get_reviews_by_place(place_id):
+    def get_reviews_by_place(place_id, eager=False, fieldset=None):
         """Get all reviews for a place"""
         repository = ReviewRepository()
-        return repository.get_by_place(place_id)
+        options = repository.serialization_options(fieldset) if eager else None
+        return repository.get_by_place(place_id, options=options)
     
     @staticmethod
     def update_review(review_id, review_data):
@@ -70,11 +163,52 @@ class ReviewService:
         if not review:
             return None
         
-        review.update(**review_data)
-        return repository.update(review)
+        old_rating = review.rating
+        tags = ['reviews', f'place_reviews:{review.place_id}']
+        with unit_of_work():
+            review.update(**review_data)
+            if review.rating != old_rating:
+                place = PlaceService.get_place_by_id(review.place_id)
+                place.adjust_ratings({old_rating: -1, review.rating: 1})
+                CollectionVersionService.bump('reviews', 'places')
+                tags.append(f'place:{review.place_id}')
+            else:
+                CollectionVersionService.bump('reviews')
+            review = repository.update(review)
+            if 'text' in review_data:
+                PlaceSearchRepository().reindex_reviews([(review.id, review.place_id)])
+        response_cache.invalidate(*tags)
+        return review
     
     @staticmethod
     def delete_review(review_id):
         """Delete a review"""
         repository = ReviewRepository()
-        return repository.delete(review_id)
+        review = repository.get(review_id)
+        if not review:
+            return False
+        
+        place_id = review.place_id
+        with unit_of_work():
+            place = PlaceService.get_place_by_id(place_id)
+            if place:
+                place.adjust_ratings({review.rating: -1})
+            CollectionVersionService.bump('reviews', 'places')
+            deleted = repository.delete(review_id)
+            PlaceSearchRepository().reindex_reviews([(review_id, place_id)])
+        response_cache.invalidate('reviews', f'place:{place_id}', f'place_reviews:{place_id}')
+        return deleted
+    
+    @staticmethod
+    def get_review_validators(review_id):
+        """Get (version parts, last modified) for a review, or None if missing"""
+        repository = ReviewRepository()
+        times = repository.get_modification_times(review_id)
+        if times is None:
+            return None
+        return tuple(times), max(stamp for stamp in times if stamp)
+    
+    @staticmethod
+    def get_reviews_validators():
+        """Get (version parts, last modified) for review listings"""
+        return CollectionVersionService.get_validators('reviews', 'places', 'users')
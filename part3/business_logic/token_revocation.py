@@ -0,0 +1,161 @@
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from repositories.revoked_token_repository import RevokedTokenRepository
+
+# revoked_at is stamped before the row commits, so each sync re-reads
+# revocations this far behind the newest one seen; a revocation that
+# committed late in another process is still picked up
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings
+
+    Uses Python's (per-process salted) string hash with double hashing, so
+    it is only meaningful inside the process that built it.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        """Set the key's bits"""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        """False means definitely absent; True means possibly present"""
+        # Probes are computed one at a time: for absent keys the first
+        # one usually hits a clear bit, so the check returns early
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        size = self.size
+        bits = self._bits
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class TokenRevocationStore:
+    """Revoked JWT identifiers, checked without a database round trip
+
+    A Bloom filter answers the common case (token not revoked) and an exact
+    {jti: exp} map resolves its false positives. Revocations are persisted
+    to the revoked_tokens table; every sync_interval seconds the store
+    picks up revocations made by other processes and forgets entries whose
+    token has expired. Syncing only reads: expired rows are deleted when a
+    token is revoked, or by `flask prune-revoked-tokens`.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001, sync_interval=5):
+        self.configure(capacity, error_rate, sync_interval)
+
+    def configure(self, capacity=100000, error_rate=0.001, sync_interval=5):
+        """Reset the store; it reloads from the database on the next check"""
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked = {}
+        self._synced_until = None
+        self._next_sync = 0.0
+        self.bloom_positives = 0
+        self.syncs = 0
+
+    def is_revoked(self, jti):
+        """Check whether the token with this jti was revoked"""
+        if time.monotonic() >= self._next_sync:
+            self.sync()
+        if jti not in self._bloom:
+            return False
+        self.bloom_positives += 1
+        return jti in self._revoked
+
+    def revoke(self, jti, expires, token_type='access', user_id=None):
+        """Revoke a token until its exp (a Unix timestamp)"""
+        now = datetime.utcnow()
+        repository = RevokedTokenRepository()
+        repository.add(jti, token_type, user_id, datetime.utcfromtimestamp(expires), now)
+        # Logout already writes to the primary, so the table is pruned here
+        repository.delete_expired(now)
+        with self._lock:
+            self._remember(jti, expires)
+
+    def sync(self):
+        """Load revocations from other processes and forget expired entries"""
+        with self._lock:
+            self._next_sync = time.monotonic() + self.sync_interval
+            since = self._synced_until - SYNC_OVERLAP if self._synced_until else None
+        # The query runs without the lock so token checks never wait on it
+        rows = RevokedTokenRepository().get_revoked_since(since, datetime.utcnow())
+        with self._lock:
+            for jti, expires_at, revoked_at in rows:
+                self._remember(jti, _timestamp(expires_at))
+                if self._synced_until is None or revoked_at > self._synced_until:
+                    self._synced_until = revoked_at
+            self._prune(time.time())
+            self.syncs += 1
+
+    def _remember(self, jti, expires):
+        """Add one entry, growing the filter when it is full (lock must be held)"""
+        if jti in self._revoked:
+            return
+        self._revoked[jti] = expires
+        if self._bloom.count >= self._bloom.capacity:
+            self._rebuild(self._bloom.capacity * 2)
+        else:
+            self._bloom.add(jti)
+
+    def _prune(self, now):
+        """Forget expired tokens (lock must be held)"""
+        expired = [jti for jti, expires in self._revoked.items() if expires <= now]
+        for jti in expired:
+            del self._revoked[jti]
+        if expired:
+            self._rebuild(max(self.capacity, self._bloom.capacity))
+
+    def _rebuild(self, capacity):
+        """Replace the filter with one holding exactly the current entries"""
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in self._revoked:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def stats(self):
+        """Return entry and check counters"""
+        return {
+            'revoked': len(self._revoked),
+            'bloom_capacity': self._bloom.capacity,
+            'bloom_bits': self._bloom.size,
+            'bloom_hashes': self._bloom.hash_count,
+            'bloom_positives': self.bloom_positives,
+            'syncs': self.syncs,
+            'sync_interval': self.sync_interval
+        }
+
+
+def _timestamp(value):
+    """Convert a naive UTC datetime to a Unix timestamp"""
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+# Global token revocation store
+token_revocation_store = TokenRevocationStore()
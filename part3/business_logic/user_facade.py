@@ -11,17 +11,25 @@ class UserFacade:
         """Create a new user"""
         return self.user_service.create_user(user_data)
     
-    def get_user(self, user_id):
+    def parse_fieldset(self, fields=None, include=None):
+        """Validate requested user fields and relationships"""
+        return self.user_service.parse_fieldset(fields, include)
+    
+    def get_user(self, user_id, eager=False, fieldset=None):
         """Get a user by ID"""
-        return self.user_service.get_user_by_id(user_id)
+        return self.user_service.get_user_by_id(user_id, eager, fieldset)
     
     def get_user_by_email(self, email):
         """Get a user by email"""
         return self.user_service.get_user_by_email(email)
     
-    def get_all_users(self):
+    def get_all_users(self, eager=False, fieldset=None):
         """Get all users"""
-        return self.user_service.get_all_users()
+        return self.user_service.get_all_users(eager, fieldset)
+    
+    def iter_users(self, chunk_size, fieldset=None):
+        """Yield every user in chunks"""
+        return self.user_service.iter_users(chunk_size, fieldset)
     
     def update_user(self, user_id, user_data):
         """Update a user"""
@@ -30,6 +38,14 @@ class UserFacade:
     def authenticate_user(self, email, password):
         """Authenticate a user"""
         return self.user_service.authenticate_user(email, password)
+    
+    def get_user_validators(self, user_id):
+        """Get HTTP cache validators for a user"""
+        return self.user_service.get_user_validators(user_id)
+    
+    def get_users_validators(self):
+        """Get HTTP cache validators for user listings"""
+        return self.user_service.get_users_validators()
 
 
 # Global facade instance
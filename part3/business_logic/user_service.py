@@ -1,5 +1,9 @@
 from business_logic.models.user import User
 from repositories.user_repository import UserRepository
+from business_logic.collection_version_service import CollectionVersionService
+from business_logic.response_cache import response_cache
+from business_logic.identity_cache import identity_cache, CurrentUser
+from persistence.unit_of_work import unit_of_work
 
 class UserService:
     """Service class for user-related business logic"""
@@ -36,13 +40,36 @@ class UserService:
         if cls.bcrypt:
             user.hash_password(user_data.get('password'), cls.bcrypt)
         
-        return repository.add(user)
+        with unit_of_work():
+            CollectionVersionService.bump('users')
+            user = repository.add(user)
+        return user
     
     @staticmethod
-    def get_user_by_id(user_id):
-        """Get a user by ID"""
+    def parse_fieldset(fields=None, include=None):
+        """Validate requested user fields and relationships"""
+        return User.parse_fieldset(fields, include)
+    
+    @staticmethod
+    def get_user_by_id(user_id, eager=False, fieldset=None):
+        """Get a user by ID, eager-loading relationships if requested"""
         repository = UserRepository()
-        return repository.get(user_id)
+        options = repository.serialization_options(fieldset) if eager else None
+        return repository.get(user_id, options=options)
+    
+    @staticmethod
+    def get_identity(user_id):
+        """Get the cached identity (ID, email, names, admin flag) of a user"""
+        repository = UserRepository()
+        return identity_cache.get(user_id, repository.get_identity)
+    
+    @classmethod
+    def get_current_user(cls, user_id):
+        """Get a lazily loaded user for JWT-protected handlers, or None"""
+        identity = cls.get_identity(user_id)
+        if identity is None:
+            return None
+        return CurrentUser(identity, cls.get_user_by_id)
     
     @staticmethod
     def get_user_by_email(email):
@@ -51,10 +78,18 @@ class UserService:
         return repository.get_by_email(email)
     
     @staticmethod
-    def get_all_users():
+    def get_all_users(eager=False, fieldset=None):
         """Get all users"""
         repository = UserRepository()
-        return repository.get_all()
+        options = repository.serialization_options(fieldset) if eager else None
+        return repository.get_all(options=options)
+    
+    @staticmethod
+    def iter_users(chunk_size, fieldset=None):
+        """Yield every user in chunks for streamed listings"""
+        repository = UserRepository()
+        options = repository.serialization_options(fieldset)
+        return repository.iter_chunks(chunk_size, options=options)
     
     @classmethod
     def update_user(cls, user_id, user_data):
@@ -70,15 +105,40 @@ class UserService:
             if existing_user:
                 raise ValueError("User with this email already exists")
         
-        # Hash password if provided
-        if 'password' in user_data and cls.bcrypt:
-            plain_password = user_data['password']
-            user.update(**user_data)
-            user.hash_password(plain_password, cls.bcrypt)
-        else:
-            user.update(**user_data)
+        with unit_of_work():
+            # Hash password if provided
+            if 'password' in user_data and cls.bcrypt:
+                plain_password = user_data['password']
+                user.update(**user_data)
+                user.hash_password(plain_password, cls.bcrypt)
+            else:
+                user.update(**user_data)
+            
+            CollectionVersionService.bump('users')
+            user = repository.update(user)
+        response_cache.invalidate(f'user:{user_id}')
+        identity_cache.invalidate(user_id)
+        return user
+    
+    @staticmethod
+    def get_user_validators(user_id):
+        """Get (version parts, last modified) for a user, or None if missing
         
-        return repository.update(user)
+        User.to_dict() lists place and review IDs, so the place and review
+        collection versions are part of the validator.
+        """
+        repository = UserRepository()
+        times = repository.get_modification_times(user_id)
+        if times is None:
+            return None
+        parts, related_modified = CollectionVersionService.get_validators('places', 'reviews')
+        stamps = [stamp for stamp in (*times, related_modified) if stamp]
+        return tuple(times) + parts, max(stamps) if stamps else None
+    
+    @staticmethod
+    def get_users_validators():
+        """Get (version parts, last modified) for user listings"""
+        return CollectionVersionService.get_validators('users', 'places', 'reviews')
     
     @classmethod
     def authenticate_user(cls, email, password):
@@ -1,7 +1,57 @@
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
 
+# Bind key of the optional read replica engine
+REPLICA_BIND = 'replica'
+
+_PINNED_KEY = 'pinned_to_primary'
+
+
 class Base(DeclarativeBase):
     pass
 
-db = SQLAlchemy(model_class=Base)
+
+class RoutingSession(Session):
+    """Session that sends plain SELECTs to the read replica, if one is bound
+    
+    Anything else (flushes, DML, raw SQL) goes to the primary and pins the
+    session there, so a request reads its own writes from then on.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None and not self.info.get(_PINNED_KEY):
+                if getattr(clause, 'is_select', False):
+                    return replica
+                self.info[_PINNED_KEY] = True
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+def pin_to_primary(pinned=True):
+    """Route every following statement of the current session to the primary"""
+    db.session.info[_PINNED_KEY] = pinned
+
+
+db = SQLAlchemy(model_class=Base, session_options={'class_': RoutingSession})
+
+
+def set_sqlite_pragmas(engine, pragmas):
+    """Run the given PRAGMAs on every new connection of a SQLite engine
+    
+    Other dialects are left untouched, so the same config works when
+    DATABASE_URL points somewhere else.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
@@ -0,0 +1,43 @@
+import threading
+
+
+def refresh_sqlite_replica(primary, replica):
+    """Copy a SQLite primary over its replica with the online backup API
+    
+    Both arguments are engines; readers of the replica briefly wait on
+    its busy_timeout while the copy is written.
+    """
+    source = primary.raw_connection()
+    target = replica.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+    finally:
+        target.close()
+        source.close()
+
+
+class ReplicaRefresher(threading.Thread):
+    """Background thread that refreshes a local SQLite replica periodically
+    
+    Stands in for real replication when developing against two files.
+    """
+    
+    def __init__(self, primary, replica, interval):
+        super().__init__(name='replica-refresher', daemon=True)
+        self.primary = primary
+        self.replica = replica
+        self.interval = interval
+        self._stopped = threading.Event()
+    
+    def run(self):
+        while True:
+            try:
+                refresh_sqlite_replica(self.primary, self.replica)
+            except Exception as e:
+                print(f"⚠️ Error refreshing replica: {e}")
+            if self._stopped.wait(self.interval):
+                break
+    
+    def stop(self):
+        """Stop after the current refresh"""
+        self._stopped.set()
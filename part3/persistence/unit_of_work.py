@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+from persistence.database import db
+
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+def in_unit_of_work():
+    """Check whether a unit of work currently owns the session's transaction"""
+    return db.session.info.get(_DEPTH_KEY, 0) > 0
+
+
+@contextmanager
+def unit_of_work():
+    """Group several repository writes into one transaction
+    
+    Repositories only flush inside the block. The outermost block commits
+    once on success and rolls back on any error; nested blocks join it.
+    """
+    session = db.session
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except BaseException:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        session.info[_DEPTH_KEY] = depth
+
+
+def commit():
+    """Commit, or only flush when a unit of work will commit later"""
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def rollback():
+    """Roll back, unless a unit of work will do it at its boundary"""
+    if not in_unit_of_work():
+        db.session.rollback()
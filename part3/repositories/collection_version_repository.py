@@ -0,0 +1,62 @@
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from business_logic.models.collection_version import CollectionVersion
+from persistence.database import db
+from persistence import unit_of_work
+
+# Dialects whose INSERT ... ON CONFLICT DO UPDATE creates or bumps a row in one statement
+_UPSERTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+class CollectionVersionRepository:
+    """Repository for collection change counters"""
+    
+    def bump(self, names, commit: bool = False):
+        """Increment the version of each named collection
+        
+        Runs inside the caller's transaction unless commit is True, so the
+        bump lands atomically with the write that caused it.
+        """
+        try:
+            now = datetime.utcnow()
+            upsert = _UPSERTS.get(db.engine.dialect.name)
+            # The caller's pending objects are flushed by its own commit
+            with db.session.no_autoflush:
+                for name in names:
+                    if upsert is not None:
+                        # Two first writes to a collection must not both INSERT
+                        db.session.execute(
+                            upsert(CollectionVersion)
+                            .values(name=name, version=1, updated_at=now)
+                            .on_conflict_do_update(
+                                index_elements=[CollectionVersion.name],
+                                set_={'version': CollectionVersion.version + 1, 'updated_at': now}
+                            )
+                        )
+                        continue
+                    result = db.session.execute(
+                        db.update(CollectionVersion)
+                        .where(CollectionVersion.name == name)
+                        .values(version=CollectionVersion.version + 1, updated_at=now)
+                    )
+                    if result.rowcount == 0:
+                        db.session.add(CollectionVersion(name=name, version=1, updated_at=now))
+            if commit:
+                unit_of_work.commit()
+        except Exception as e:
+            unit_of_work.rollback()
+            raise Exception(f"Error bumping collection versions: {str(e)}")
+    
+    def get_versions(self, names) -> dict:
+        """Get {name: (version, updated_at)} for the named collections"""
+        try:
+            rows = db.session.execute(
+                db.select(
+                    CollectionVersion.name,
+                    CollectionVersion.version,
+                    CollectionVersion.updated_at
+                ).where(CollectionVersion.name.in_(names))
+            ).all()
+        except Exception as e:
+            raise Exception(f"Error getting collection versions: {str(e)}")
+        return {name: (version, updated_at) for name, version, updated_at in rows}
@@ -1,55 +1,359 @@
+import itertools
+import threading
+import uuid
+from collections import namedtuple
+from contextlib import ExitStack, nullcontext
+from operator import attrgetter
 from business_logic.models.user import User
 from business_logic.models.place import Place
 from business_logic.models.review import Review
 from business_logic.models.amenity import Amenity
 
+# Attributes get_by_attribute answers from a hash index instead of a scan
+DEFAULT_INDEXES = {
+    'User': ('email',),
+    'Place': ('owner_id',),
+    'Review': ('place_id', 'user_id'),
+    'Amenity': ('name',)
+}
+
+# Stripes per type in concurrent mode; a write copies only its stripe
+DEFAULT_STRIPES = 64
+
+# Whole-type reads retried this often before locking every stripe
+SNAPSHOT_RETRIES = 8
+
+# A stored object, its insertion sequence and the values it is indexed under
+_Entry = namedtuple('_Entry', 'seq obj values')
+
+# One stripe's contents: {obj_id: entry} and {attribute: {value: {obj_id: entry}}},
+# plus the ids of the buckets a concurrent write already copied (None in plain mode)
+_State = namedtuple('_State', 'objects indexes copied')
+
+
+class _Stripe:
+    """A shard of one type's objects, replaced as a whole on every write"""
+    __slots__ = ('lock', 'state')
+
+    def __init__(self, lock, attributes):
+        self.lock = lock
+        self.state = _State({}, {attribute: {} for attribute in attributes}, None)
+
+
+class _Table:
+    """Objects of one type with their secondary indexes
+
+    In concurrent mode objects are spread over stripes by ID, each with its
+    own lock. Writers copy their stripe's state, change the copy and publish
+    it with one assignment, so readers never lock and never see a write
+    half-applied. A version bumped after each write lets whole-type reads
+    check that no write landed while they collected the stripes. Plain mode
+    keeps a single stripe changed in place, for single-threaded use.
+    """
+
+    def __init__(self, attributes, sequence, concurrent=False, stripes=DEFAULT_STRIPES):
+        self.attributes = list(attributes)
+        self.concurrent = concurrent
+        self._sequence = sequence
+        self._stripes = [
+            _Stripe(threading.Lock() if concurrent else nullcontext(), self.attributes)
+            for _ in range(stripes if concurrent else 1)
+        ]
+        self._version = 0
+        self._version_lock = threading.Lock()
+        self._listing = None
+
+    def get(self, obj_id):
+        entry = self._stripe(obj_id).state.objects.get(obj_id)
+        return entry.obj if entry else None
+
+    def all(self):
+        """Every object, in insertion order"""
+        listing = self._listing
+        if listing is not None and listing[0] == self._version:
+            return list(listing[1])
+        version, states = self._snapshot()
+        entries = [entry for state in states for entry in state.objects.values()]
+        if len(states) > 1:
+            # Each stripe is already in order, so this only merges runs
+            entries.sort(key=attrgetter('seq'))
+        objects = tuple(entry.obj for entry in entries)
+        # Reused by later reads until the next write
+        self._listing = (version, objects)
+        return list(objects)
+
+    def find(self, attribute, value):
+        """Objects whose indexed attribute equals value, in insertion order"""
+        if value is not None:
+            self._resolve_pending(attribute)
+        entries = []
+        for state in self._snapshot()[1]:
+            bucket = state.indexes[attribute].get(value)
+            if bucket:
+                entries.extend(bucket.values())
+        entries.sort(key=attrgetter('seq'))
+        return [entry.obj for entry in entries if getattr(entry.obj, attribute) == value]
+
+    def put(self, obj, existing_only=False):
+        """Store obj under its ID, keeping its position if the ID exists"""
+        return self._write(
+            self._stripe(obj.id), lambda state: self._put(state, obj, None, existing_only)
+        )
+
+    def put_many(self, objs):
+        """Store several objects, copying each stripe they touch only once"""
+        # Positions are drawn up front so they follow the order of objs
+        by_stripe = {}
+        for obj in objs:
+            by_stripe.setdefault(self._stripe(obj.id), []).append((obj, next(self._sequence)))
+
+        def change(pairs):
+            def apply(state):
+                for obj, seq in pairs:
+                    self._put(state, obj, seq)
+            return apply
+        for stripe, pairs in by_stripe.items():
+            self._write(stripe, change(pairs))
+
+    def _put(self, state, obj, seq=None, existing_only=False):
+        """Store obj in state; a new ID gets position seq, or the next one"""
+        entry = state.objects.get(obj.id)
+        if entry is None and existing_only:
+            return None
+        if entry is not None:
+            self._unindex(state, obj.id, entry)
+            seq = entry.seq
+        elif seq is None:
+            seq = next(self._sequence)
+        values = {}
+        for attribute in self.attributes:
+            if hasattr(obj, attribute) and _hashable(getattr(obj, attribute)):
+                values[attribute] = getattr(obj, attribute)
+        entry = _Entry(seq, obj, values)
+        state.objects[obj.id] = entry
+        for attribute, value in values.items():
+            self._link(state, attribute, value, obj.id, entry)
+        return obj
+
+    def remove(self, obj_id):
+        """Drop the object with this ID and return it, or None"""
+        def change(state):
+            entry = state.objects.pop(obj_id, None)
+            if entry is None:
+                return None
+            self._unindex(state, obj_id, entry)
+            return entry.obj
+        return self._write(self._stripe(obj_id), change)
+
+    def add_index(self, attribute):
+        """Start indexing attribute, including the objects already stored
+
+        Meant for setup time; writes running meanwhile may miss the index.
+        """
+        self.attributes.append(attribute)
+
+        def change(state):
+            state.indexes[attribute] = {}
+            for obj_id, entry in list(state.objects.items()):
+                if hasattr(entry.obj, attribute) and _hashable(getattr(entry.obj, attribute)):
+                    value = getattr(entry.obj, attribute)
+                    entry = state.objects[obj_id] = entry._replace(values={**entry.values, attribute: value})
+                    self._link(state, attribute, value, obj_id, entry)
+        for stripe in self._stripes:
+            self._write(stripe, change)
+
+    def _resolve_pending(self, attribute):
+        """Move objects indexed under None to the value they have now
+
+        Foreign keys assigned through a relationship (e.g. Place.owner) are
+        only filled in on flush, which can happen after the object was stored.
+        """
+        def change(state):
+            index = state.indexes[attribute]
+            for obj_id, entry in list(index.get(None, {}).items()):
+                value = getattr(entry.obj, attribute)
+                if value is not None and _hashable(value):
+                    self._unlink(state, attribute, None, obj_id)
+                    entry = state.objects[obj_id] = entry._replace(values={**entry.values, attribute: value})
+                    self._link(state, attribute, value, obj_id, entry)
+        for stripe in self._stripes:
+            pending = stripe.state.indexes[attribute].get(None)
+            if pending and any(getattr(entry.obj, attribute) is not None for entry in pending.values()):
+                self._write(stripe, change)
+
+    def _stripe(self, obj_id):
+        stripes = self._stripes
+        return stripes[hash(obj_id) % len(stripes)] if len(stripes) > 1 else stripes[0]
+
+    def _write(self, stripe, change):
+        """Apply change to a copy of the stripe's state and publish it"""
+        with stripe.lock:
+            state = stripe.state
+            if self.concurrent:
+                state = _State(dict(state.objects),
+                               {attribute: dict(index) for attribute, index in state.indexes.items()},
+                               set())
+            result = change(state)
+            stripe.state = state
+        if self.concurrent:
+            with self._version_lock:
+                self._version += 1
+        else:
+            self._version += 1
+        return result
+
+    def _snapshot(self):
+        """(version, every stripe's state) as of one moment"""
+        stripes = self._stripes
+        if len(stripes) == 1:
+            return self._version, [stripes[0].state]
+        for _ in range(SNAPSHOT_RETRIES):
+            version = self._version
+            states = [stripe.state for stripe in stripes]
+            if version == self._version:
+                return version, states
+        # Writers kept landing between the two checks; hold them off
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(stripe.lock)
+            return self._version, [stripe.state for stripe in stripes]
+
+    def _unindex(self, state, obj_id, entry):
+        for attribute, value in entry.values.items():
+            self._unlink(state, attribute, value, obj_id)
+
+    def _link(self, state, attribute, value, obj_id, entry):
+        index = state.indexes[attribute]
+        bucket = index.get(value)
+        if bucket is None:
+            bucket = index[value] = {}
+            if state.copied is not None:
+                state.copied.add(id(bucket))
+        else:
+            bucket = index[value] = self._own(state, bucket)
+        bucket[obj_id] = entry
+
+    def _unlink(self, state, attribute, value, obj_id):
+        index = state.indexes[attribute]
+        bucket = index.get(value)
+        if bucket is None or obj_id not in bucket:
+            return
+        if len(bucket) == 1:
+            del index[value]
+            return
+        bucket = index[value] = self._own(state, bucket)
+        del bucket[obj_id]
+
+    def _own(self, state, bucket):
+        """The bucket, copied first if it is still shared with the published state"""
+        if state.copied is None or id(bucket) in state.copied:
+            return bucket
+        bucket = dict(bucket)
+        state.copied.add(id(bucket))
+        return bucket
+
 
 class InMemoryRepository:
-    """In-memory storage for all entities"""
+    """In-memory storage for all entities
+    
+    Declared attributes are kept in hash indexes (value -> {id: object})
+    that add, update and delete maintain, so get_by_attribute on them does
+    not scan every object of the type. Objects changed in place must be
+    passed to update() for the index to follow the new value.
+    
+    With concurrent=True the storage is safe to share between threads:
+    writes lock one stripe of one type and reads never lock (see _Table).
+    """
     
-    def __init__(self):
-        self._storage = {
-            'User': {},
-            'Place': {},
-            'Review': {},
-            'Amenity': {}
+    def __init__(self, indexes=None, concurrent=False, stripes=DEFAULT_STRIPES):
+        self._sequence = itertools.count()
+        self._tables = {
+            obj_type: _Table(attributes, self._sequence, concurrent, stripes)
+            for obj_type, attributes in (DEFAULT_INDEXES if indexes is None else indexes).items()
         }
+        for obj_type in ('User', 'Place', 'Review', 'Amenity'):
+            self._tables.setdefault(obj_type, _Table((), self._sequence, concurrent, stripes))
+        self.concurrent = concurrent
+        self.stripes = stripes
+    
+    def configure(self, concurrent=False, stripes=DEFAULT_STRIPES):
+        """Switch between plain and concurrent mode, keeping stored objects
+        
+        Not meant to run while other threads use the repository.
+        """
+        if concurrent == self.concurrent and (stripes == self.stripes or not concurrent):
+            return
+        tables = {}
+        for obj_type, table in self._tables.items():
+            tables[obj_type] = _Table(table.attributes, self._sequence, concurrent, stripes)
+            tables[obj_type].put_many(table.all())
+        self._tables = tables
+        self.concurrent = concurrent
+        self.stripes = stripes
+    
+    def add_index(self, obj_type, attribute):
+        """Index an attribute of a type, including the objects already stored"""
+        if obj_type not in self._tables:
+            raise ValueError(f"Unknown object type: {obj_type}")
+        if attribute not in self._tables[obj_type].attributes:
+            self._tables[obj_type].add_index(attribute)
     
     def add(self, obj):
         """Add an object to the repository"""
         obj_type = obj.__class__.__name__
-        if obj_type in self._storage:
-            self._storage[obj_type][obj.id] = obj
-            return obj
+        if obj_type in self._tables:
+            if obj.id is None:
+                # Column defaults only fire on flush, which never happens here
+                obj.id = str(uuid.uuid4())
+            return self._tables[obj_type].put(obj)
         raise ValueError(f"Unknown object type: {obj_type}")
     
+    def add_all(self, objs):
+        """Add several objects, copying each stripe they touch only once
+        
+        Adding objects one by one copies a stripe per object in concurrent
+        mode, which makes bulk loads quadratic.
+        """
+        objs = list(objs)
+        by_type = {}
+        for obj in objs:
+            obj_type = obj.__class__.__name__
+            if obj_type not in self._tables:
+                raise ValueError(f"Unknown object type: {obj_type}")
+            by_type.setdefault(obj_type, []).append(obj)
+        for obj_type, objects in by_type.items():
+            for obj in objects:
+                if obj.id is None:
+                    obj.id = str(uuid.uuid4())
+            self._tables[obj_type].put_many(objects)
+        return objs
+    
     def get(self, obj_type, obj_id):
         """Get an object by type and ID"""
-        if obj_type in self._storage:
-            return self._storage[obj_type].get(obj_id)
+        if obj_type in self._tables:
+            return self._tables[obj_type].get(obj_id)
         return None
     
     def get_all(self, obj_type):
         """Get all objects of a specific type"""
-        if obj_type in self._storage:
-            return list(self._storage[obj_type].values())
+        if obj_type in self._tables:
+            return self._tables[obj_type].all()
         return []
     
     def update(self, obj):
         """Update an object in the repository"""
         obj_type = obj.__class__.__name__
-        if obj_type in self._storage and obj.id in self._storage[obj_type]:
-            self._storage[obj_type][obj.id] = obj
-            return obj
+        if obj_type in self._tables:
+            return self._tables[obj_type].put(obj, existing_only=True)
         return None
     
     def delete(self, obj_type, obj_id):
         """Delete an object from the repository"""
-        if obj_type in self._storage and obj_id in self._storage[obj_type]:
-            deleted_obj = self._storage[obj_type].pop(obj_id)
+        if obj_type in self._tables:
+            deleted_obj = self._tables[obj_type].remove(obj_id)
             
             # Handle relationships when deleting
-            if obj_type == 'Review':
+            if deleted_obj is not None and obj_type == 'Review':
                 # Remove review from place and user
                 review = deleted_obj
                 if review.place:
@@ -62,12 +366,22 @@ class InMemoryRepository:
     
     def get_by_attribute(self, obj_type, attribute, value):
         """Get objects by a specific attribute value"""
-        if obj_type in self._storage:
-            return [obj for obj in self._storage[obj_type].values() 
+        if obj_type not in self._tables:
+            return []
+        table = self._tables[obj_type]
+        if attribute not in table.attributes or not _hashable(value):
+            return [obj for obj in table.all()
                    if hasattr(obj, attribute) and getattr(obj, attribute) == value]
-        return []
+        return table.find(attribute, value)
 
 
-# Global repository instance
-in_memory_repo = InMemoryRepository()
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
 
+
+# Global repository instance; create_app applies IN_MEMORY_REPO_* settings
+in_memory_repo = InMemoryRepository()
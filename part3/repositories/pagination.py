@@ -0,0 +1,47 @@
+import base64
+import json
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def clamp_limit(limit) -> int:
+    """Return a page size within the allowed bounds"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError("Limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(created_at: datetime, obj_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor"""
+    payload = json.dumps([created_at.isoformat(), obj_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """Decode an opaque cursor back into a (created_at, id) keyset position"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, obj_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(created_at), str(obj_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_rank_cursor(score: float, rowid: int) -> str:
+    """Encode a (score, rowid) position in a ranked result as an opaque cursor"""
+    payload = json.dumps([score, rowid], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_rank_cursor(cursor: str):
+    """Decode an opaque ranked-result cursor back into a (score, rowid) position"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        score, rowid = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return float(score), int(rowid)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
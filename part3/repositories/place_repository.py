@@ -1,6 +1,17 @@
+from sqlalchemy import and_, or_, func, case
+from sqlalchemy.orm import joinedload, selectinload
 from repositories.sqlalchemy_repository import SQLAlchemyRepository
-from business_logic.models.place import Place
+from repositories.pagination import (
+    encode_cursor, decode_cursor, encode_rank_cursor, decode_rank_cursor
+)
+from repositories.search_repository import PlaceSearchRepository
+from business_logic.models.place import Place, place_amenities, RATINGS
+from business_logic.models.review import Review
+from business_logic.models.amenity import Amenity
+from business_logic.models.user import User
+from business_logic import geohash
 from persistence.database import db
+from persistence import unit_of_work
 
 class PlaceRepository(SQLAlchemyRepository):
     """Place-specific repository"""
@@ -8,6 +19,34 @@ class PlaceRepository(SQLAlchemyRepository):
     def __init__(self):
         super().__init__(Place)
     
+    def relationship_options(self) -> dict:
+        """Load owner, amenities and review IDs in a fixed number of queries"""
+        return {
+            'owner': joinedload(Place.owner).load_only(
+                User.id, User.first_name, User.last_name, User.email
+            ),
+            'amenities': selectinload(Place.amenities).load_only(Amenity.id, Amenity.name),
+            'reviews': selectinload(Place.reviews).load_only(Review.id),
+        }
+    
+    def serialization_options(self, include_reviews: bool = True, fieldset=None) -> list:
+        """Loader options for to_dict(), skipping review IDs for listings"""
+        attributes, relationships = fieldset or (None, None)
+        if relationships is None:
+            relationships = Place.default_relationships(include_reviews)
+        return super().serialization_options((attributes, relationships))
+    
+    def get_modification_times(self, place_id: str):
+        """Get (place updated_at, owner updated_at) without loading the place"""
+        try:
+            return db.session.execute(
+                db.select(Place.updated_at, User.updated_at)
+                .join(User, Place.owner_id == User.id)
+                .where(Place.id == place_id)
+            ).one_or_none()
+        except Exception as e:
+            raise Exception(f"Error getting place modification times: {str(e)}")
+    
     def get_by_owner(self, owner_id: str):
         """Get places by owner"""
         try:
@@ -16,3 +55,191 @@ class PlaceRepository(SQLAlchemyRepository):
             ).scalars().all()
         except Exception as e:
             raise Exception(f"Error getting places by owner: {str(e)}")
+    
+    def get_index_rows(self, since=None):
+        """Get (id, created_at, updated_at) of every place, or of those updated since, in keyset order"""
+        try:
+            stmt = db.select(Place.id, Place.created_at, Place.updated_at)
+            if since is not None:
+                stmt = stmt.where(Place.updated_at >= since)
+            return db.session.execute(stmt.order_by(Place.created_at, Place.id)).all()
+        except Exception as e:
+            raise Exception(f"Error getting place index rows: {str(e)}")
+    
+    def get_amenity_links(self, place_ids=None, chunk_size: int = 500):
+        """Get (place_id, amenity_id) pairs for the given places, or for all of them"""
+        try:
+            stmt = db.select(place_amenities.c.place_id, place_amenities.c.amenity_id)
+            if place_ids is None:
+                return db.session.execute(stmt).all()
+            place_ids = list(place_ids)
+            links = []
+            for start in range(0, len(place_ids), chunk_size):
+                chunk = place_ids[start:start + chunk_size]
+                links.extend(db.session.execute(
+                    stmt.where(place_amenities.c.place_id.in_(chunk))
+                ).all())
+            return links
+        except Exception as e:
+            raise Exception(f"Error getting place amenity links: {str(e)}")
+    
+    def get_page(self, limit: int, cursor: str = None, options=None):
+        """Get one page of places ordered by (created_at, id) and the next cursor"""
+        return self._keyset_page(db.select(Place), limit, cursor, options)
+    
+    def search(self, limit: int, cursor: str = None, min_price: float = None,
+               max_price: float = None, bounds: tuple = None,
+               amenity_ids: list = None, match: tuple = None, place_ids: list = None,
+               options=None):
+        """Get one page of places matching price, bounding box and amenity filters
+        
+        bounds is a (min_lat, max_lat, min_lon, max_lon) tuple. A place must
+        have every amenity in amenity_ids to match; place_ids restricts the
+        search to those candidates. With FTS5 match terms, only matching
+        places are returned, best match first.
+        """
+        stmt = db.select(Place)
+        matches = None
+        if match is not None:
+            filtered = (min_price is not None or max_price is not None
+                        or bounds is not None or amenity_ids or place_ids is not None)
+            if filtered:
+                matches = PlaceSearchRepository().ranked_matches(match)
+            else:
+                # Nothing else to filter on: rank inside the index first
+                after = decode_rank_cursor(cursor) if cursor else None
+                matches = PlaceSearchRepository().ranked_matches(match, limit + 1, after)
+            stmt = stmt.join(matches, matches.c.place_id == Place.id)
+        if min_price is not None:
+            stmt = stmt.where(Place.price >= min_price)
+        if max_price is not None:
+            stmt = stmt.where(Place.price <= max_price)
+        if bounds is not None:
+            min_lat, max_lat, min_lon, max_lon = bounds
+            stmt = stmt.where(
+                Place.latitude.between(min_lat, max_lat),
+                Place.longitude.between(min_lon, max_lon)
+            )
+        if amenity_ids:
+            amenity_ids = set(amenity_ids)
+            matching = (
+                db.select(place_amenities.c.place_id)
+                .where(place_amenities.c.amenity_id.in_(amenity_ids))
+                .group_by(place_amenities.c.place_id)
+                .having(func.count(place_amenities.c.amenity_id) == len(amenity_ids))
+            )
+            stmt = stmt.where(Place.id.in_(matching))
+        if place_ids is not None:
+            stmt = stmt.where(Place.id.in_(place_ids))
+        if matches is not None:
+            return self._ranked_page(stmt, matches.c.score, matches.c.place_key, limit, cursor, options)
+        return self._keyset_page(stmt, limit, cursor, options)
+    
+    def find_within_radius(self, latitude: float, longitude: float, radius_km: float,
+                           limit: int, options=None):
+        """Get the nearest places within radius_km as (place, distance_km) pairs
+        
+        Candidates are pruned to the geohash cells covering the circle using
+        the (geohash, latitude, longitude) index, then checked exactly with
+        the haversine formula before the matching places are loaded.
+        """
+        cells = geohash.covering_cells(latitude, longitude, radius_km)
+        in_cells = or_(*[
+            and_(Place.geohash >= prefix, Place.geohash < prefix + '~')
+            for prefix in cells
+        ])
+        try:
+            candidates = db.session.execute(
+                db.select(Place.id, Place.latitude, Place.longitude).where(in_cells)
+            ).all()
+        except Exception as e:
+            raise Exception(f"Error finding places within radius: {str(e)}")
+        
+        nearest = []
+        for place_id, lat, lon in candidates:
+            distance = geohash.haversine_km(latitude, longitude, lat, lon)
+            if distance <= radius_km:
+                nearest.append((distance, place_id))
+        nearest.sort()
+        nearest = nearest[:limit]
+        if not nearest:
+            return []
+        
+        stmt = db.select(Place).where(Place.id.in_([place_id for _, place_id in nearest]))
+        if options:
+            stmt = stmt.options(*options)
+        try:
+            places = {place.id: place for place in db.session.execute(stmt).scalars()}
+        except Exception as e:
+            raise Exception(f"Error finding places within radius: {str(e)}")
+        return [(places[place_id], distance) for distance, place_id in nearest
+                if place_id in places]
+    
+    def recompute_rating_aggregates(self):
+        """Rebuild every place's rating aggregates from the reviews table
+        
+        Only needed after loading reviews outside ReviewService, e.g. bulk
+        imports or databases created before the aggregates existed.
+        """
+        def aggregate(expression):
+            return (
+                db.select(func.coalesce(expression, 0))
+                .where(Review.place_id == Place.id)
+                .scalar_subquery()
+            )
+        values = {
+            'review_count': aggregate(func.count(Review.id)),
+            'rating_sum': aggregate(func.sum(Review.rating)),
+        }
+        for rating in RATINGS:
+            values[f'rating_count_{rating}'] = aggregate(
+                func.sum(case((Review.rating == rating, 1), else_=0))
+            )
+        try:
+            db.session.execute(db.update(Place).values(**values))
+            unit_of_work.commit()
+        except Exception as e:
+            unit_of_work.rollback()
+            raise Exception(f"Error recomputing rating aggregates: {str(e)}")
+    
+    def _keyset_page(self, stmt, limit: int, cursor: str = None, options=None):
+        """Apply (created_at, id) keyset pagination to a select of places"""
+        stmt = stmt.order_by(Place.created_at, Place.id)
+        if options:
+            stmt = stmt.options(*options)
+        if cursor:
+            stmt = self._after(stmt, *decode_cursor(cursor))
+        try:
+            places = db.session.execute(stmt.limit(limit + 1)).scalars().all()
+        except Exception as e:
+            raise Exception(f"Error getting page of places: {str(e)}")
+        
+        next_cursor = None
+        if len(places) > limit:
+            places = places[:limit]
+            last = places[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return places, next_cursor
+    
+    def _ranked_page(self, stmt, score, rowid, limit: int, cursor: str = None, options=None):
+        """Apply (score, rowid) keyset pagination to a select of places"""
+        stmt = stmt.add_columns(score, rowid).order_by(score, rowid)
+        if options:
+            stmt = stmt.options(*options)
+        if cursor:
+            after_score, after_rowid = decode_rank_cursor(cursor)
+            stmt = stmt.where(or_(
+                score > after_score,
+                and_(score == after_score, rowid > after_rowid)
+            ))
+        try:
+            rows = db.session.execute(stmt.limit(limit + 1)).all()
+        except Exception as e:
+            raise Exception(f"Error searching places: {str(e)}")
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            _, last_score, last_rowid = rows[-1]
+            next_cursor = encode_rank_cursor(last_score, last_rowid)
+        return [place for place, _, _ in rows], next_cursor
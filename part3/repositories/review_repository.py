@@ -1,5 +1,8 @@
+from sqlalchemy.orm import joinedload
 from repositories.sqlalchemy_repository import SQLAlchemyRepository
 from business_logic.models.review import Review
+from business_logic.models.place import Place
+from business_logic.models.user import User
 from persistence.database import db
 
 class ReviewRepository(SQLAlchemyRepository):
@@ -8,12 +11,32 @@ class ReviewRepository(SQLAlchemyRepository):
     def __init__(self):
         super().__init__(Review)
     
-    def get_by_place(self, place_id: str):
-        """Get reviews by place"""
+    def relationship_options(self) -> dict:
+        """Load the place and author alongside each review"""
+        return {
+            'place': joinedload(Review.place).load_only(Place.id, Place.title),
+            'user': joinedload(Review.user).load_only(User.id, User.first_name, User.last_name),
+        }
+    
+    def get_modification_times(self, review_id: str):
+        """Get (review, place, author) updated_at without loading the review"""
         try:
             return db.session.execute(
-                db.select(Review).where(Review.place_id == place_id)
-            ).scalars().all()
+                db.select(Review.updated_at, Place.updated_at, User.updated_at)
+                .join(Place, Review.place_id == Place.id)
+                .join(User, Review.user_id == User.id)
+                .where(Review.id == review_id)
+            ).one_or_none()
+        except Exception as e:
+            raise Exception(f"Error getting review modification times: {str(e)}")
+    
+    def get_by_place(self, place_id: str, options=None):
+        """Get reviews by place"""
+        try:
+            stmt = db.select(Review).where(Review.place_id == place_id)
+            if options:
+                stmt = stmt.options(*options)
+            return db.session.execute(stmt).scalars().all()
         except Exception as e:
             raise Exception(f"Error getting reviews by place: {str(e)}")
     
@@ -26,6 +49,21 @@ class ReviewRepository(SQLAlchemyRepository):
         except Exception as e:
             raise Exception(f"Error getting reviews by user: {str(e)}")
     
+    def get_reviewed_place_ids(self, user_id: str, place_ids) -> set:
+        """Get which of place_ids the user has already reviewed"""
+        place_ids = list(place_ids)
+        if not place_ids:
+            return set()
+        try:
+            return set(db.session.execute(
+                db.select(Review.place_id).where(
+                    Review.user_id == user_id,
+                    Review.place_id.in_(place_ids)
+                )
+            ).scalars().all())
+        except Exception as e:
+            raise Exception(f"Error getting reviewed places: {str(e)}")
+    
     def get_by_user_and_place(self, user_id: str, place_id: str):
         """Check if user has already reviewed a place"""
         try:
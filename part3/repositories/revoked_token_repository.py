@@ -0,0 +1,45 @@
+from datetime import datetime
+from sqlalchemy.exc import SQLAlchemyError
+from business_logic.models.revoked_token import RevokedToken
+from persistence.database import db
+from persistence import unit_of_work
+
+class RevokedTokenRepository:
+    """Repository for revoked JWT identifiers"""
+    
+    def add(self, jti: str, token_type: str, user_id, expires_at: datetime, revoked_at: datetime):
+        """Record a revoked token; revoking it twice is a no-op"""
+        try:
+            if db.session.get(RevokedToken, jti) is None:
+                db.session.add(RevokedToken(
+                    jti=jti, token_type=token_type, user_id=user_id,
+                    expires_at=expires_at, revoked_at=revoked_at
+                ))
+            unit_of_work.commit()
+        except SQLAlchemyError as e:
+            unit_of_work.rollback()
+            raise Exception(f"Error revoking token: {str(e)}")
+    
+    def get_revoked_since(self, since, now: datetime):
+        """Get (jti, expires_at, revoked_at) of unexpired tokens revoked after since"""
+        try:
+            stmt = db.select(
+                RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at
+            ).where(RevokedToken.expires_at > now)
+            if since is not None:
+                stmt = stmt.where(RevokedToken.revoked_at >= since)
+            return db.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            raise Exception(f"Error getting revoked tokens: {str(e)}")
+    
+    def delete_expired(self, now: datetime) -> int:
+        """Delete tokens that have expired, returning how many were removed"""
+        try:
+            result = db.session.execute(
+                db.delete(RevokedToken).where(RevokedToken.expires_at <= now)
+            )
+            unit_of_work.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            unit_of_work.rollback()
+            raise Exception(f"Error deleting expired tokens: {str(e)}")
@@ -0,0 +1,350 @@
+import re
+from sqlalchemy import (
+    Table, Column, Integer, String, MetaData, and_, or_, func, literal, literal_column, text, union_all
+)
+from sqlalchemy.exc import SQLAlchemyError
+from persistence.database import db
+
+# Kept out of the models' metadata so create_all() never tries to build
+# the virtual tables as regular ones
+place_search_keys = Table(
+    'place_search_keys', MetaData(),
+    Column('place_key', Integer),
+    Column('place_id', String),
+)
+
+place_search = Table(
+    'place_search', MetaData(),
+    Column('rowid', Integer),
+    Column('title', String),
+    Column('description', String),
+)
+
+review_search = Table(
+    'review_search', MetaData(),
+    Column('rowid', Integer),
+    Column('text', String),
+)
+
+# A place's document and review rows carry its key in the rowid's upper
+# bits; the low bits number its reviews, so a place holds at most
+# 2**REVIEW_SLOT_BITS review rows
+REVIEW_SLOT_BITS = 20
+
+# bm25() weight per column: title, description
+PLACE_WEIGHTS = (10.0, 4.0)
+
+# Most a place gains per term from matching reviews, approached as more
+# of them match (review hits are counted, not scored with bm25())
+REVIEW_WEIGHT = 1.0
+
+# Words beyond this are ignored
+MAX_QUERY_TERMS = 10
+
+_WORD = re.compile(r'\w+')
+
+_OPTIONS = """
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+"""
+
+_CREATE = [
+    """CREATE TABLE IF NOT EXISTS place_search_keys (
+    place_key INTEGER PRIMARY KEY,
+    place_id VARCHAR(36) NOT NULL UNIQUE)""",
+    """CREATE TABLE IF NOT EXISTS review_search_keys (
+    review_key INTEGER PRIMARY KEY,
+    review_id VARCHAR(36) NOT NULL UNIQUE)""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS place_search USING fts5(
+    title, description,{_OPTIONS})""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS review_search USING fts5(
+    text,{_OPTIONS})""",
+]
+
+_ADD_KEY = "INSERT OR IGNORE INTO place_search_keys (place_id) SELECT id FROM places WHERE id = :place_id"
+
+_GET_KEY = "SELECT place_key FROM place_search_keys WHERE place_id = :place_id"
+
+_DELETE = "DELETE FROM place_search WHERE rowid = :low"
+
+_INSERT = """
+INSERT INTO place_search (rowid, title, description)
+SELECT :low, title, description FROM places WHERE id = :place_id
+"""
+
+# Only runs for places that no longer exist
+_FORGET = [
+    "DELETE FROM review_search WHERE rowid BETWEEN :low AND :high",
+    "DELETE FROM review_search_keys WHERE review_key BETWEEN :low AND :high",
+    "DELETE FROM place_search_keys WHERE place_key = :place_key",
+]
+
+_GET_REVIEW_KEY = "SELECT review_key FROM review_search_keys WHERE review_id = :review_id"
+
+_LAST_REVIEW_KEY = "SELECT max(review_key) FROM review_search_keys WHERE review_key BETWEEN :low AND :high"
+
+_DELETE_REVIEW = [
+    "DELETE FROM review_search WHERE rowid = :review_key",
+    "DELETE FROM review_search_keys WHERE review_key = :review_key",
+]
+
+_INSERT_REVIEW = [
+    """INSERT INTO review_search_keys (review_key, review_id)
+    SELECT :review_key, id FROM reviews WHERE id = :review_id AND place_id = :place_id""",
+    """INSERT INTO review_search (rowid, text)
+    SELECT :review_key, text FROM reviews WHERE id = :review_id AND place_id = :place_id""",
+]
+
+_REBUILD_PLACES = f"""
+INSERT INTO place_search (rowid, title, description)
+SELECT k.place_key << {REVIEW_SLOT_BITS}, p.title, p.description
+FROM place_search_keys k JOIN places p ON p.id = k.place_id
+WHERE k.place_key BETWEEN :first AND :last
+"""
+
+# Slot 0 of each range is the place document's rowid
+_REBUILD_REVIEWS = [
+    f"""INSERT INTO review_search_keys (review_key, review_id)
+    SELECT (place_key << {REVIEW_SLOT_BITS}) + slot, id FROM (
+        SELECT k.place_key, r.id, row_number() OVER (PARTITION BY k.place_key ORDER BY r.id) AS slot
+        FROM place_search_keys k JOIN reviews r ON r.place_id = k.place_id
+        WHERE k.place_key BETWEEN :first AND :last
+    ) WHERE slot < {1 << REVIEW_SLOT_BITS}""",
+    f"""INSERT INTO review_search (rowid, text)
+    SELECT k.review_key, r.text FROM review_search_keys k JOIN reviews r ON r.id = k.review_id
+    WHERE k.review_key BETWEEN :first << {REVIEW_SLOT_BITS} AND ((:last + 1) << {REVIEW_SLOT_BITS}) - 1""",
+]
+
+
+def build_match_terms(query: str):
+    """Turn free text into FTS5 terms, or None if it has no words
+
+    Every word must match; the last one also matches as a prefix so
+    partially typed words find results.
+    """
+    words = _WORD.findall((query or '').lower())[:MAX_QUERY_TERMS]
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return tuple(terms)
+
+
+def _key_range(place_key: int):
+    """(low, high) rowids of a place: its document is low, reviews follow"""
+    low = place_key << REVIEW_SLOT_BITS
+    return low, low + (1 << REVIEW_SLOT_BITS) - 1
+
+
+class PlaceSearchRepository:
+    """SQLite FTS5 index over place titles, descriptions and review text
+
+    Each place gets a dense key in place_search_keys. Its title and
+    description are one document in place_search and each of its reviews
+    is one row in review_search, all with rowids in the place's key range
+    (see _key_range; review_search_keys maps review IDs to theirs), so a
+    review write only touches its own row and queries find a hit's place
+    from its rowid alone. Services reindex the
+    rows they write to inside their unit of work, so the index commits or
+    rolls back with them.
+    """
+
+    def is_available(self) -> bool:
+        """FTS5 is SQLite-only"""
+        return db.engine.dialect.name == 'sqlite'
+
+    def create_index(self):
+        """Create the index tables if they do not exist yet
+
+        A place_search table from before reviews were indexed separately
+        (keyed by a hash of the place ID) is dropped, leaving it to be rebuilt.
+        """
+        if not self.is_available():
+            return
+        try:
+            columns = {row[1] for row in db.session.execute(text("PRAGMA table_info(place_search)"))}
+            if 'place_id' in columns:
+                db.session.execute(text("DROP TABLE place_search"))
+            for statement in _CREATE:
+                db.session.execute(text(statement))
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Error creating search index: {str(e)}")
+
+    def needs_rebuild(self) -> bool:
+        """Whether places exist but the index holds none of them"""
+        if not self.is_available():
+            return False
+        return bool(db.session.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM places) AND NOT EXISTS (SELECT 1 FROM place_search)"
+        )).scalar())
+
+    def reindex(self, place_ids):
+        """Refresh the documents of the given places from the current rows
+
+        Places that no longer exist also lose their review rows. Runs in
+        the caller's transaction; the caller commits.
+        """
+        if not self.is_available():
+            return
+        try:
+            for place_id, place_key in self._keys(place_ids).items():
+                low, high = _key_range(place_key)
+                params = {'place_id': place_id, 'place_key': place_key, 'low': low, 'high': high}
+                db.session.execute(text(_DELETE), params)
+                if not db.session.execute(text(_INSERT), params).rowcount:
+                    for statement in _FORGET:
+                        db.session.execute(text(statement), params)
+        except SQLAlchemyError as e:
+            raise Exception(f"Error updating search index: {str(e)}")
+
+    def reindex_reviews(self, reviews):
+        """Refresh the rows of the given (review_id, place_id) pairs
+
+        Reviews no longer in the table are removed from the index. Runs in
+        the caller's transaction; the caller commits.
+        """
+        if not self.is_available():
+            return
+        reviews = set(reviews)
+        try:
+            keys = self._keys(place_id for _, place_id in reviews)
+            for review_id, place_id in reviews:
+                if place_id not in keys:
+                    continue
+                low, high = _key_range(keys[place_id])
+                params = {'review_id': review_id, 'place_id': place_id, 'low': low, 'high': high}
+                params['review_key'] = db.session.execute(text(_GET_REVIEW_KEY), params).scalar()
+                if params['review_key'] is not None:
+                    for statement in _DELETE_REVIEW:
+                        db.session.execute(text(statement), params)
+                else:
+                    last = db.session.execute(text(_LAST_REVIEW_KEY), params).scalar()
+                    params['review_key'] = (last or low) + 1
+                    if params['review_key'] > high:
+                        raise Exception(f"Place {place_id} has too many reviews to index")
+                for statement in _INSERT_REVIEW:
+                    db.session.execute(text(statement), params)
+        except SQLAlchemyError as e:
+            raise Exception(f"Error updating search index: {str(e)}")
+
+    def _keys(self, place_ids):
+        """{place_id: key} for the given places, assigning keys to new ones
+
+        Places without a key that no longer exist are left out.
+        """
+        keys = {}
+        for place_id in set(place_ids):
+            db.session.execute(text(_ADD_KEY), {'place_id': place_id})
+            place_key = db.session.execute(text(_GET_KEY), {'place_id': place_id}).scalar()
+            if place_key is not None:
+                keys[place_id] = place_key
+        return keys
+
+    def rebuild(self, chunk_size: int = 5000) -> int:
+        """Rebuild the whole index from the places and reviews tables
+
+        Needed after loading rows outside the services, e.g. bulk imports.
+        Places keep their keys. Returns the number of indexed places.
+        """
+        if not self.is_available():
+            return 0
+        self.create_index()
+        select_keys = text(
+            "SELECT place_key FROM place_search_keys WHERE place_key > :after "
+            "ORDER BY place_key LIMIT :limit"
+        )
+        indexed = 0
+        try:
+            db.session.execute(text("DELETE FROM place_search"))
+            db.session.execute(text("DELETE FROM review_search"))
+            db.session.execute(text("DELETE FROM review_search_keys"))
+            db.session.execute(text(
+                "DELETE FROM place_search_keys WHERE place_id NOT IN (SELECT id FROM places)"
+            ))
+            db.session.execute(text(
+                "INSERT OR IGNORE INTO place_search_keys (place_id) SELECT id FROM places ORDER BY id"
+            ))
+            after = 0
+            while True:
+                place_keys = db.session.execute(
+                    select_keys, {'after': after, 'limit': chunk_size}
+                ).scalars().all()
+                if not place_keys:
+                    break
+                params = {'first': place_keys[0], 'last': place_keys[-1]}
+                db.session.execute(text(_REBUILD_PLACES), params)
+                for statement in _REBUILD_REVIEWS:
+                    db.session.execute(text(statement), params)
+                indexed += len(place_keys)
+                after = place_keys[-1]
+            db.session.commit()
+            return indexed
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Error rebuilding search index: {str(e)}")
+
+    def ranked_matches(self, terms, limit: int = None, after=None):
+        """Subquery of (place_id, place_key, score) for places matching every term
+
+        A term matches a place through its own document or any of its
+        reviews. Per term, a place scores its document's bm25() plus up to
+        -REVIEW_WEIGHT for its matching reviews; its score is the sum over
+        terms. Lower scores rank higher; place_key breaks ties. With a
+        limit, only the best matches after the (score, place_key) position
+        are kept, so callers without other filters join a page of places
+        instead of every match. Ranking only reads rowids; place IDs are
+        looked up for the rows kept.
+        """
+        if not self.is_available():
+            raise Exception("Full-text search requires SQLite with FTS5")
+        places = literal_column(place_search.name)
+        reviews = literal_column(review_search.name)
+        hits = []
+        for number, term in enumerate(terms):
+            hits.append(
+                db.select(literal(number).label('term'),
+                          place_search.c.rowid.op('>>')(REVIEW_SLOT_BITS).label('place_key'),
+                          func.bm25(places, *PLACE_WEIGHTS).label('score'),
+                          literal(0).label('reviews'))
+                .where(places.op('MATCH')(term))
+            )
+            hits.append(
+                db.select(literal(number), review_search.c.rowid.op('>>')(REVIEW_SLOT_BITS),
+                          literal(0.0), literal(1))
+                .where(reviews.op('MATCH')(term))
+            )
+        hits = union_all(*hits).subquery('hits')
+        review_count = func.sum(hits.c.reviews)
+        term_hits = (
+            db.select(hits.c.term, hits.c.place_key,
+                      (func.sum(hits.c.score) - REVIEW_WEIGHT * review_count / (review_count + 1.0))
+                      .label('score'))
+            .group_by(hits.c.term, hits.c.place_key)
+            .subquery('term_hits')
+        )
+        ranked = (
+            db.select(term_hits.c.place_key, func.sum(term_hits.c.score).label('score'))
+            .group_by(term_hits.c.place_key)
+            .having(func.count() == len(terms))
+            .subquery('ranked')
+        )
+        if limit is not None:
+            stmt = db.select(ranked.c.place_key, ranked.c.score)
+            if after is not None:
+                after_score, after_key = after
+                stmt = stmt.where(or_(
+                    ranked.c.score > after_score,
+                    and_(ranked.c.score == after_score, ranked.c.place_key > after_key)
+                ))
+            ranked = (
+                stmt.order_by(ranked.c.score, ranked.c.place_key)
+                .limit(limit)
+                .subquery('top_ranked')
+            )
+        return (
+            db.select(place_search_keys.c.place_id, ranked.c.place_key, ranked.c.score)
+            .join_from(ranked, place_search_keys, place_search_keys.c.place_key == ranked.c.place_key)
+            .subquery('matches')
+        )
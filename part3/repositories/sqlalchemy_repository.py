@@ -1,9 +1,15 @@
+from sqlalchemy import and_, or_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
 from persistence.database import db
+from persistence import unit_of_work
 from typing import Optional, List, Any
 
 class SQLAlchemyRepository:
-    """SQLAlchemy-based repository for database persistence"""
+    """SQLAlchemy-based repository for database persistence
+    
+    Writes commit straight away, or only flush inside a unit of work.
+    """
     
     def __init__(self, model_class):
         self.model = model_class
@@ -12,35 +18,94 @@ class SQLAlchemyRepository:
         """Add an object to the database"""
         try:
             db.session.add(obj)
-            db.session.commit()
+            unit_of_work.commit()
             return obj
         except SQLAlchemyError as e:
-            db.session.rollback()
+            unit_of_work.rollback()
             raise Exception(f"Error adding {self.model.__name__}: {str(e)}")
     
-    def get(self, obj_id: str) -> Optional[Any]:
-        """Get an object by ID"""
+    def add_all(self, objs: List[Any]) -> List[Any]:
+        """Add several objects in a single transaction
+        
+        The unit of work batches same-type INSERTs into executemany calls.
+        """
+        try:
+            db.session.add_all(objs)
+            unit_of_work.commit()
+            return objs
+        except SQLAlchemyError as e:
+            unit_of_work.rollback()
+            raise Exception(f"Error adding {self.model.__name__} batch: {str(e)}")
+    
+    def get(self, obj_id: str, options=None) -> Optional[Any]:
+        """Get an object by ID, applying optional loader options"""
         try:
-            return db.session.get(self.model, obj_id)
+            return db.session.get(self.model, obj_id, options=options)
         except SQLAlchemyError as e:
             raise Exception(f"Error getting {self.model.__name__}: {str(e)}")
     
-    def get_all(self) -> List[Any]:
-        """Get all objects of this type"""
+    def get_all(self, options=None) -> List[Any]:
+        """Get all objects of this type, applying optional loader options"""
+        try:
+            stmt = db.select(self.model)
+            if options:
+                stmt = stmt.options(*options)
+            return db.session.execute(stmt).scalars().all()
+        except SQLAlchemyError as e:
+            raise Exception(f"Error getting all {self.model.__name__}: {str(e)}")
+    
+    def iter_chunks(self, chunk_size: int, options=None):
+        """Yield every object as lists of at most chunk_size, in (created_at, id) order
+        
+        Each chunk is its own keyset query, so no cursor or read transaction
+        stays open between chunks. The session's identity map only holds
+        weak references to unmodified objects, so a consumer that drops
+        each chunk keeps memory bounded by the chunk size.
+        """
+        stmt = db.select(self.model).order_by(self.model.created_at, self.model.id)
+        if options:
+            stmt = stmt.options(*options)
+        stmt = stmt.limit(chunk_size)
+        chunk_stmt = stmt
+        while True:
+            try:
+                objs = db.session.execute(chunk_stmt).scalars().all()
+            except SQLAlchemyError as e:
+                raise Exception(f"Error streaming {self.model.__name__}: {str(e)}")
+            if not objs:
+                return
+            last = objs[-1]
+            yield objs
+            if len(objs) < chunk_size:
+                return
+            chunk_stmt = self._after(stmt, last.created_at, last.id)
+    
+    def _after(self, stmt, created_at, obj_id):
+        """Restrict stmt to rows after a (created_at, id) keyset position"""
+        return stmt.where(or_(
+            self.model.created_at > created_at,
+            and_(self.model.created_at == created_at, self.model.id > obj_id)
+        ))
+    
+    def get_many(self, obj_ids) -> List[Any]:
+        """Get the objects whose IDs are in obj_ids with a single query"""
+        obj_ids = list(obj_ids)
+        if not obj_ids:
+            return []
         try:
             return db.session.execute(
-                db.select(self.model)
+                db.select(self.model).where(self.model.id.in_(obj_ids))
             ).scalars().all()
         except SQLAlchemyError as e:
-            raise Exception(f"Error getting all {self.model.__name__}: {str(e)}")
+            raise Exception(f"Error getting {self.model.__name__} batch: {str(e)}")
     
     def update(self, obj) -> Optional[Any]:
         """Update an object in the database"""
         try:
-            db.session.commit()
+            unit_of_work.commit()
             return obj
         except SQLAlchemyError as e:
-            db.session.rollback()
+            unit_of_work.rollback()
             raise Exception(f"Error updating {self.model.__name__}: {str(e)}")
     
     def delete(self, obj_id: str) -> bool:
@@ -49,13 +114,34 @@ class SQLAlchemyRepository:
             obj = self.get(obj_id)
             if obj:
                 db.session.delete(obj)
-                db.session.commit()
+                unit_of_work.commit()
                 return True
             return False
         except SQLAlchemyError as e:
-            db.session.rollback()
+            unit_of_work.rollback()
             raise Exception(f"Error deleting {self.model.__name__}: {str(e)}")
     
+    def relationship_options(self) -> dict:
+        """Loader option for each relationship to_dict() can embed"""
+        return {}
+    
+    def serialization_options(self, fieldset=None) -> list:
+        """Loader options covering what to_dict() reads
+        
+        fieldset is an (attributes, relationships) pair from the model's
+        parse_fieldset(). Only the requested relationships are loaded and,
+        when attributes are given, only the columns they need.
+        """
+        attributes, relationships = fieldset or (None, None)
+        if relationships is None:
+            relationships = self.model.__serialize_relationships__
+        loaders = self.relationship_options()
+        options = [loaders[name] for name in relationships if name in loaders]
+        if attributes is not None:
+            columns = self.model.columns_to_load(attributes, relationships)
+            options.append(load_only(*(getattr(self.model, column) for column in sorted(columns))))
+        return options
+    
     def get_by_attribute(self, attribute: str, value: Any) -> List[Any]:
         """Get objects by a specific attribute value"""
         try:
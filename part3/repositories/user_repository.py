@@ -1,5 +1,8 @@
+from sqlalchemy.orm import selectinload
 from repositories.sqlalchemy_repository import SQLAlchemyRepository
 from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.review import Review
 from persistence.database import db
 
 class UserRepository(SQLAlchemyRepository):
@@ -8,6 +11,32 @@ class UserRepository(SQLAlchemyRepository):
     def __init__(self):
         super().__init__(User)
     
+    def relationship_options(self) -> dict:
+        """Load place and review IDs for a batch of users in two queries"""
+        return {
+            'places': selectinload(User.places).load_only(Place.id),
+            'reviews': selectinload(User.reviews).load_only(Review.id),
+        }
+    
+    def get_modification_times(self, user_id: str):
+        """Get (user updated_at,) without loading the user"""
+        try:
+            return db.session.execute(
+                db.select(User.updated_at).where(User.id == user_id)
+            ).one_or_none()
+        except Exception as e:
+            raise Exception(f"Error getting user modification times: {str(e)}")
+    
+    def get_identity(self, user_id: str):
+        """Get (id, email, first_name, last_name, is_admin) without loading the user"""
+        try:
+            return db.session.execute(
+                db.select(User.id, User.email, User.first_name, User.last_name, User.is_admin)
+                .where(User.id == user_id)
+            ).one_or_none()
+        except Exception as e:
+            raise Exception(f"Error getting user identity: {str(e)}")
+    
     def get_by_email(self, email: str):
         """Get a user by email"""
         try:
@@ -7,6 +7,7 @@ This script starts the HBnB Flask application
 import os
 import sys
 from api.app import create_app
+from scripts.init_db import init_database
 
 def main():
     """Main function to run the application"""
@@ -30,6 +31,11 @@ def main():
         
         # Configuration based on environment
         if env == 'development':
+            # Create tables and seed data so a fresh checkout runs as is;
+            # other environments run `flask --app api.app init-db` once
+            with app.app_context():
+                init_database()
+            
             # Development configuration
             app.run(
                 debug=True,
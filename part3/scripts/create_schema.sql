@@ -20,6 +20,9 @@ CREATE TABLE IF NOT EXISTS users (
 -- Create index on email for faster lookups
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 
+-- Streamed listings walk users in (created_at, id) order
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users(created_at, id);
+
 -- Places table
 CREATE TABLE IF NOT EXISTS places (
     id VARCHAR(60) PRIMARY KEY,
@@ -28,7 +31,15 @@ CREATE TABLE IF NOT EXISTS places (
     price REAL NOT NULL CHECK (price > 0),
     latitude REAL NOT NULL CHECK (latitude >= -90 AND latitude <= 90),
     longitude REAL NOT NULL CHECK (longitude >= -180 AND longitude <= 180),
+    geohash VARCHAR(12),
     owner_id VARCHAR(60) NOT NULL,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count_1 INTEGER NOT NULL DEFAULT 0,
+    rating_count_2 INTEGER NOT NULL DEFAULT 0,
+    rating_count_3 INTEGER NOT NULL DEFAULT 0,
+    rating_count_4 INTEGER NOT NULL DEFAULT 0,
+    rating_count_5 INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
@@ -37,6 +48,19 @@ CREATE TABLE IF NOT EXISTS places (
 -- Create index on owner_id for faster lookups
 CREATE INDEX IF NOT EXISTS idx_places_owner_id ON places(owner_id);
 
+-- Create index on (created_at, id) for keyset pagination
+CREATE INDEX IF NOT EXISTS idx_places_created_at_id ON places(created_at, id);
+
+-- Create indexes for place search filters
+CREATE INDEX IF NOT EXISTS idx_places_price ON places(price);
+CREATE INDEX IF NOT EXISTS idx_places_latitude_longitude ON places(latitude, longitude);
+
+-- Create index on geohash for radius search
+CREATE INDEX IF NOT EXISTS idx_places_geohash ON places(geohash, latitude, longitude);
+
+-- Create index on updated_at for the amenity index sync
+CREATE INDEX IF NOT EXISTS idx_places_updated_at ON places(updated_at);
+
 -- Reviews table
 CREATE TABLE IF NOT EXISTS reviews (
     id VARCHAR(60) PRIMARY KEY,
@@ -55,6 +79,34 @@ CREATE TABLE IF NOT EXISTS reviews (
 CREATE INDEX IF NOT EXISTS idx_reviews_place_id ON reviews(place_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews(user_id);
 
+-- Streamed listings walk reviews in (created_at, id) order
+CREATE INDEX IF NOT EXISTS idx_reviews_created_at_id ON reviews(created_at, id);
+
+-- Full-text search: one document per place and one row per review,
+-- kept in sync by the services. Each place gets a dense key; its document
+-- and review rows have rowids in that key's range (key << 20 onwards)
+CREATE TABLE IF NOT EXISTS place_search_keys (
+    place_key INTEGER PRIMARY KEY,
+    place_id VARCHAR(36) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS review_search_keys (
+    review_key INTEGER PRIMARY KEY,
+    review_id VARCHAR(36) NOT NULL UNIQUE
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS place_search USING fts5(
+    title, description,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS review_search USING fts5(
+    text,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
 -- Amenities table
 CREATE TABLE IF NOT EXISTS amenities (
     id VARCHAR(60) PRIMARY KEY,
@@ -71,4 +123,26 @@ CREATE TABLE IF NOT EXISTS place_amenities (
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
 );
+
+-- Create index for "places with amenity" lookups
+CREATE INDEX IF NOT EXISTS idx_place_amenities_amenity_id ON place_amenities(amenity_id, place_id);
+
+-- Collection change counters used for ETag/Last-Modified validators
+CREATE TABLE IF NOT EXISTS collection_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Revoked JWTs, deleted once the token would have expired anyway
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    jti VARCHAR(36) PRIMARY KEY,
+    token_type VARCHAR(10) NOT NULL,
+    user_id VARCHAR(60),
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_revoked_at ON revoked_tokens(revoked_at);
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires_at ON revoked_tokens(expires_at);
 """
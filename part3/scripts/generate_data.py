@@ -0,0 +1,317 @@
+"""
+Deterministic synthetic dataset for load tests and benchmarks
+
+Generates users, places clustered around a few cities, amenity links and
+reviews whose per-place counts follow a long-tailed distribution, and
+bulk-loads them with executemany. The same seed and volumes always give
+the same rows:
+
+    flask --app api.app seed-synthetic --users 100000 --places 50000 --reviews 10000000
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from operator import itemgetter
+import bcrypt
+import click
+from flask.cli import with_appcontext
+from persistence.database import db
+from business_logic import geohash
+from business_logic.models.user import User
+from business_logic.models.place import Place, RATINGS, place_amenities
+from business_logic.models.review import Review
+from business_logic.models.amenity import Amenity
+from business_logic.collection_version_service import CollectionVersionService
+from repositories.search_repository import PlaceSearchRepository
+
+# Every generated timestamp falls before this instant
+BASE_TIME = datetime(2024, 1, 1)
+
+# Password of every generated user
+PASSWORD = 'password123'
+
+# (latitude, longitude, spread in degrees, share of places)
+CITIES = [
+    (18.4655, -66.1057, 0.08, 0.18),   # San Juan
+    (40.7128, -74.0060, 0.10, 0.16),   # New York
+    (25.7617, -80.1918, 0.12, 0.12),   # Miami
+    (48.8566, 2.3522, 0.06, 0.10),     # Paris
+    (41.3874, 2.1686, 0.05, 0.08),     # Barcelona
+    (19.4326, -99.1332, 0.15, 0.08),   # Mexico City
+    (34.0522, -118.2437, 0.20, 0.08),  # Los Angeles
+    (-34.6037, -58.3816, 0.10, 0.06),  # Buenos Aires
+    (35.6762, 139.6503, 0.12, 0.06),   # Tokyo
+    (51.5072, -0.1276, 0.08, 0.08),    # London
+]
+
+# (amenity name, share of places that have it)
+AMENITIES = [
+    ('WiFi', 0.92), ('Air Conditioning', 0.60), ('Swimming Pool', 0.18),
+    ('Gym', 0.12), ('Parking', 0.48), ('Pet Friendly', 0.22),
+    ('Kitchen', 0.74), ('Washing Machine', 0.41), ('TV', 0.77), ('Balcony', 0.30),
+]
+
+FIRST_NAMES = [
+    'Ana', 'Luis', 'María', 'José', 'Carmen', 'Carlos', 'Sofía', 'Miguel',
+    'Lucía', 'Javier', 'Emma', 'Noah', 'Olivia', 'Liam', 'Mia', 'Lucas',
+    'Chloé', 'Hugo', 'Yuki', 'Kenji',
+]
+
+LAST_NAMES = [
+    'Rivera', 'Rosa', 'Santiago', 'Torres', 'Díaz', 'Ortiz', 'García',
+    'Smith', 'Johnson', 'Brown', 'Martin', 'Bernard', 'López', 'Pérez',
+    'Suzuki', 'Tanaka', 'Silva', 'Costa', 'Evans', 'Walker',
+]
+
+PLACE_KINDS = ['Apartment', 'Loft', 'Studio', 'Cabin', 'Villa', 'Beach House', 'Room', 'Condo']
+
+PLACE_ADJECTIVES = ['Cozy', 'Bright', 'Modern', 'Quiet', 'Charming', 'Spacious', 'Rustic', 'Central']
+
+REVIEW_TEXTS = {
+    1: ['Terrible stay, would not recommend.', 'Dirty and nothing like the photos.'],
+    2: ['Below expectations.', 'Noisy and the host was hard to reach.'],
+    3: ['It was fine for the price.', 'Okay stay, a few issues.'],
+    4: ['Nice place, good location.', 'Comfortable and clean, minor issues.'],
+    5: ['Amazing stay, highly recommended!', 'Perfect place and a great host.'],
+}
+
+
+def _uuid(rng):
+    """Draw a version 4 UUID string from rng (same result as uuid.UUID(int=..., version=4))"""
+    value = rng.getrandbits(128) & _UUID_MASK | _UUID_BITS
+    digits = '%032x' % value
+    return f'{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}'
+
+
+# Version 4 and RFC 4122 variant bits, set without building uuid.UUID objects
+_UUID_MASK = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _before_base(rng, min_days, max_days):
+    """Draw a timestamp between max_days and min_days before BASE_TIME"""
+    return BASE_TIME - timedelta(seconds=rng.uniform(min_days, max_days) * 86400)
+
+
+def _review_counts(rng, places, reviews, cap):
+    """Spread about `reviews` reviews over places, long-tailed and at most cap each"""
+    # Lomax weights: most places get a few reviews, a few get thousands
+    weights = [rng.paretovariate(1.16) - 1 for _ in range(places)]
+    counts = [0.0] * places
+    open_places = range(places)
+    # Hand what the cap cuts off to the places still below it
+    for _ in range(10):
+        remaining = reviews - sum(counts)
+        total = sum(weights[index] for index in open_places)
+        if remaining < 1 or not total:
+            break
+        scale = remaining / total
+        below_cap = []
+        for index in open_places:
+            counts[index] = min(counts[index] + weights[index] * scale, cap)
+            if counts[index] < cap:
+                below_cap.append(index)
+        open_places = below_cap
+    return [int(count + rng.random()) for count in counts]
+
+
+class BulkInserter:
+    """Buffers rows for one table and writes them with executemany
+
+    Rows are tuples in the order of the given columns.
+    """
+
+    def __init__(self, connection, table, columns, batch_size, before_flush=None):
+        self.connection = connection
+        self.columns = columns
+        self.batch_size = batch_size
+        self.before_flush = before_flush
+        self.rows = []
+        self.count = 0
+        compiled = table.insert().compile(dialect=connection.dialect, column_keys=columns)
+        self._sql = str(compiled)
+        if compiled.positional:
+            # The driver takes parameters in statement order
+            self._arrange = itemgetter(*(columns.index(name) for name in compiled.positiontup))
+        else:
+            self._arrange = lambda row: dict(zip(columns, row))
+
+    def add(self, row):
+        """Queue one row, writing the batch once it is full"""
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write the queued rows in the connection's transaction"""
+        if not self.rows:
+            return
+        if self.before_flush is not None:
+            self.before_flush()
+        self.connection.exec_driver_sql(self._sql, list(map(self._arrange, self.rows)))
+        self.count += len(self.rows)
+        self.rows = []
+
+
+def generate_dataset(users, places, reviews, seed=42, batch_size=20000, progress=None):
+    """Bulk-load a synthetic dataset into the current app's primary database
+
+    Returns {table: rows inserted}. Review counts per place follow a
+    long-tailed distribution, so a few places hold most reviews; nobody
+    reviews their own place or the same place twice, and place rating
+    aggregates match the generated reviews.
+    """
+    if places and not users:
+        raise ValueError("Places need at least one user to own them")
+    with db.engine.connect() as connection:
+        sqlite = connection.dialect.name == 'sqlite'
+        if sqlite:
+            # Batches are only worth keeping once the load finishes
+            connection.exec_driver_sql('PRAGMA synchronous=OFF')
+        try:
+            counts = _load(connection, users, places, reviews, seed, batch_size, progress)
+        finally:
+            if sqlite:
+                connection.exec_driver_sql('PRAGMA synchronous=NORMAL')
+    CollectionVersionService.bump('users', 'places', 'reviews', 'amenities', commit=True)
+    # Rows loaded here bypass the services that keep the search index in sync
+    indexed = PlaceSearchRepository().rebuild()
+    if progress is not None:
+        progress(f"search index: {indexed} places")
+    return counts
+
+
+def _load(connection, users, places, reviews, seed, batch_size, progress):
+    """Generate and insert every table's rows on one connection"""
+    rng = random.Random(seed)
+    dialect = connection.dialect
+    # Timestamps go through the dialect's own conversion, as ORM writes do
+    to_db_time = (User.__table__.c.created_at.type.dialect_impl(dialect).bind_processor(dialect)
+                  or (lambda value: value))
+    started = time.perf_counter()
+
+    def report(name, inserter):
+        if progress is not None:
+            elapsed = time.perf_counter() - started
+            progress(f"{name}: {inserter.count} rows ({elapsed:.1f}s)")
+
+    # Amenities, reusing rows that already exist by name
+    amenity_ids = dict(connection.execute(db.select(Amenity.name, Amenity.id)).all())
+    amenity_table = Amenity.__table__
+    inserter = BulkInserter(connection, amenity_table, ['id', 'name', 'created_at', 'updated_at'], batch_size)
+    for name, _ in AMENITIES:
+        amenity_id = _uuid(rng)
+        if name not in amenity_ids:
+            amenity_ids[name] = amenity_id
+            created = to_db_time(_before_base(rng, 1000, 1100))
+            inserter.add((amenity_id, name, created, created))
+    inserter.flush()
+    amenity_count = inserter.count
+    amenity_shares = [(amenity_ids[name], share) for name, share in AMENITIES]
+
+    # Users; bcrypt with a salt derived from the seed keeps the hash stable
+    # (bcrypt's base64 leaves only four valid values for the last character)
+    alphabet = './ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+    salt = '$2b$04$' + ''.join(rng.choice(alphabet) for _ in range(21)) + rng.choice('.Oeu')
+    salt = salt.encode('ascii')
+    password = bcrypt.hashpw(PASSWORD.encode('utf-8'), salt).decode('utf-8')
+    user_columns = ['id', 'first_name', 'last_name', 'email', 'password', 'is_admin', 'created_at', 'updated_at']
+    inserter = BulkInserter(connection, User.__table__, user_columns, batch_size)
+    user_ids = []
+    for index in range(users):
+        user_id = _uuid(rng)
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        email = f'user{seed}.{index}@example.com'
+        created = to_db_time(_before_base(rng, 365, 3 * 365))
+        user_ids.append(user_id)
+        inserter.add((user_id, first_name, last_name, email, password, False, created, created))
+    inserter.flush()
+    connection.commit()
+    report('users', inserter)
+    user_count = inserter.count
+
+    # Places, their amenity links and their reviews
+    rating_columns = ['review_count', 'rating_sum'] + [f'rating_count_{rating}' for rating in RATINGS]
+    place_columns = ['id', 'title', 'description', 'price', 'latitude', 'longitude', 'geohash',
+                     'owner_id', *rating_columns, 'created_at', 'updated_at']
+    places_out = BulkInserter(connection, Place.__table__, place_columns, batch_size)
+    links_out = BulkInserter(connection, place_amenities, ['place_id', 'amenity_id'], batch_size,
+                             before_flush=places_out.flush)
+    review_columns = ['id', 'text', 'rating', 'place_id', 'user_id', 'created_at', 'updated_at']
+    reviews_out = BulkInserter(connection, Review.__table__, review_columns, batch_size,
+                               before_flush=places_out.flush)
+
+    # Nobody reviews their own place, so a place has at most users - 1 reviews
+    review_counts = _review_counts(rng, places, reviews, max(len(user_ids) - 1, 0))
+    city_weights = [city[3] for city in CITIES]
+    batches_done = 0
+    for index in range(places):
+        place_id = _uuid(rng)
+        latitude, longitude, spread, _ = rng.choices(CITIES, city_weights)[0]
+        latitude = min(max(rng.gauss(latitude, spread), -90.0), 90.0)
+        longitude = min(max(rng.gauss(longitude, spread), -180.0), 180.0)
+        owner_index = int(len(user_ids) * rng.random() ** 3)
+        owner_id = user_ids[owner_index]
+        title = f'{rng.choice(PLACE_ADJECTIVES)} {rng.choice(PLACE_KINDS)} #{index}'
+        price = round(min(rng.lognormvariate(4.5, 0.6), 10000.0), 2)
+        place_created = _before_base(rng, 30, 720)
+
+        for amenity_id, share in amenity_shares:
+            if rng.random() < share:
+                links_out.add((place_id, amenity_id))
+
+        count = review_counts[index]
+        quality = rng.gauss(4.1, 0.6)
+        histogram = dict.fromkeys(RATINGS, 0)
+        reviewers = rng.sample(range(len(user_ids)), count + 1) if count else []
+        if owner_index in reviewers:
+            reviewers.remove(owner_index)
+        age = (BASE_TIME - place_created).total_seconds()
+        for reviewer in reviewers[:count]:
+            rating = min(max(round(rng.gauss(quality, 0.9)), 1), 5)
+            histogram[rating] += 1
+            created = to_db_time(place_created + timedelta(seconds=rng.random() * age))
+            reviews_out.add((_uuid(rng), rng.choice(REVIEW_TEXTS[rating]), rating,
+                             place_id, user_ids[reviewer], created, created))
+
+        rating_sum = sum(rating * histogram[rating] for rating in RATINGS)
+        created = to_db_time(place_created)
+        places_out.add((place_id, title, f'{title} near the city centre.', price, latitude, longitude,
+                        geohash.encode(latitude, longitude), owner_id, count, rating_sum,
+                        *(histogram[rating] for rating in RATINGS), created, created))
+
+        if reviews_out.count // batch_size > batches_done:
+            batches_done = reviews_out.count // batch_size
+            connection.commit()
+            report('reviews', reviews_out)
+
+    places_out.flush()
+    links_out.flush()
+    reviews_out.flush()
+    connection.commit()
+    report('places', places_out)
+    report('reviews', reviews_out)
+    return {
+        'amenities': amenity_count,
+        'users': user_count,
+        'places': places_out.count,
+        'place_amenities': links_out.count,
+        'reviews': reviews_out.count,
+    }
+
+
+@click.command('seed-synthetic')
+@click.option('--users', default=10000, show_default=True, help='Users to create')
+@click.option('--places', default=5000, show_default=True, help='Places to create')
+@click.option('--reviews', default=100000, show_default=True, help='Approximate number of reviews')
+@click.option('--seed', default=42, show_default=True, help='Random seed')
+@click.option('--batch-size', default=20000, show_default=True, help='Rows per executemany')
+@with_appcontext
+def seed_synthetic_command(users, places, reviews, seed, batch_size):
+    """Bulk-load a deterministic synthetic dataset (run `init-db` first)"""
+    started = time.perf_counter()
+    counts = generate_dataset(users, places, reviews, seed, batch_size, progress=click.echo)
+    elapsed = time.perf_counter() - started
+    click.echo(f"✅ Loaded {', '.join(f'{count} {name}' for name, count in counts.items())} in {elapsed:.1f}s")
@@ -1,10 +1,20 @@
 import uuid
+import click
 from datetime import datetime
-from persistence.database import db
+from flask.cli import with_appcontext
+from persistence.database import db, pin_to_primary, REPLICA_BIND
+from persistence.replica import refresh_sqlite_replica
+from repositories.search_repository import PlaceSearchRepository
+from repositories.revoked_token_repository import RevokedTokenRepository
 from business_logic.models.user import User
 from business_logic.models.amenity import Amenity
+from business_logic import geohash
 from flask import current_app
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+# Places whose geohash is filled in per statement when upgrading
+GEOHASH_CHUNK_SIZE = 1000
 
 def create_initial_data():
     """Create initial data for the database"""
@@ -58,13 +68,14 @@ def create_initial_data():
             "Balcony"
         ]
         
+        # One query for the amenities that already exist
+        existing_names = set(db.session.execute(
+            db.select(Amenity.name).where(Amenity.name.in_(basic_amenities))
+        ).scalars())
+        
         amenities_created = 0
         for amenity_name in basic_amenities:
-            existing_amenity = db.session.execute(
-                db.select(Amenity).where(Amenity.name == amenity_name)
-            ).scalar_one_or_none()
-            
-            if not existing_amenity:
+            if amenity_name not in existing_names:
                 amenity = Amenity(name=amenity_name)
                 db.session.add(amenity)
                 amenities_created += 1
@@ -82,3 +93,115 @@ def create_initial_data():
         print(f"❌ Error creating initial data: {e}")
         # Don't re-raise the exception to prevent app startup failure
         return
+
+
+def upgrade_schema():
+    """Add the columns and indexes of existing tables that the models gained later
+    
+    create_all() only creates missing tables, so a database built by an
+    older version keeps its old columns. Safe to run on every start.
+    """
+    inspector = inspect(db.engine)
+    added = set()
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column_ddl}'))
+                    added.add(f'{table.name}.{column.name}')
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+    if added:
+        print(f"✅ Added columns: {', '.join(sorted(added))}")
+    
+    # Columns derived from other data are filled in for existing rows
+    from business_logic.models.place import Place, RATING_COLUMNS
+    from repositories.place_repository import PlaceRepository
+    fill_geohashes(Place)
+    if any(f'places.{column}' in added for column in RATING_COLUMNS):
+        PlaceRepository().recompute_rating_aggregates()
+        print("✅ Rating aggregates recomputed")
+
+
+def fill_geohashes(Place):
+    """Compute the geohash of places stored before the column existed"""
+    filled = 0
+    while True:
+        rows = db.session.execute(
+            db.select(Place.id, Place.latitude, Place.longitude)
+            .where(Place.geohash.is_(None))
+            .limit(GEOHASH_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            break
+        # Plain SQL so updated_at keeps its value
+        db.session.execute(text("UPDATE places SET geohash = :geohash WHERE id = :id"), [
+            {'id': place_id, 'geohash': geohash.encode(latitude, longitude)}
+            for place_id, latitude, longitude in rows
+        ])
+        db.session.commit()
+        filled += len(rows)
+    if filled:
+        print(f"✅ Geohash filled for {filled} places")
+
+
+def init_database():
+    """Create missing tables, seed initial data and seed a SQLite replica"""
+    # The replica is only seeded once the primary is ready
+    pin_to_primary()
+    
+    # CRITICAL: Import all models BEFORE creating tables
+    # This ensures SQLAlchemy knows about all tables to create
+    from business_logic.models.user import User
+    from business_logic.models.place import Place
+    from business_logic.models.review import Review
+    from business_logic.models.amenity import Amenity
+    from business_logic.models.collection_version import CollectionVersion
+    from business_logic.models.revoked_token import RevokedToken
+    
+    print("🔧 Creating database tables...")
+    # Only on the primary; a replica gets its schema from the primary
+    db.create_all(bind_key=None)
+    upgrade_schema()
+    search_repository = PlaceSearchRepository()
+    search_repository.create_index()
+    if search_repository.needs_rebuild():
+        # Places stored before the index existed (or changed shape)
+        print(f"✅ Search index built for {search_repository.rebuild()} places")
+    print("✅ Database tables created successfully")
+    
+    print("🔧 Creating initial data...")
+    create_initial_data()
+    
+    replica = db.engines.get(REPLICA_BIND)
+    if replica is not None and replica.dialect.name == 'sqlite':
+        refresh_sqlite_replica(db.engine, replica)
+        print("✅ Replica refreshed")
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create the database tables and seed initial data"""
+    init_database()
+
+
+@click.command('rebuild-search-index')
+@with_appcontext
+def rebuild_search_index_command():
+    """Rebuild the place search index from the places and reviews tables"""
+    pin_to_primary()
+    indexed = PlaceSearchRepository().rebuild()
+    click.echo(f"✅ Indexed {indexed} places")
+
+
+@click.command('prune-revoked-tokens')
+@with_appcontext
+def prune_revoked_tokens_command():
+    """Delete revoked tokens that have expired anyway"""
+    deleted = RevokedTokenRepository().delete_expired(datetime.utcnow())
+    click.echo(f"✅ Deleted {deleted} expired revoked tokens")
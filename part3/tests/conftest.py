@@ -0,0 +1,15 @@
+import pytest
+from api.app import create_app
+
+
+@pytest.fixture
+def app():
+    """Create a test app with an application context"""
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
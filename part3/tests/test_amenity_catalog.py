@@ -0,0 +1,72 @@
+import uuid
+import pytest
+from business_logic.amenity_facade import amenity_facade
+from business_logic.amenity_catalog import AmenityCatalog, amenity_catalog
+from business_logic.models.amenity import Amenity
+
+
+def unique_name(prefix):
+    """Amenities live in the process-wide in-memory repository, so names must not repeat"""
+    return f'{prefix} {uuid.uuid4().hex[:8]}'
+
+
+def test_loads_once_and_serves_from_memory():
+    """Test lookups by ID, by name and by list share one load"""
+    wifi, pool = Amenity('WiFi'), Amenity('Pool')
+    wifi.id, pool.id = 'wifi', 'pool'
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [wifi, pool]
+
+    catalog = AmenityCatalog(loader)
+    assert catalog.get('wifi') is wifi
+    assert catalog.get_by_name('Pool') is pool
+    assert catalog.get_many(['pool', 'missing', 'wifi']) == [pool, wifi]
+    assert catalog.get('missing') is None
+    assert len(calls) == 1
+    assert catalog.stats()['amenities'] == 2
+
+
+def test_invalidate_reloads():
+    """Test the next lookup after an invalidation reads the catalog again"""
+    amenities = []
+    catalog = AmenityCatalog(lambda: list(amenities))
+    assert catalog.get_by_name('Sauna') is None
+    sauna = Amenity('Sauna')
+    sauna.id = 'sauna'
+    amenities.append(sauna)
+    assert catalog.get_by_name('Sauna') is None
+    catalog.invalidate()
+    assert catalog.get_by_name('Sauna') is sauna
+    assert catalog.stats()['loads'] == 2
+
+
+def test_invalidation_during_load_is_not_cached():
+    """Test a load that raced with an invalidation is not published"""
+    catalog = AmenityCatalog()
+
+    def loader():
+        catalog.invalidate()
+        return []
+
+    catalog.configure(loader)
+    catalog.get('anything')
+    assert catalog.stats()['loaded'] is False
+
+
+def test_service_writes_invalidate(app):
+    """Test created and renamed amenities are visible to the next lookup"""
+    name = unique_name('Catalog Gym')
+    amenity = amenity_facade.create_amenity({'name': name})
+    assert amenity_facade.get_amenity(amenity.id) is amenity
+
+    with pytest.raises(ValueError):
+        amenity_facade.create_amenity({'name': name})
+
+    renamed = unique_name('Catalog Spa')
+    amenity_facade.update_amenity(amenity.id, {'name': renamed})
+    assert amenity_catalog.get_by_name(renamed) is amenity
+    assert amenity_catalog.get_by_name(name) is None
+    assert amenity_catalog.stats()['invalidations'] == 2
@@ -0,0 +1,169 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place, place_amenities
+from business_logic.models.amenity import Amenity
+from business_logic.place_facade import place_facade
+from business_logic.amenity_index import amenity_index
+from business_logic import place_service
+from repositories.place_repository import PlaceRepository
+
+
+@pytest.fixture
+def catalog(app):
+    """Create places with different amenity sets, one commit each so they are ordered"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    wifi = Amenity('Index WiFi')
+    pool = Amenity('Index Pool')
+    gym = Amenity('Index Gym')
+    db.session.add_all([owner, wifi, pool, gym])
+    db.session.commit()
+
+    def place(title, price, *amenities):
+        place = Place(title, '', price, 18.0, -66.0, owner)
+        place.amenities.extend(amenities)
+        db.session.add(place)
+        db.session.commit()
+        return place
+    places = [
+        place('Both', 50.0, wifi, pool),
+        place('WiFi only', 60.0, wifi),
+        place('Everything', 70.0, wifi, pool, gym),
+        place('Nothing', 80.0),
+        place('Both pricey', 500.0, wifi, pool),
+    ]
+    return {'owner': owner, 'places': places, 'wifi': wifi, 'pool': pool, 'gym': gym}
+
+
+def search(*amenities, **filters):
+    filters['amenities'] = [amenity.id for amenity in amenities]
+    places, _ = place_facade.search_places(filters)
+    return [place.title for place in places]
+
+
+def test_filters_by_every_amenity(catalog):
+    """Test places need every requested amenity, in creation order"""
+    assert search(catalog['wifi'], catalog['pool']) == ['Both', 'Everything', 'Both pricey']
+    assert search(catalog['gym']) == ['Everything']
+    assert search(catalog['wifi'], catalog['pool'], max_price=100.0) == ['Both', 'Everything']
+
+
+def test_filtered_page_skips_join_table(catalog):
+    """Test a loaded index answers amenity filters without reading place_amenities"""
+    search(catalog['wifi'])
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        assert search(catalog['pool'], max_price=100.0) == ['Both', 'Everything']
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert statements
+    assert not any('FROM place_amenities' in statement for statement in statements)
+
+
+def test_pages_follow_cursor(catalog):
+    """Test cursors continue after the last place of the previous page"""
+    filters = {'amenities': [catalog['wifi'].id]}
+    first, cursor = place_facade.search_places(filters, limit=2)
+    second, cursor = place_facade.search_places(filters, limit=2, cursor=cursor)
+    titles = [place.title for place in first + second]
+    assert titles == ['Both', 'WiFi only', 'Everything', 'Both pricey']
+    assert cursor is None
+
+
+def test_service_writes_update_index(catalog):
+    """Test places created or updated through the service are reflected straight away"""
+    search(catalog['gym'])
+    everything = catalog['places'][2]
+    place_facade.update_place(everything.id, {'amenities': []})
+    assert search(catalog['gym']) == []
+    place_facade.create_place({
+        'title': 'New', 'price': 10.0, 'latitude': 18.0, 'longitude': -66.0,
+        'owner_id': catalog['owner'].id
+    })
+    stats = amenity_index.stats()
+    assert stats['places'] == 6
+    assert stats['loads'] == 1
+
+
+def test_unknown_amenity_matches_nothing(catalog):
+    """Test an amenity no place has returns an empty page"""
+    places, cursor = place_facade.search_places({'amenities': ['missing']})
+    assert places == [] and cursor is None
+
+
+def test_sync_picks_up_other_writers(catalog):
+    """Test places changed outside this process are reloaded on sync"""
+    search(catalog['gym'])
+    nothing = catalog['places'][3]
+    # Another process links the gym and touches the place
+    db.session.execute(place_amenities.insert().values(place_id=nothing.id, amenity_id=catalog['gym'].id))
+    nothing.updated_at = datetime.utcnow()
+    db.session.commit()
+    assert search(catalog['gym']) == ['Everything']
+    amenity_index.sync()
+    assert search(catalog['gym']) == ['Everything', 'Nothing']
+
+
+def test_queries_run_without_the_lock(catalog, monkeypatch):
+    """Test loads and syncs only take the lock after their SQL has run"""
+    held = []
+    get_index_rows = PlaceRepository.get_index_rows
+    get_amenity_links = PlaceRepository.get_amenity_links
+
+    def index_rows(self, *args):
+        held.append(amenity_index._lock.locked())
+        return get_index_rows(self, *args)
+
+    def amenity_links(self, *args):
+        held.append(amenity_index._lock.locked())
+        return get_amenity_links(self, *args)
+
+    monkeypatch.setattr(PlaceRepository, 'get_index_rows', index_rows)
+    monkeypatch.setattr(PlaceRepository, 'get_amenity_links', amenity_links)
+    assert search(catalog['gym']) == ['Everything']
+    amenity_index.sync()
+    assert held == [False] * 4
+
+
+def count_join_queries(run):
+    """Run a search, returning its result and how many statements read place_amenities"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        result = run()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return result, sum('FROM place_amenities' in statement for statement in statements)
+
+
+def test_selective_filters_fall_back_to_join(catalog, monkeypatch):
+    """Test a page the index cannot fill within its candidate cap is finished in SQL"""
+    search(catalog['wifi'])
+    monkeypatch.setattr(place_service, 'MAX_INDEX_CANDIDATES', 2)
+    filters = {'amenities': [catalog['wifi'].id], 'min_price': 400.0}
+    (places, cursor), joins = count_join_queries(
+        lambda: place_facade.search_places(filters, limit=1)
+    )
+    assert [place.title for place in places] == ['Both pricey']
+    assert cursor is None
+    assert joins == 1
+
+
+def test_sparse_amenities_fall_back_to_join(catalog, monkeypatch):
+    """Test a scan that hits its limit before filling the page is finished in SQL"""
+    search(catalog['gym'])
+    monkeypatch.setattr(place_service, 'MAX_INDEX_SCAN', 2)
+    assert search(catalog['gym']) == ['Everything']
+    keys, resume = amenity_index.matching(amenity_index.mask([catalog['gym'].id]), scan=2)
+    assert keys == [] and resume[1] == catalog['places'][1].id
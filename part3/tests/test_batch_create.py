@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.review import Review
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+from business_logic.amenity_facade import amenity_facade
+from business_logic.batch import MAX_BATCH_SIZE, batch_status
+
+
+@pytest.fixture
+def owner(app):
+    user = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def guest(app):
+    user = User('Guest', 'User', 'guest@example.com', 'password123')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def place_data(i):
+    return {'title': f'Place {i}', 'price': 50.0 + i, 'latitude': 18.0, 'longitude': -66.0}
+
+
+def test_create_places_reports_each_item(owner):
+    """Test valid items are created and invalid ones reported by index"""
+    items = [place_data(0), {'title': 'Bad', 'price': -1, 'latitude': 0, 'longitude': 0},
+             'not an object', place_data(1)]
+    places, results = place_facade.create_places(items, owner.id)
+    assert len(places) == 2
+    assert [result['status'] for result in results] == ['created', 'error', 'error', 'created']
+    assert results[0]['id'] == places[0].id
+    assert results[2]['error'] == 'Item must be a JSON object'
+    assert db.session.query(Place).count() == 2
+    assert batch_status(results) == 207
+
+
+def test_create_places_uses_batched_inserts(owner):
+    """Test a batch is written with one commit and batched INSERTs"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT INTO places'):
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        places, _ = place_facade.create_places([place_data(i) for i in range(200)], owner.id)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert len(places) == 200
+    assert len(statements) < 10
+
+
+def test_batch_size_is_limited(owner):
+    """Test oversized, empty and non-list bodies are rejected outright"""
+    with pytest.raises(ValueError):
+        place_facade.create_places([place_data(0)] * (MAX_BATCH_SIZE + 1), owner.id)
+    with pytest.raises(ValueError):
+        place_facade.create_places([], owner.id)
+    with pytest.raises(ValueError):
+        place_facade.create_places({'title': 'x'}, owner.id)
+
+
+def test_create_reviews_updates_aggregates(owner, guest):
+    """Test batch reviews validate per item and keep rating aggregates exact"""
+    places, _ = place_facade.create_places([place_data(0), place_data(1)], owner.id)
+    first, second = places
+    items = [
+        {'text': 'Great', 'rating': 5, 'place_id': first.id},
+        {'text': 'Again', 'rating': 4, 'place_id': first.id},
+        {'text': 'Fine', 'rating': 3, 'place_id': second.id},
+        {'text': 'Bad rating', 'rating': 9, 'place_id': second.id},
+        {'text': 'Nowhere', 'rating': 3, 'place_id': 'missing'},
+    ]
+    reviews, results = review_facade.create_reviews(items, guest.id)
+    assert len(reviews) == 2
+    assert [result['status'] for result in results] == ['created', 'error', 'created', 'error', 'error']
+    assert results[1]['error'] == 'You have already reviewed this place'
+    assert results[4]['error'] == 'Place not found'
+    db.session.expire_all()
+    assert first.rating_summary()['rating_histogram']['5'] == 1
+    assert second.rating_summary()['review_count'] == 1
+    assert db.session.query(Review).count() == 2
+
+
+def test_owner_cannot_batch_review_own_place(owner):
+    """Test the ownership rule applies to batch reviews"""
+    places, _ = place_facade.create_places([place_data(0)], owner.id)
+    reviews, results = review_facade.create_reviews(
+        [{'text': 'Mine', 'rating': 5, 'place_id': places[0].id}], owner.id
+    )
+    assert reviews == []
+    assert batch_status(results) == 400
+
+
+def test_create_amenities_rejects_duplicates(app):
+    """Test names must be unique within the batch and against existing ones"""
+    amenity_facade.create_amenity({'name': 'Batch Sauna'})
+    amenities, results = amenity_facade.create_amenities(
+        [{'name': 'Batch Gym'}, {'name': 'Batch Gym '}, {'name': 'Batch Sauna'}, {'name': ''}]
+    )
+    assert [amenity.name for amenity in amenities] == ['Batch Gym']
+    assert [result['status'] for result in results] == ['created', 'error', 'error', 'error']
+
+
+def test_batch_endpoint_requires_auth(app):
+    """Test the batch endpoints are protected"""
+    client = app.test_client()
+    response = client.post('/api/v1/places/batch', json=[place_data(0)])
+    assert response.status_code == 401
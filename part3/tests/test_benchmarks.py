@@ -0,0 +1,28 @@
+from benchmarks import micro
+
+
+def result(median_us):
+    return {'median_us': median_us}
+
+
+def test_compare_flags_regressions_over_threshold():
+    """Test only medians slower than the threshold count as regressions"""
+    baseline = {'results': {'a': result(100.0), 'b': result(100.0), 'c': result(100.0)}}
+    current = {'results': {'a': result(119.0), 'b': result(130.0), 'c': result(50.0), 'd': result(10.0)}}
+    rows, regressions = micro.compare(current, baseline, 0.2)
+    assert regressions == ['b']
+    assert ('d', None, 10.0, None) in rows
+
+
+def test_suite_runs_and_reports(monkeypatch):
+    """Test a tiny run produces statistics for every selected benchmark"""
+    monkeypatch.setitem(micro.SIZES, 'tiny', (20, 5, 40))
+    document = micro.run_suite('tiny', calls=3, warmup=1, selected=['repository.', 'jwt.issue'])
+    assert document['meta']['dataset'] == {'users': 20, 'places': 5, 'reviews': 40, 'seed': micro.SEED}
+    names = set(document['results'])
+    assert 'repository.get_by_user_and_place' in names
+    assert 'jwt.issue' in names
+    assert not any(name.startswith('serialize.') for name in names)
+    for stats in document['results'].values():
+        assert stats['calls'] == 3
+        assert 0 < stats['min_us'] <= stats['median_us']
@@ -0,0 +1,30 @@
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.collection_version_service import CollectionVersionService
+from repositories.collection_version_repository import CollectionVersionRepository
+
+
+def test_bump_creates_then_increments(app):
+    """Test the first bump creates the counter and later ones increment it"""
+    CollectionVersionService.bump('widgets', commit=True)
+    CollectionVersionService.bump('widgets', 'gadgets', commit=True)
+    versions = CollectionVersionRepository().get_versions(['widgets', 'gadgets'])
+    assert versions['widgets'][0] == 2
+    assert versions['gadgets'][0] == 1
+
+
+def test_bump_is_a_single_upsert(app):
+    """Test a bump never runs a separate INSERT that a concurrent first write could race"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        CollectionVersionService.bump('widgets', commit=True)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    writes = [statement for statement in statements if 'collection_versions' in statement]
+    assert len(writes) == 1
+    assert 'ON CONFLICT' in writes[0]
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+from business_logic.user_facade import user_facade
+
+
+@pytest.fixture
+def place(app):
+    """Create a place through the service layer"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    db.session.commit()
+    return place_facade.create_place({
+        'title': 'Beach House', 'price': 100.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+
+
+def test_detail_returns_304_for_matching_etag(client, place):
+    """Test a repeated request with If-None-Match gets an empty 304"""
+    first = client.get(f'/api/v1/places/{place.id}')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert etag.startswith('W/"')
+    assert first.headers['Last-Modified']
+
+    second = client.get(f'/api/v1/places/{place.id}', headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == etag
+
+
+def test_detail_304_skips_serialization_queries(app, client, place):
+    """Test the 304 path runs only the validator lookups"""
+    etag = client.get(f'/api/v1/places/{place.id}').headers['ETag']
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(f'/api/v1/places/{place.id}', headers={'If-None-Match': etag})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 304
+    assert len(statements) == 2
+    assert not any('FROM reviews' in statement for statement in statements)
+
+
+def test_detail_etag_changes_after_update(client, place):
+    """Test updating the place invalidates its ETag"""
+    etag = client.get(f'/api/v1/places/{place.id}').headers['ETag']
+    place_facade.update_place(place.id, {'title': 'Mountain Cabin'})
+    response = client.get(f'/api/v1/places/{place.id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_detail_etag_changes_after_owner_update(client, place):
+    """Test renaming the owner invalidates the place's ETag"""
+    etag = client.get(f'/api/v1/places/{place.id}').headers['ETag']
+    user_facade.update_user(place.owner_id, {'first_name': 'Renamed'})
+    response = client.get(f'/api/v1/places/{place.id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_if_modified_since(client, place):
+    """Test If-Modified-Since is honoured when no ETag is sent"""
+    last_modified = client.get(f'/api/v1/places/{place.id}').headers['Last-Modified']
+    response = client.get(f'/api/v1/places/{place.id}',
+                          headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+    response = client.get(f'/api/v1/places/{place.id}',
+                          headers={'If-Modified-Since': 'Mon, 01 Jan 2001 00:00:00 GMT'})
+    assert response.status_code == 200
+
+
+def test_missing_place_is_404(client):
+    """Test the validator lookup still reports missing places"""
+    response = client.get('/api/v1/places/missing', headers={'If-None-Match': '*'})
+    assert response.status_code == 404
+
+
+def test_list_etag_changes_after_review(client, place):
+    """Test a new review invalidates place and review listings"""
+    places_etag = client.get('/api/v1/places/').headers['ETag']
+    reviews_etag = client.get('/api/v1/reviews/').headers['ETag']
+    assert client.get('/api/v1/places/', headers={'If-None-Match': places_etag}).status_code == 304
+
+    guest = User('Guest', 'User', 'guest@example.com', 'password123')
+    db.session.add(guest)
+    db.session.commit()
+    review_facade.create_review({
+        'text': 'Lovely', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    assert client.get('/api/v1/places/', headers={'If-None-Match': places_etag}).status_code == 200
+    assert client.get('/api/v1/reviews/', headers={'If-None-Match': reviews_etag}).status_code == 200
+
+
+def test_list_etag_depends_on_query(client, place):
+    """Test different pages of a listing get different ETags"""
+    first = client.get('/api/v1/places/?limit=1').headers['ETag']
+    second = client.get('/api/v1/places/?limit=2').headers['ETag']
+    assert first != second
+
+
+def test_user_list_etag_changes_after_signup(client):
+    """Test creating a user invalidates the user listing"""
+    etag = client.get('/api/v1/users/').headers['ETag']
+    user_facade.create_user({
+        'first_name': 'New', 'last_name': 'User',
+        'email': 'new@example.com', 'password': 'password123'
+    })
+    assert client.get('/api/v1/users/', headers={'If-None-Match': etag}).status_code == 200
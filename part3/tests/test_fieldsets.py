@@ -0,0 +1,97 @@
+import json
+import pytest
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+
+
+@pytest.fixture
+def place_id(app):
+    """Create a reviewed place through the service layer and return its ID"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    guest = User('Guest', 'User', 'guest@example.com', 'password123')
+    db.session.add_all([owner, guest])
+    db.session.commit()
+    place = place_facade.create_place({
+        'title': 'Beach House', 'description': 'By the sea', 'price': 100.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+    review_facade.create_review({
+        'text': 'Lovely', 'rating': 4, 'place_id': place.id, 'user_id': guest.id
+    })
+    place_id = place.id
+    db.session.expunge_all()
+    return place_id
+
+
+def get_json(client, url):
+    response = client.get(url)
+    return response.status_code, json.loads(response.data)
+
+
+def capture_sql(client, url):
+    """Return the SQL statements a request runs"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def test_place_fields_and_include(client, place_id):
+    """Test only the requested attributes and relationships are returned"""
+    status, data = get_json(client, f'/api/v1/places/{place_id}?fields=title,price&include=')
+    assert status == 200
+    assert set(data) == {'id', 'title', 'price'}
+
+    _, data = get_json(client, f'/api/v1/places/{place_id}?fields=average_rating&include=owner')
+    assert set(data) == {'id', 'average_rating', 'owner'}
+    assert data['average_rating'] == 4.0
+    assert data['owner']['email'] == 'owner@example.com'
+
+
+def test_default_shape_is_unchanged(client, place_id):
+    """Test requests without the parameters keep the full representation"""
+    _, data = get_json(client, f'/api/v1/places/{place_id}')
+    assert {'title', 'description', 'owner', 'amenities', 'reviews', 'rating_histogram'} <= set(data)
+    _, listing = get_json(client, '/api/v1/places/')
+    assert 'reviews' not in listing['data'][0]
+    assert 'owner' in listing['data'][0]
+
+
+def test_unknown_names_are_rejected(client, place_id):
+    """Test unknown fields or relationships are a 400"""
+    assert client.get('/api/v1/places/?fields=password').status_code == 400
+    assert client.get('/api/v1/users/?include=secrets').status_code == 400
+    assert client.get('/api/v1/amenities/?include=places').status_code == 400
+
+
+def test_listing_query_is_pushed_down(client, place_id):
+    """Test a sparse listing selects fewer columns and skips relationship loads"""
+    statements = capture_sql(client, '/api/v1/places/?fields=title&include=')
+    place_queries = [s for s in statements if 'FROM places' in s]
+    assert len(place_queries) == 1
+    assert 'places.description' not in place_queries[0]
+    assert 'JOIN users' not in place_queries[0]
+    assert not any('place_amenities' in s for s in statements)
+
+
+def test_users_reviews_and_amenities(client, place_id):
+    """Test the parameters work on the other read endpoints"""
+    _, users = get_json(client, '/api/v1/users/?fields=email&include=')
+    assert all(set(user) == {'id', 'email'} for user in users)
+
+    _, reviews = get_json(client, f'/api/v1/reviews/places/{place_id}?fields=rating&include=user')
+    assert reviews[0]['rating'] == 4
+    assert set(reviews[0]) == {'id', 'rating', 'user'}
+
+    _, amenities = get_json(client, '/api/v1/amenities/?fields=name')
+    assert all(set(amenity) == {'id', 'name'} for amenity in amenities)
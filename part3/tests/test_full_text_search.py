@@ -0,0 +1,186 @@
+import pytest
+import json
+import re
+from sqlalchemy import text, event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+from repositories.search_repository import PlaceSearchRepository, build_match_terms
+
+
+@pytest.fixture
+def users(app):
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    guest = User('Guest', 'User', 'guest@example.com', 'password123')
+    db.session.add_all([owner, guest])
+    db.session.commit()
+    return owner, guest
+
+
+def create_place(owner, title, description=''):
+    return place_facade.create_place({
+        'title': title, 'description': description, 'price': 100.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+
+
+def search(client, query, **params):
+    params['q'] = query
+    response = client.get('/api/v1/places/search', query_string=params)
+    return response.status_code, json.loads(response.data)
+
+
+def titles(payload):
+    return [place['title'] for place in payload['data']]
+
+
+def test_build_match_terms():
+    """Test free text becomes quoted terms with a prefix on the last one"""
+    assert build_match_terms('Beach "house" OR') == ('"beach"', '"house"', '"or"*')
+    assert build_match_terms(' -*- ') is None
+
+
+def test_search_ranks_title_matches_first(client, users):
+    """Test places matching in the title outrank description-only matches"""
+    owner, _ = users
+    create_place(owner, 'Quiet Loft', 'Near the beach')
+    create_place(owner, 'Beach House', 'Ocean views')
+    create_place(owner, 'Mountain Cabin', 'Snow and pines')
+    status, payload = search(client, 'beach')
+    assert status == 200
+    assert titles(payload) == ['Beach House', 'Quiet Loft']
+
+
+def test_search_matches_prefixes_and_accents(client, users):
+    """Test partial last words and unaccented queries still match"""
+    owner, _ = users
+    create_place(owner, 'Cabaña en la montaña')
+    assert titles(search(client, 'caba')[1]) == ['Cabaña en la montaña']
+    assert titles(search(client, 'montana')[1]) == ['Cabaña en la montaña']
+
+
+def test_search_follows_service_writes(client, users):
+    """Test place updates and review writes keep the index in sync"""
+    owner, guest = users
+    place = create_place(owner, 'Beach House')
+    place_facade.update_place(place.id, {'title': 'City Studio'})
+    assert titles(search(client, 'beach')[1]) == []
+    assert titles(search(client, 'studio')[1]) == ['City Studio']
+
+    review = review_facade.create_review({
+        'text': 'Spotless kitchen', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    assert titles(search(client, 'spotless')[1]) == ['City Studio']
+    review_facade.delete_review(review.id)
+    assert titles(search(client, 'spotless')[1]) == []
+
+
+def test_search_pages_with_cursor(client, users):
+    """Test ranked results page through every match exactly once"""
+    owner, _ = users
+    for index in range(5):
+        create_place(owner, f'Loft {index}', 'loft ' * index)
+    status, first = search(client, 'loft', limit=2)
+    seen = titles(first)
+    cursor = first['next_cursor']
+    while cursor:
+        _, page = search(client, 'loft', limit=2, cursor=cursor)
+        seen += titles(page)
+        cursor = page['next_cursor']
+    assert sorted(seen) == [f'Loft {index}' for index in range(5)]
+    assert len(seen) == 5
+
+
+def test_search_combines_with_filters(client, users):
+    """Test keyword search still applies the price filter"""
+    owner, _ = users
+    create_place(owner, 'Cheap Loft')
+    place_facade.create_place({
+        'title': 'Luxury Loft', 'price': 900.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+    assert titles(search(client, 'loft', max_price=500)[1]) == ['Cheap Loft']
+
+
+def test_search_rejects_empty_query(client, users):
+    """Test a query without words is a 400"""
+    status, payload = search(client, '  ')
+    assert status == 400
+    assert 'error' in payload
+
+
+def test_rebuild_indexes_rows_loaded_directly(client, users):
+    """Test rebuild picks up places inserted without the services"""
+    owner, _ = users
+    create_place(owner, 'Beach House')
+    db.session.execute(text("DELETE FROM place_search"))
+    db.session.commit()
+    assert PlaceSearchRepository().rebuild() == 1
+    assert titles(search(client, 'beach')[1]) == ['Beach House']
+
+
+def test_terms_may_match_place_or_its_reviews(client, users):
+    """Test every word must appear in the place or one of its reviews"""
+    owner, guest = users
+    place = create_place(owner, 'Beach House')
+    create_place(owner, 'Beach Shack')
+    review_facade.create_review({
+        'text': 'Great sunset', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    assert titles(search(client, 'beach sunset')[1]) == ['Beach House']
+    assert titles(search(client, 'sunset snow')[1]) == []
+
+
+def test_review_writes_only_touch_their_row(client, users):
+    """Test review writes reindex the review, not the place document"""
+    owner, guest = users
+    place = create_place(owner, 'City Studio')
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        review = review_facade.create_review({
+            'text': 'Spotless kitchen', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+        })
+        review_facade.update_review(review.id, {'text': 'Noisy street'})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert any('review_search' in statement for statement in statements)
+    assert not any(re.search(r'\bplace_search\b', statement) for statement in statements)
+    assert titles(search(client, 'spotless')[1]) == []
+    assert titles(search(client, 'noisy')[1]) == ['City Studio']
+
+
+def test_rebuild_indexes_reviews(client, users):
+    """Test rebuild restores review rows as well"""
+    owner, guest = users
+    place = create_place(owner, 'City Studio')
+    review_facade.create_review({
+        'text': 'Spotless kitchen', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    db.session.execute(text("DELETE FROM review_search"))
+    db.session.commit()
+    PlaceSearchRepository().rebuild()
+    assert titles(search(client, 'spotless')[1]) == ['City Studio']
+
+
+def test_deleting_a_review_keeps_its_siblings(client, users):
+    """Test removing one review's row leaves the place's other reviews indexed"""
+    owner, guest = users
+    other = User('Other', 'User', 'other@example.com', 'password123')
+    db.session.add(other)
+    db.session.commit()
+    place = create_place(owner, 'City Studio')
+    first = review_facade.create_review({
+        'text': 'Spotless kitchen', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    review_facade.create_review({
+        'text': 'Noisy street', 'rating': 3, 'place_id': place.id, 'user_id': other.id
+    })
+    review_facade.delete_review(first.id)
+    assert titles(search(client, 'spotless')[1]) == []
+    assert titles(search(client, 'noisy')[1]) == ['City Studio']
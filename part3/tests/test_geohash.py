@@ -0,0 +1,109 @@
+import pytest
+import json
+import random
+from persistence.database import db
+from business_logic import geohash
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.place_facade import place_facade
+
+
+@pytest.fixture
+def owner(app):
+    """Create a place owner"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    db.session.commit()
+    return owner
+
+
+def test_encode_known_value():
+    """Test encoding against a reference geohash"""
+    assert geohash.encode(42.6, -5.6, 5) == 'ezs42'
+    assert geohash.encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+
+
+def test_haversine_known_distance():
+    """Test San Juan to New York is roughly 2575 km"""
+    distance = geohash.haversine_km(18.4655, -66.1057, 40.7128, -74.0060)
+    assert 2550 < distance < 2600
+
+
+@pytest.mark.parametrize('lat, lon, km', [
+    (18.4655, -66.1057, 5),
+    (0.0, 179.99, 50),
+    (89.9, 0.0, 100),
+    (-33.86, 151.2, 0.2),
+])
+def test_covering_cells_contain_circle(lat, lon, km):
+    """Test every point inside the radius falls in a covering cell"""
+    cells = geohash.covering_cells(lat, lon, km)
+    assert len(cells) <= geohash.MAX_COVER_CELLS
+    rng = random.Random(1)
+    min_lat, max_lat, min_lon, max_lon = geohash.bounding_box(lat, lon, km)
+    for _ in range(500):
+        p_lat = rng.uniform(min_lat, max_lat)
+        p_lon = (rng.uniform(min_lon, max_lon) + 180.0) % 360.0 - 180.0
+        if geohash.haversine_km(lat, lon, p_lat, p_lon) <= km:
+            code = geohash.encode(p_lat, p_lon)
+            assert any(code.startswith(cell) for cell in cells)
+
+
+def test_geohash_maintained_on_create_and_update(owner):
+    """Test the geohash column follows the coordinates"""
+    place = place_facade.create_place({
+        'title': 'Beach House', 'price': 100.0,
+        'latitude': 18.4655, 'longitude': -66.1057, 'owner_id': owner.id
+    })
+    assert place.geohash == geohash.encode(18.4655, -66.1057)
+
+    place_facade.update_place(place.id, {'latitude': 40.7128, 'longitude': -74.0060})
+    assert place.geohash == geohash.encode(40.7128, -74.0060)
+
+
+def test_radius_search_matches_brute_force(owner):
+    """Test radius search returns exactly the places within range, nearest first"""
+    rng = random.Random(42)
+    places = []
+    for i in range(300):
+        lat = 18.4 + rng.uniform(-0.5, 0.5)
+        lon = -66.1 + rng.uniform(-0.5, 0.5)
+        places.append(Place(f'Place {i}', '', 50.0, lat, lon, owner))
+    db.session.add_all(places)
+    db.session.commit()
+
+    centre = (18.4, -66.1)
+    expected = sorted(
+        (geohash.haversine_km(*centre, p.latitude, p.longitude), p.id)
+        for p in places
+        if geohash.haversine_km(*centre, p.latitude, p.longitude) <= 10
+    )
+    results = place_facade.find_places_nearby(*centre, 10, limit=100)
+    assert [place.id for place, _ in results] == [place_id for _, place_id in expected][:100]
+    distances = [distance for _, distance in results]
+    assert distances == sorted(distances)
+
+
+def test_nearby_endpoint(app, owner):
+    """Test GET /places/nearby returns places with their distances"""
+    db.session.add_all([
+        Place('Near', '', 50.0, 18.4660, -66.1050, owner),
+        Place('Far', '', 50.0, 40.7128, -74.0060, owner),
+    ])
+    db.session.commit()
+    client = app.test_client()
+    response = client.get('/api/v1/places/nearby?lat=18.4655&lon=-66.1057&radius_km=5')
+    assert response.status_code == 200
+    data = json.loads(response.data)['data']
+    assert [place['title'] for place in data] == ['Near']
+    assert data[0]['distance_km'] < 1
+
+
+def test_nearby_endpoint_rejects_bad_radius(app):
+    """Test a non-positive or too large radius returns 400"""
+    client = app.test_client()
+    response = client.get('/api/v1/places/nearby?lat=0&lon=0&radius_km=0')
+    assert response.status_code == 400
+    response = client.get('/api/v1/places/nearby?lat=0&lon=0&radius_km=20000')
+    assert response.status_code == 400
+    assert 'at most' in json.loads(response.data)['error']
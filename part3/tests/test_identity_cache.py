@@ -0,0 +1,97 @@
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event
+from flask_jwt_extended import create_access_token, current_user, get_jwt, verify_jwt_in_request
+from persistence.database import db
+from business_logic.user_facade import user_facade
+from business_logic.user_service import UserService
+from business_logic.models.user import User
+from business_logic.collection_version_service import CollectionVersionService
+from business_logic.identity_cache import identity_cache
+from business_logic.token_revocation import token_revocation_store
+
+
+@pytest.fixture
+def user_id(app):
+    """Create a user through the service layer"""
+    user = user_facade.create_user({
+        'first_name': 'Token', 'last_name': 'User',
+        'email': 'token@example.com', 'password': 'password123'
+    })
+    return user.id
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements executed inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_identity_is_cached(app, user_id):
+    """Test repeated identity lookups hit the database once"""
+    identity_cache.sync()
+    with count_queries() as statements:
+        first = UserService.get_identity(user_id)
+        second = UserService.get_identity(user_id)
+    assert first == second
+    assert first.email == 'token@example.com'
+    assert len(statements) == 1
+    assert identity_cache.stats()['hits'] == 1
+
+
+def test_unknown_user_is_not_cached(app):
+    """Test a missing user returns None and is looked up again"""
+    assert UserService.get_identity('missing') is None
+    assert identity_cache.stats()['entries'] == 0
+
+
+def test_update_invalidates_identity(app, user_id):
+    """Test updating a user refreshes the claims put in new tokens"""
+    UserService.get_identity(user_id)
+    user_facade.update_user(user_id, {'first_name': 'Renamed'})
+    assert UserService.get_identity(user_id).first_name == 'Renamed'
+
+
+def test_sync_drops_identities_changed_elsewhere(app, user_id):
+    """Test a demotion by another process reaches this cache on the next sync"""
+    user_facade.update_user(user_id, {'is_admin': True})
+    assert UserService.get_identity(user_id).is_admin is True
+    # Another process demotes the user and bumps the users version
+    db.session.execute(db.update(User).where(User.id == user_id).values(is_admin=False))
+    CollectionVersionService.bump('users', commit=True)
+    assert UserService.get_identity(user_id).is_admin is True
+    identity_cache.sync()
+    assert UserService.get_identity(user_id).is_admin is False
+
+
+def test_token_claims_come_from_cache(app, user_id):
+    """Test tokens are issued for a user ID and carry the cached claims"""
+    token = create_access_token(identity=user_id)
+    with app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+        verify_jwt_in_request()
+        assert get_jwt()['email'] == 'token@example.com'
+        assert get_jwt()['is_admin'] is False
+
+
+def test_current_user_loads_row_lazily(app, user_id):
+    """Test authenticating needs no query and the row loads on demand"""
+    token = create_access_token(identity=user_id)
+    token_revocation_store.sync()
+    with app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+        with count_queries() as statements:
+            verify_jwt_in_request()
+            assert current_user.id == user_id
+            assert current_user.first_name == 'Token'
+        assert statements == []
+        with count_queries() as statements:
+            assert current_user.to_dict()['email'] == 'token@example.com'
+        assert statements
@@ -0,0 +1,83 @@
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.review import Review
+from business_logic.models.amenity import Amenity
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+from business_logic.user_facade import user_facade
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements executed inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def populate(count):
+    """Create places that each have an owner, amenities and reviews"""
+    wifi = Amenity('Test WiFi')
+    pool = Amenity('Test Pool')
+    reviewer = User('Review', 'Writer', 'reviewer@example.com', 'password123')
+    db.session.add_all([wifi, pool, reviewer])
+    for i in range(count):
+        owner = User('Owner', str(i), f'owner{i}@example.com', 'password123')
+        place = Place(f'Place {i}', '', 50.0, 0.0, 0.0, owner)
+        place.amenities.extend([wifi, pool])
+        db.session.add(place)
+        db.session.flush()
+        db.session.add(Review('Nice stay', 4, place.id, reviewer.id))
+    db.session.commit()
+    db.session.expunge_all()
+
+
+@pytest.mark.parametrize('count', [5, 20])
+def test_place_page_query_count_is_constant(app, count):
+    """Test serializing a page of places does not issue per-row queries"""
+    populate(count)
+    with count_queries() as statements:
+        places, _ = place_facade.get_places_page(100, eager=True)
+        payload = [place.to_dict(include_reviews=False) for place in places]
+    assert len(payload) == count
+    assert len(statements) <= 2
+
+
+def test_place_detail_is_eager(app):
+    """Test a single place serializes with its relationships preloaded"""
+    populate(1)
+    place_id = db.session.execute(db.select(Place.id)).scalar_one()
+    db.session.expunge_all()
+    with count_queries() as statements:
+        data = place_facade.get_place(place_id, eager=True).to_dict()
+    assert len(data['amenities']) == 2
+    assert len(data['reviews']) == 1
+    assert data['owner']['email'] == 'owner0@example.com'
+    assert len(statements) <= 3
+
+
+def test_review_and_user_lists_are_eager(app):
+    """Test review and user listings avoid N+1 lazy loads"""
+    populate(10)
+    with count_queries() as statements:
+        reviews = [review.to_dict() for review in review_facade.get_all_reviews(eager=True)]
+    assert len(reviews) == 10
+    assert all(review['place'] and review['user'] for review in reviews)
+    assert len(statements) == 1
+
+    db.session.expunge_all()
+    with count_queries() as statements:
+        users = [user.to_dict() for user in user_facade.get_all_users(eager=True)]
+    assert len(users) >= 11
+    assert len(statements) <= 3
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+import pytest
+from flask_bcrypt import Bcrypt
+from business_logic.password_hasher import PasswordHasher, PasswordHasherBusy, password_hasher
+from business_logic.user_facade import user_facade
+
+
+def test_hashes_are_flask_bcrypt_compatible(app):
+    """Test existing Flask-Bcrypt hashes verify and new hashes verify with it"""
+    hasher = PasswordHasher(rounds=4)
+    flask_bcrypt = Bcrypt(app)
+    legacy = flask_bcrypt.generate_password_hash('password123').decode('utf-8')
+    assert hasher.check_password_hash(legacy, 'password123')
+    assert not hasher.check_password_hash(legacy, 'wrong')
+    assert flask_bcrypt.check_password_hash(hasher.generate_password_hash('password123'), 'password123')
+
+
+def test_process_pool_round_trip():
+    """Test hashing and verification through worker processes"""
+    hasher = PasswordHasher(rounds=4, workers=1)
+    try:
+        pw_hash = hasher.generate_password_hash('password123')
+        assert hasher.check_password_hash(pw_hash, 'password123')
+        assert hasher.stats()['completed'] == 2
+    finally:
+        hasher.configure(workers=0)
+
+
+def test_saturated_pool_fails_fast():
+    """Test operations beyond max_pending are rejected instead of queued"""
+    hasher = PasswordHasher(rounds=4, max_pending=1)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=hasher._run, args=(slow,))
+    worker.start()
+    started.wait(5)
+    try:
+        assert hasher.stats()['in_flight'] == 1
+        with pytest.raises(PasswordHasherBusy):
+            hasher.generate_password_hash('password123')
+    finally:
+        release.set()
+        worker.join()
+    stats = hasher.stats()
+    assert stats['rejected'] == 1
+    assert stats['in_flight'] == 0
+    assert stats['latency_ms']['max'] is not None
+
+
+def test_timed_out_work_keeps_its_slot():
+    """Test a timed-out operation counts as pending until its worker finishes"""
+    hasher = PasswordHasher(rounds=4, workers=1, max_pending=1, timeout=0.2)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            hasher._run(time.sleep, 1.5)
+        stats = hasher.stats()
+        assert stats['in_flight'] == 1
+        assert stats['completed'] == 0
+        assert stats['timeouts'] == 1
+        with pytest.raises(PasswordHasherBusy):
+            hasher.generate_password_hash('password123')
+        deadline = time.monotonic() + 10
+        while hasher.stats()['in_flight'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert hasher.stats()['in_flight'] == 0
+        assert hasher.stats()['completed'] == 0
+    finally:
+        hasher.configure(workers=0)
+
+
+def test_login_returns_503_when_saturated(app):
+    """Test the API sheds password work with a 503 and Retry-After"""
+    user_facade.create_user({
+        'first_name': 'Test', 'last_name': 'User',
+        'email': 'busy@example.com', 'password': 'password123'
+    })
+    password_hasher.configure(rounds=4, max_pending=0)
+    response = app.test_client().post('/api/v1/auth/login', json={
+        'email': 'busy@example.com', 'password': 'password123'
+    })
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    stats = json.loads(app.test_client().get('/stats/password-hasher').data)
+    assert stats['rejected'] == 1
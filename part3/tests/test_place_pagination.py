@@ -0,0 +1,87 @@
+import pytest
+import json
+from datetime import datetime, timedelta
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.place_facade import place_facade
+
+
+@pytest.fixture
+def places(app):
+    """Create 25 places with distinct creation times"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    base = datetime(2024, 1, 1)
+    created = []
+    for i in range(25):
+        place = Place(f'Place {i}', '', 10.0 + i, 0.0, 0.0, owner)
+        place.created_at = base + timedelta(minutes=i)
+        db.session.add(place)
+        created.append(place)
+    db.session.commit()
+    return created
+
+
+def test_pages_cover_all_places_in_order(places):
+    """Test walking every page returns each place once, in creation order"""
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = place_facade.get_places_page(10, cursor)
+        seen.extend(place.id for place in page)
+        if cursor is None:
+            break
+    assert seen == [place.id for place in places]
+
+
+def test_last_page_has_no_cursor(places):
+    """Test a page that reaches the end returns no next cursor"""
+    page, cursor = place_facade.get_places_page(25)
+    assert len(page) == 25
+    assert cursor is None
+
+
+def test_places_sharing_created_at_are_not_skipped(app):
+    """Test the id tie-breaker keeps pages stable when timestamps collide"""
+    owner = User('Tie', 'Owner', 'tie@example.com', 'password123')
+    db.session.add(owner)
+    stamp = datetime(2024, 1, 1)
+    for i in range(5):
+        place = Place(f'Tie {i}', '', 10.0, 0.0, 0.0, owner)
+        place.created_at = stamp
+        db.session.add(place)
+    db.session.commit()
+
+    first, cursor = place_facade.get_places_page(3)
+    second, cursor = place_facade.get_places_page(3, cursor)
+    ids = [place.id for place in first + second]
+    assert len(set(ids)) == 5
+    assert cursor is None
+
+
+def test_invalid_cursor_rejected(app):
+    """Test a malformed cursor raises a validation error"""
+    with pytest.raises(ValueError):
+        place_facade.get_places_page(10, 'not-a-cursor')
+
+
+def test_list_endpoint_returns_page(app, places):
+    """Test GET /places/ returns data and next_cursor"""
+    client = app.test_client()
+    response = client.get('/api/v1/places/?limit=10')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert len(data['data']) == 10
+    assert data['next_cursor']
+
+    response = client.get(f"/api/v1/places/?limit=10&cursor={data['next_cursor']}")
+    data = json.loads(response.data)
+    assert data['data'][0]['title'] == 'Place 10'
+
+
+def test_list_endpoint_bad_cursor(app):
+    """Test GET /places/ rejects an invalid cursor with 400"""
+    client = app.test_client()
+    response = client.get('/api/v1/places/?cursor=garbage')
+    assert response.status_code == 400
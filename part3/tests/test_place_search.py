@@ -0,0 +1,100 @@
+import pytest
+import json
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.amenity import Amenity
+from business_logic.place_facade import place_facade
+
+
+@pytest.fixture
+def catalog(app):
+    """Create places spread over prices, coordinates and amenities"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    wifi = Amenity('Search WiFi')
+    pool = Amenity('Search Pool')
+    db.session.add_all([owner, wifi, pool])
+    places = {
+        'cheap_sj': Place('Cheap San Juan', '', 40.0, 18.46, -66.10, owner),
+        'pricey_sj': Place('Pricey San Juan', '', 400.0, 18.45, -66.07, owner),
+        'cheap_ny': Place('Cheap New York', '', 60.0, 40.71, -74.00, owner),
+    }
+    places['cheap_sj'].amenities.extend([wifi, pool])
+    places['pricey_sj'].amenities.append(wifi)
+    places['cheap_ny'].amenities.extend([wifi, pool])
+    db.session.add_all(places.values())
+    db.session.commit()
+    return {'places': places, 'wifi': wifi, 'pool': pool}
+
+
+def titles(places):
+    return sorted(place.title for place in places)
+
+
+def test_search_by_price_range(catalog):
+    """Test min/max price bounds are inclusive"""
+    places, _ = place_facade.search_places({'min_price': 40.0, 'max_price': 60.0})
+    assert titles(places) == ['Cheap New York', 'Cheap San Juan']
+
+
+def test_search_by_bounding_box(catalog):
+    """Test only places inside the bounding box are returned"""
+    box = {'min_lat': 18.0, 'max_lat': 19.0, 'min_lon': -67.0, 'max_lon': -66.0}
+    places, _ = place_facade.search_places(box)
+    assert titles(places) == ['Cheap San Juan', 'Pricey San Juan']
+
+
+def test_search_requires_all_amenities(catalog):
+    """Test places must have every requested amenity"""
+    ids = [catalog['wifi'].id, catalog['pool'].id]
+    places, _ = place_facade.search_places({'amenities': ids})
+    assert titles(places) == ['Cheap New York', 'Cheap San Juan']
+
+
+def test_search_combines_filters(catalog):
+    """Test filters are combined with AND"""
+    filters = {
+        'max_price': 100.0,
+        'min_lat': 18.0, 'max_lat': 19.0, 'min_lon': -67.0, 'max_lon': -66.0,
+        'amenities': [catalog['pool'].id],
+    }
+    places, _ = place_facade.search_places(filters)
+    assert titles(places) == ['Cheap San Juan']
+
+
+def test_search_rejects_partial_bounding_box(catalog):
+    """Test a bounding box missing an edge is rejected"""
+    with pytest.raises(ValueError):
+        place_facade.search_places({'min_lat': 18.0, 'max_lat': 19.0})
+
+
+def test_search_endpoint_paginates(app, catalog):
+    """Test GET /places/search returns a page and a cursor"""
+    client = app.test_client()
+    response = client.get('/api/v1/places/search?max_price=100&limit=1')
+    assert response.status_code == 200
+    first = json.loads(response.data)
+    assert len(first['data']) == 1
+    assert first['next_cursor']
+
+    response = client.get(f"/api/v1/places/search?max_price=100&limit=1&cursor={first['next_cursor']}")
+    second = json.loads(response.data)
+    assert len(second['data']) == 1
+    assert second['data'][0]['id'] != first['data'][0]['id']
+    assert second['next_cursor'] is None
+
+
+def test_search_endpoint_amenity_list(app, catalog):
+    """Test amenities are accepted as a comma-separated list"""
+    client = app.test_client()
+    amenities = f"{catalog['wifi'].id},{catalog['pool'].id}"
+    response = client.get(f'/api/v1/places/search?amenities={amenities}&min_price=50')
+    data = json.loads(response.data)
+    assert [place['title'] for place in data['data']] == ['Cheap New York']
+
+
+def test_search_endpoint_invalid_price_range(app):
+    """Test an inverted price range returns 400"""
+    client = app.test_client()
+    response = client.get('/api/v1/places/search?min_price=100&max_price=10')
+    assert response.status_code == 400
@@ -0,0 +1,106 @@
+import pytest
+import json
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.review_facade import review_facade
+from business_logic.place_facade import place_facade
+from repositories.place_repository import PlaceRepository
+
+
+@pytest.fixture
+def setup(app):
+    """Create a place and three reviewers"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    reviewers = [User('Guest', str(i), f'guest{i}@example.com', 'password123') for i in range(3)]
+    place = Place('Beach House', '', 100.0, 18.0, -66.0, owner)
+    db.session.add_all([owner, place] + reviewers)
+    db.session.commit()
+    return place, reviewers
+
+
+def review(place, user, rating):
+    return review_facade.create_review({
+        'text': 'Stayed here', 'rating': rating, 'place_id': place.id, 'user_id': user.id
+    })
+
+
+def test_create_updates_aggregates(setup):
+    """Test each new review bumps count, sum and histogram"""
+    place, reviewers = setup
+    review(place, reviewers[0], 5)
+    review(place, reviewers[1], 3)
+    summary = place_facade.get_place(place.id).rating_summary()
+    assert summary['review_count'] == 2
+    assert summary['average_rating'] == 4.0
+    assert summary['rating_histogram'] == {'1': 0, '2': 0, '3': 1, '4': 0, '5': 1}
+
+
+def test_update_moves_histogram_bucket(setup):
+    """Test changing a rating moves it between buckets"""
+    place, reviewers = setup
+    created = review(place, reviewers[0], 2)
+    review_facade.update_review(created.id, {'rating': 4})
+    summary = place_facade.get_place(place.id).rating_summary()
+    assert summary['review_count'] == 1
+    assert summary['average_rating'] == 4.0
+    assert summary['rating_histogram']['2'] == 0
+    assert summary['rating_histogram']['4'] == 1
+
+
+def test_delete_removes_rating(setup):
+    """Test deleting a review removes it from the aggregates"""
+    place, reviewers = setup
+    created = review(place, reviewers[0], 1)
+    review(place, reviewers[1], 5)
+    assert review_facade.delete_review(created.id)
+    summary = place_facade.get_place(place.id).rating_summary()
+    assert summary['review_count'] == 1
+    assert summary['average_rating'] == 5.0
+    assert summary['rating_histogram']['1'] == 0
+
+
+def test_failed_review_leaves_aggregates_untouched(setup):
+    """Test a rejected review does not change the aggregates"""
+    place, reviewers = setup
+    review(place, reviewers[0], 4)
+    with pytest.raises(ValueError):
+        review(place, reviewers[0], 1)
+    assert place_facade.get_place(place.id).review_count == 1
+
+
+def test_recompute_matches_incremental(setup):
+    """Test rebuilding from the reviews table gives the same aggregates"""
+    place, reviewers = setup
+    for user, rating in zip(reviewers, [5, 4, 4]):
+        review(place, user, rating)
+    before = place_facade.get_place(place.id).rating_summary()
+    db.session.execute(db.update(Place).values(review_count=0, rating_sum=0, rating_count_4=0))
+    db.session.commit()
+    PlaceRepository().recompute_rating_aggregates()
+    assert place_facade.get_place(place.id).rating_summary() == before
+
+
+def test_list_endpoint_does_not_query_reviews(app, setup):
+    """Test place listings return ratings without touching the reviews table"""
+    place, reviewers = setup
+    review(place, reviewers[0], 5)
+    db.session.expunge_all()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = app.test_client().get('/api/v1/places/')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    data = json.loads(response.data)['data'][0]
+    assert data['review_count'] == 1
+    assert data['average_rating'] == 5.0
+    assert 'reviews' not in data
+    assert not any('FROM reviews' in statement for statement in statements)
@@ -0,0 +1,87 @@
+import json
+import pytest
+from api.app import create_app
+from api.config import TestingConfig, config
+from persistence.database import db, REPLICA_BIND
+from persistence.replica import refresh_sqlite_replica
+from business_logic.user_facade import user_facade
+from business_logic.place_facade import place_facade
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Create an app with a primary and a replica SQLite file"""
+    class ReplicaConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        SQLALCHEMY_REPLICA_URI = f"sqlite:///{tmp_path / 'replica.db'}"
+
+    monkeypatch.setitem(config, 'replica', ReplicaConfig)
+    app = create_app('replica')
+    yield app
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def create_user(app, email='reader@example.com'):
+    """Create a user on the primary in its own app context"""
+    with app.app_context():
+        return user_facade.create_user({
+            'first_name': 'Read', 'last_name': 'Er',
+            'email': email, 'password': 'password123'
+        }).id
+
+
+def test_reads_use_replica_until_refreshed(app, client):
+    """Test GETs are served by the replica, which lags until refreshed"""
+    user_id = create_user(app)
+    assert client.get(f'/api/v1/users/{user_id}').status_code == 404
+    with app.app_context():
+        refresh_sqlite_replica(db.engine, db.engines[REPLICA_BIND])
+    response = client.get(f'/api/v1/users/{user_id}')
+    assert response.status_code == 200
+    assert json.loads(response.data)['email'] == 'reader@example.com'
+
+
+def test_reads_after_write_use_primary(app):
+    """Test a session reads its own writes once it has written"""
+    with app.app_context():
+        user = user_facade.create_user({
+            'first_name': 'Read', 'last_name': 'Er',
+            'email': 'own@example.com', 'password': 'password123'
+        })
+        db.session.expire_all()
+        assert user_facade.get_user(user.id).email == 'own@example.com'
+
+
+def test_unsafe_requests_read_from_primary(app):
+    """Test non-GET requests see rows the replica does not have yet"""
+    user_id = create_user(app)
+    with app.test_request_context(method='GET'):
+        app.preprocess_request()
+        assert user_facade.get_user(user_id) is None
+    with app.test_request_context(method='POST'):
+        app.preprocess_request()
+        assert user_facade.get_user(user_id) is not None
+
+
+def test_cached_replica_read_ends_with_the_lag(app, client):
+    """Test a response cached from a lagging replica is not served once it catches up"""
+    user_id = create_user(app, 'owner@example.com')
+    with app.app_context():
+        refresh_sqlite_replica(db.engine, db.engines[REPLICA_BIND])
+        place_facade.create_place({
+            'title': 'Beach House', 'price': 100.0,
+            'latitude': 18.0, 'longitude': -66.0, 'owner_id': user_id
+        })
+    # The write invalidated the cache, but the replica does not have it yet
+    assert json.loads(client.get('/api/v1/places/').data)['data'] == []
+    with app.app_context():
+        refresh_sqlite_replica(db.engine, db.engines[REPLICA_BIND])
+    places = json.loads(client.get('/api/v1/places/').data)['data']
+    assert [place['title'] for place in places] == ['Beach House']
@@ -0,0 +1,161 @@
+import threading
+import pytest
+from repositories.in_memory_repository import InMemoryRepository
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.models.review import Review
+from business_logic.models.amenity import Amenity
+
+
+@pytest.fixture(params=[False, True], ids=['plain', 'concurrent'])
+def repo(request):
+    """Create an empty repository with the default indexes, in each mode"""
+    return InMemoryRepository(concurrent=request.param, stripes=4)
+
+
+def ids(objects):
+    return sorted(obj.id for obj in objects)
+
+
+def test_indexed_lookup_matches_scan(repo):
+    """Test indexed attributes return the same objects as a full scan"""
+    reviews = [repo.add(Review('Nice', 5, f'place-{i % 3}', f'user-{i % 2}')) for i in range(12)]
+    expected = [review.id for review in reviews if review.place_id == 'place-1']
+    assert ids(repo.get_by_attribute('Review', 'place_id', 'place-1')) == sorted(expected)
+    assert len(repo.get_by_attribute('Review', 'user_id', 'user-0')) == 6
+    assert repo.get_by_attribute('Review', 'place_id', 'missing') == []
+    # Attributes without an index still scan
+    assert len(repo.get_by_attribute('Review', 'rating', 5)) == 12
+
+
+def test_update_moves_object_between_values(repo):
+    """Test update() re-indexes an object changed in place"""
+    amenity = repo.add(Amenity('WiFi'))
+    amenity.update(name='Fast WiFi')
+    repo.update(amenity)
+    assert repo.get_by_attribute('Amenity', 'name', 'WiFi') == []
+    assert repo.get_by_attribute('Amenity', 'name', 'Fast WiFi') == [amenity]
+
+
+def test_delete_removes_from_index(repo):
+    """Test deleted objects are no longer found"""
+    review = repo.add(Review('Nice', 4, 'place-1', 'user-1'))
+    repo.delete('Review', review.id)
+    assert repo.get_by_attribute('Review', 'place_id', 'place-1') == []
+    assert repo.get_by_attribute('Review', 'user_id', 'user-1') == []
+
+
+def test_readding_an_id_replaces_the_entry(repo):
+    """Test adding a new object under an existing ID drops the old values"""
+    first = repo.add(Amenity('Pool'))
+    second = Amenity('Gym')
+    second.id = first.id
+    repo.add(second)
+    assert repo.get_by_attribute('Amenity', 'name', 'Pool') == []
+    assert repo.get_by_attribute('Amenity', 'name', 'Gym') == [second]
+
+
+def test_foreign_key_filled_after_add(repo):
+    """Test objects stored before their foreign key was set are still found"""
+    # An owner that has not been flushed yet has no ID
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    place = repo.add(Place('Loft', '', 100.0, 18.0, -66.0, owner))
+    assert place.owner_id is None
+    # The session fills both in on flush
+    owner.id = 'owner-1'
+    place.owner_id = owner.id
+    assert repo.get_by_attribute('Place', 'owner_id', 'owner-1') == [place]
+
+
+def test_add_index_covers_existing_objects(repo):
+    """Test an index declared later includes objects already stored"""
+    reviews = [repo.add(Review('Nice', rating, 'place-1', 'user-1')) for rating in (3, 5, 5)]
+    repo.add_index('Review', 'rating')
+    assert ids(repo.get_by_attribute('Review', 'rating', 5)) == ids(reviews[1:])
+    with pytest.raises(ValueError):
+        repo.add_index('Booking', 'status')
+
+
+def test_get_all_keeps_insertion_order(repo):
+    """Test listings follow insertion order across stripes, updates keep their place"""
+    reviews = [repo.add(Review('Nice', 5, 'place-1', f'user-{i}')) for i in range(20)]
+    repo.update(reviews[3])
+    repo.delete('Review', reviews[0].id)
+    assert repo.get_all('Review') == reviews[1:]
+
+
+def test_add_all_keeps_order_and_indexes(repo):
+    """Test a bulk add stores every object in order with its index entries"""
+    first = repo.add(Review('Nice', 5, 'place-0', 'user-0'))
+    reviews = repo.add_all(Review('Nice', 4, f'place-{i % 3}', 'user-1') for i in range(30))
+    amenity, = repo.add_all([Amenity('Pool')])
+    assert repo.get_all('Review') == [first] + reviews
+    assert len(repo.get_by_attribute('Review', 'place_id', 'place-0')) == 11
+    assert repo.get_by_attribute('Amenity', 'name', 'Pool') == [amenity]
+    with pytest.raises(ValueError):
+        repo.add_all([Review('Nice', 5, 'place-0', 'user-0'), object()])
+
+
+def test_add_all_leaves_published_state_alone():
+    """Test a concurrent bulk add copies shared buckets instead of changing them"""
+    repo = InMemoryRepository(concurrent=True, stripes=2)
+    repo.add_all(Review('Nice', 5, 'place-0', 'user-0') for _ in range(10))
+    table = repo._tables['Review']
+    published = [(stripe.state, len(stripe.state.indexes['place_id'].get('place-0', {})))
+                 for stripe in table._stripes]
+    repo.add_all(Review('Nice', 5, 'place-0', 'user-0') for _ in range(10))
+    for state, size in published:
+        assert len(state.indexes['place_id'].get('place-0', {})) == size
+    assert len(repo.get_by_attribute('Review', 'place_id', 'place-0')) == 20
+
+
+def test_configure_keeps_objects():
+    """Test switching modes carries stored objects and indexes over"""
+    repo = InMemoryRepository()
+    reviews = [repo.add(Review('Nice', 5, f'place-{i % 2}', 'user-1')) for i in range(10)]
+    repo.configure(concurrent=True, stripes=8)
+    assert repo.get_all('Review') == reviews
+    assert len(repo.get_by_attribute('Review', 'place_id', 'place-0')) == 5
+    repo.configure(concurrent=False)
+    assert repo.get('Review', reviews[7].id) is reviews[7]
+
+
+def test_readers_see_whole_writes_under_concurrency():
+    """Test readers never fail or see half of a pair written by another thread"""
+    repo = InMemoryRepository(concurrent=True, stripes=8)
+    stop = threading.Event()
+    errors = []
+
+    def writer(prefix):
+        # Each round adds two reviews for the same place, then deletes both
+        i = 0
+        while not stop.is_set():
+            place_id = f'{prefix}-{i}'
+            pair = [repo.add(Review('Nice', 5, place_id, 'user-1')) for _ in range(2)]
+            for review in pair:
+                repo.delete('Review', review.id)
+            i += 1
+
+    def reader():
+        try:
+            for _ in range(300):
+                counts = {}
+                for review in repo.get_all('Review'):
+                    counts[review.place_id] = counts.get(review.place_id, 0) + 1
+                repo.get_by_attribute('Review', 'user_id', 'user-1')
+                # A snapshot holds a whole round or none of it, except the
+                # round in progress for each writer
+                assert sum(1 for count in counts.values() if count == 1) <= 2
+        except Exception as e:
+            errors.append(e)
+
+    writers = [threading.Thread(target=writer, args=(prefix,)) for prefix in ('a', 'b')]
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in writers + readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    stop.set()
+    for thread in writers:
+        thread.join()
+    assert errors == []
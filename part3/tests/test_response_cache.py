@@ -0,0 +1,127 @@
+import pytest
+import json
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from business_logic.review_facade import review_facade
+from business_logic.user_facade import user_facade
+from business_logic.response_cache import InMemoryCacheBackend, ResponseCache, response_cache
+from business_logic.collection_version_service import CollectionVersionService
+from sqlalchemy import text
+
+
+@pytest.fixture
+def place(app):
+    """Create a place through the service layer"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    db.session.commit()
+    return place_facade.create_place({
+        'title': 'Beach House', 'price': 100.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+
+
+def test_backend_evicts_least_recently_used():
+    """Test the backend stays within max_entries, dropping the LRU entry"""
+    backend = InMemoryCacheBackend(max_entries=2, ttl=60)
+    backend.set('a', 1)
+    backend.set('b', 2)
+    backend.get('a')
+    backend.set('c', 3)
+    assert backend.get('b') is None
+    assert backend.get('a') == 1
+    assert backend.stats()['evictions'] == 1
+
+
+def test_backend_expires_entries():
+    """Test entries past their TTL are misses"""
+    backend = InMemoryCacheBackend(max_entries=10, ttl=0)
+    backend.set('a', 1)
+    assert backend.get('a') is None
+    assert backend.stats()['misses'] == 1
+
+
+def test_backend_invalidates_by_tag():
+    """Test invalidation removes only entries carrying the tag"""
+    backend = InMemoryCacheBackend()
+    backend.set('place', 1, {'place:1'})
+    backend.set('other', 2, {'place:2'})
+    backend.invalidate(['place:1'])
+    assert backend.get('place') is None
+    assert backend.get('other') == 2
+
+
+def test_stale_read_is_not_cached():
+    """Test a response computed before an invalidation is not stored"""
+    cache = ResponseCache(InMemoryCacheBackend())
+    generation = cache.generation()
+    cache.invalidate('places')
+    cache.set('key', 'stale', {'places'}, generation)
+    assert cache.get('key') is None
+
+
+def test_repeat_request_hits_cache(client, place):
+    """Test the second identical request is served from the cache"""
+    first = client.get('/api/v1/places/')
+    second = client.get('/api/v1/places/')
+    assert first.data == second.data
+    stats = json.loads(client.get('/stats/cache').data)
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_query_args_are_part_of_key(client, place):
+    """Test different query arguments are cached separately"""
+    client.get('/api/v1/places/?limit=1')
+    client.get('/api/v1/places/?limit=2')
+    assert response_cache.stats()['hits'] == 0
+
+
+def test_review_invalidates_place_responses(client, place):
+    """Test a new review refreshes the cached place detail and listing"""
+    assert client.get(f'/api/v1/places/{place.id}').status_code == 200
+    client.get('/api/v1/places/')
+    guest = User('Guest', 'User', 'guest@example.com', 'password123')
+    db.session.add(guest)
+    db.session.commit()
+    review_facade.create_review({
+        'text': 'Lovely', 'rating': 5, 'place_id': place.id, 'user_id': guest.id
+    })
+    detail = json.loads(client.get(f'/api/v1/places/{place.id}').data)
+    listing = json.loads(client.get('/api/v1/places/').data)
+    assert detail['review_count'] == 1
+    assert listing['data'][0]['review_count'] == 1
+    reviews = json.loads(client.get(f'/api/v1/reviews/places/{place.id}').data)
+    assert len(reviews) == 1
+
+
+def test_owner_update_invalidates_place_detail(client, place):
+    """Test renaming the owner refreshes responses that show them"""
+    client.get(f'/api/v1/places/{place.id}')
+    user_facade.update_user(place.owner_id, {'first_name': 'Renamed'})
+    detail = json.loads(client.get(f'/api/v1/places/{place.id}').data)
+    assert detail['owner']['first_name'] == 'Renamed'
+
+
+def test_unrelated_write_keeps_entry(client, place):
+    """Test writes to other entities leave cached responses alone"""
+    client.get(f'/api/v1/places/{place.id}')
+    other = user_facade.create_user({
+        'first_name': 'Other', 'last_name': 'User',
+        'email': 'other@example.com', 'password': 'password123'
+    })
+    user_facade.update_user(other.id, {'first_name': 'Changed'})
+    client.get(f'/api/v1/places/{place.id}')
+    assert response_cache.stats()['hits'] == 1
+
+
+def test_write_by_another_worker_is_not_served_from_cache(client, place):
+    """Test a body cached before another process's write is not reused under the new ETag"""
+    first = client.get('/api/v1/places/')
+    # Another worker commits a change; this process's cache is not invalidated
+    db.session.execute(text("UPDATE places SET title = 'Renamed' WHERE id = :id"), {'id': place.id})
+    CollectionVersionService.bump('places', commit=True)
+    second = client.get('/api/v1/places/')
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert json.loads(second.data)['data'][0]['title'] == 'Renamed'
@@ -0,0 +1,69 @@
+import json
+import pytest
+from api import serialization
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place
+from business_logic.place_facade import place_facade
+
+
+@pytest.fixture
+def place(app):
+    """Create a place through the service layer"""
+    owner = User('Owner', 'Üser', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    db.session.commit()
+    return place_facade.create_place({
+        'title': 'Casa del Café', 'price': 99.5,
+        'latitude': 18.25, 'longitude': -66.5, 'owner_id': owner.id
+    })
+
+
+def stdlib_dumps(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def test_to_dict_uses_mapped_columns(place):
+    """Test to_dict() has a fixed key order and no internal columns"""
+    data = place.to_dict()
+    columns = Place.serialized_columns()
+    assert list(data)[:len(columns)] == list(columns)
+    assert 'rating_count_1' not in data
+    assert 'password' not in place.owner.to_dict()
+
+
+def test_to_dict_after_commit_is_complete(place):
+    """Test expired attributes are reloaded instead of silently dropped"""
+    assert place.to_dict()['title'] == 'Casa del Café'
+    assert place.to_dict()['id'] == place.id
+
+
+def test_dumps_matches_to_dict(place):
+    """Test models encode to the same bytes as their to_dict() output"""
+    encoded = serialization.dumps([place, place.owner])
+    assert encoded == stdlib_dumps([place.to_dict(), place.owner.to_dict()])
+
+
+def test_stdlib_fallback_is_identical(place, monkeypatch):
+    """Test the output does not depend on orjson being installed"""
+    expected = serialization.dumps(place)
+    monkeypatch.setattr(serialization, 'orjson', None)
+    assert serialization.dumps(place) == expected
+
+
+def test_dumps_core_rows(place):
+    """Test Core rows encode as {column: value}"""
+    row = db.session.execute(
+        db.select(Place.id, Place.title, Place.created_at).where(Place.id == place.id)
+    ).one()
+    assert json.loads(serialization.dumps(row)) == {
+        'id': place.id, 'title': place.title, 'created_at': place.created_at.isoformat()
+    }
+
+
+def test_api_writes_encoded_bytes(app, place):
+    """Test endpoints return the serializer's bytes"""
+    response = app.test_client().get(f'/api/v1/places/{place.id}')
+    db.session.expire_all()
+    assert response.mimetype == 'application/json'
+    assert response.data == serialization.dumps(place_facade.get_place(place.id))
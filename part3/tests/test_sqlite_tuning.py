@@ -0,0 +1,38 @@
+from sqlalchemy import create_engine, text
+from api.app import create_app
+from api.config import Config
+from persistence.database import db, set_sqlite_pragmas
+
+
+def test_pragmas_applied_to_file_database(tmp_path):
+    """Test every new connection gets WAL, NORMAL sync and a busy timeout"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'hbnb.db'}", **Config.SQLALCHEMY_ENGINE_OPTIONS)
+    set_sqlite_pragmas(engine, Config.SQLITE_PRAGMAS)
+    with engine.connect() as first, engine.connect() as second:
+        for conn in (first, second):
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert conn.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+    engine.dispose()
+
+
+def test_wal_reader_is_not_blocked_by_writer(tmp_path):
+    """Test a reader sees committed data while a write transaction is open"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'hbnb.db'}", **Config.SQLALCHEMY_ENGINE_OPTIONS)
+    set_sqlite_pragmas(engine, {**Config.SQLITE_PRAGMAS, 'busy_timeout': 0})
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE t (x INTEGER)'))
+        conn.execute(text('INSERT INTO t VALUES (1)'))
+    with engine.connect() as writer, engine.connect() as reader:
+        writer.exec_driver_sql('BEGIN IMMEDIATE')
+        writer.execute(text('INSERT INTO t VALUES (2)'))
+        assert reader.execute(text('SELECT count(*) FROM t')).scalar() == 1
+        writer.rollback()
+    engine.dispose()
+
+
+def test_app_engine_gets_pragmas():
+    """Test create_app applies the configured pragmas to db.engine"""
+    app = create_app('testing')
+    with app.app_context():
+        assert db.session.execute(text('PRAGMA busy_timeout')).scalar() == 5000
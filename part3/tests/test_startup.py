@@ -0,0 +1,87 @@
+import sqlite3
+import pytest
+from sqlalchemy import inspect
+import api.app
+from api.app import create_app
+from api.config import DevelopmentConfig, config
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.amenity import Amenity
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Register a file-backed config that does not initialize on startup"""
+    path = tmp_path / 'hbnb.db'
+
+    class FileConfig(DevelopmentConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        BCRYPT_LOG_ROUNDS = 4
+
+    monkeypatch.setitem(config, 'file', FileConfig)
+    return path
+
+
+def test_import_does_not_build_an_app():
+    """Test importing the module leaves app creation to the caller"""
+    assert not hasattr(api.app, 'app')
+
+
+def test_create_app_does_not_touch_the_database(db_path):
+    """Test building an app opens no connection and creates nothing"""
+    app = create_app('file')
+    assert not db_path.exists()
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_init_db_command_creates_and_seeds(db_path):
+    """Test `flask init-db` creates the schema and is safe to rerun"""
+    app = create_app('file')
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=['init-db']).exit_code == 0
+    assert runner.invoke(args=['init-db']).exit_code == 0
+    with app.app_context():
+        assert 'users' in inspect(db.engine).get_table_names()
+        assert db.session.query(User).filter_by(is_admin=True).count() == 1
+        assert db.session.query(Amenity).count() == 10
+        db.engine.dispose()
+
+
+def test_init_db_upgrades_an_older_schema(db_path):
+    """Test `flask init-db` adds later columns to existing tables and fills them in"""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE users (first_name VARCHAR(50) NOT NULL, last_name VARCHAR(50) NOT NULL,
+            email VARCHAR(120) NOT NULL, password VARCHAR(255) NOT NULL, is_admin BOOLEAN NOT NULL,
+            id VARCHAR(60) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+            PRIMARY KEY (id));
+        CREATE TABLE places (title VARCHAR(100) NOT NULL, description TEXT, price FLOAT NOT NULL,
+            latitude FLOAT NOT NULL, longitude FLOAT NOT NULL, owner_id VARCHAR(60) NOT NULL,
+            id VARCHAR(60) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+            PRIMARY KEY (id));
+        CREATE TABLE reviews (text TEXT NOT NULL, rating INTEGER NOT NULL, place_id VARCHAR(60) NOT NULL,
+            user_id VARCHAR(60) NOT NULL, id VARCHAR(60) NOT NULL, created_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL, PRIMARY KEY (id));
+        INSERT INTO users VALUES ('Old', 'User', 'old@example.com', 'x', 0, 'u1', '2024-01-01', '2024-01-01');
+        INSERT INTO places VALUES ('Old place', '', 10, 18.4, -66.1, 'u1', 'p1', '2024-01-01', '2024-01-01');
+        INSERT INTO reviews VALUES ('Good', 4, 'p1', 'u1', 'r1', '2024-01-01', '2024-01-01');
+    """)
+    conn.commit()
+    conn.close()
+
+    app = create_app('file')
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=['init-db']).exit_code == 0
+    assert runner.invoke(args=['init-db']).exit_code == 0
+    with app.app_context():
+        columns = {column['name'] for column in inspect(db.engine).get_columns('places')}
+        assert {'geohash', 'review_count', 'rating_sum', 'rating_count_4'} <= columns
+        indexes = {index['name'] for index in inspect(db.engine).get_indexes('reviews')}
+        assert 'idx_reviews_place_id' in indexes
+        response = app.test_client().get('/api/v1/places/')
+        assert response.status_code == 200
+        place = response.get_json()['data'][0]
+        assert place['geohash']
+        assert place['review_count'] == 1 and place['average_rating'] == 4.0
+        db.engine.dispose()
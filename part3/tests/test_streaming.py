@@ -0,0 +1,85 @@
+import json
+import pytest
+from api.app import create_app
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from repositories.place_repository import PlaceRepository
+
+
+@pytest.fixture
+def app():
+    """Create a test app with a small streaming chunk size"""
+    app = create_app('testing')
+    app.config['STREAM_CHUNK_SIZE'] = 2
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def places(app):
+    """Create five places for one owner"""
+    owner = User('Owner', 'User', 'owner@example.com', 'password123')
+    db.session.add(owner)
+    db.session.commit()
+    places, _ = place_facade.create_places([
+        {'title': f'Place {i}', 'price': 10.0 + i, 'latitude': 0.0, 'longitude': 0.0}
+        for i in range(5)
+    ], owner.id)
+    return [place.id for place in places]
+
+
+def test_iter_chunks_walks_everything(places):
+    """Test chunks are bounded and cover every row once, in keyset order"""
+    chunks = list(PlaceRepository().iter_chunks(2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    ids = [place.id for chunk in chunks for place in chunk]
+    assert sorted(ids) == sorted(places)
+    keys = [(place.created_at, place.id) for chunk in chunks for place in chunk]
+    assert keys == sorted(keys)
+
+
+def test_stream_json_array(client, places):
+    """Test ?stream=true returns the whole collection as one JSON array"""
+    response = client.get('/api/v1/places/?stream=true&fields=title&include=')
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/json'
+    data = json.loads(response.data)
+    assert len(data) == 5
+    assert all(set(place) == {'id', 'title'} for place in data)
+
+
+def test_stream_ndjson(client, places):
+    """Test Accept: application/x-ndjson streams one object per line"""
+    response = client.get('/api/v1/places/', headers={'Accept': 'application/x-ndjson'})
+    assert response.mimetype == 'application/x-ndjson'
+    assert 'Accept' in response.headers['Vary']
+    lines = response.data.decode('utf-8').splitlines()
+    assert sorted(json.loads(line)['id'] for line in lines) == sorted(places)
+
+
+def test_stream_matches_regular_listing(client, places):
+    """Test streamed users and reviews carry the same objects as the lists"""
+    for url in ('/api/v1/users/', '/api/v1/reviews/'):
+        regular = json.loads(client.get(url).data)
+        streamed = json.loads(client.get(url + '?stream=1').data)
+        key = lambda item: item['id']
+        assert sorted(streamed, key=key) == sorted(regular, key=key)
+
+
+def test_stream_empty_collection(client):
+    """Test an empty stream is still a valid JSON array"""
+    assert client.get('/api/v1/reviews/?stream=true').data == b'[]'
+
+
+def test_stream_and_json_etags_differ(client, places):
+    """Test the streamed and paginated representations are validated separately"""
+    paginated = client.get('/api/v1/places/').headers['ETag']
+    ndjson = client.get('/api/v1/places/', headers={'Accept': 'application/x-ndjson'}).headers['ETag']
+    assert paginated != ndjson
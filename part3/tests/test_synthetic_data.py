@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import func
+from api.app import create_app
+from persistence.database import db
+from business_logic.models.user import User
+from business_logic.models.place import Place, place_amenities
+from business_logic.models.review import Review
+from scripts.generate_data import generate_dataset
+
+
+def load(seed, users=50, places=20, reviews=300):
+    """Load a dataset into a fresh app and return its rows"""
+    app = create_app('testing')
+    with app.app_context():
+        counts = generate_dataset(users, places, reviews, seed=seed, batch_size=64)
+        rows = {
+            'users': db.session.execute(
+                db.select(User.id, User.email).where(User.is_admin.is_(False)).order_by(User.id)
+            ).all(),
+            'places': db.session.execute(
+                db.select(Place.id, Place.latitude, Place.price, Place.review_count).order_by(Place.id)
+            ).all(),
+            'reviews': db.session.execute(
+                db.select(Review.id, Review.rating, Review.created_at).order_by(Review.id)
+            ).all(),
+        }
+    return app, counts, rows
+
+
+def test_same_seed_same_rows():
+    """Test the dataset is reproducible from its seed"""
+    _, first_counts, first = load(seed=7)
+    _, second_counts, second = load(seed=7)
+    _, _, other = load(seed=8)
+    assert first_counts == second_counts
+    assert first == second
+    assert first['places'] != other['places']
+
+
+def test_volumes_and_aggregates():
+    """Test volumes are honoured and place aggregates match their reviews"""
+    app, counts, rows = load(seed=1)
+    assert counts['users'] == 50
+    assert counts['places'] == 20
+    assert abs(counts['reviews'] - 300) <= 20
+    with app.app_context():
+        per_place = dict(db.session.execute(
+            db.select(Review.place_id, func.count()).group_by(Review.place_id)
+        ).all())
+        for place in db.session.scalars(db.select(Place)):
+            assert place.review_count == per_place.get(place.id, 0)
+            ratings = db.session.scalars(db.select(Review.rating).where(Review.place_id == place.id)).all()
+            assert place.rating_sum == sum(ratings)
+        assert db.session.scalar(db.select(func.count()).select_from(place_amenities)) == counts['place_amenities']
+
+
+def test_reviews_respect_business_rules():
+    """Test nobody reviews their own place or the same place twice"""
+    app, _, _ = load(seed=3)
+    with app.app_context():
+        own = db.session.scalar(
+            db.select(func.count()).select_from(Review).join(Place, Place.id == Review.place_id)
+            .where(Place.owner_id == Review.user_id)
+        )
+        pairs = db.session.execute(db.select(Review.user_id, Review.place_id)).all()
+    assert own == 0
+    assert len(pairs) == len(set(pairs))
+
+
+def test_places_need_users():
+    """Test places cannot be generated without owners"""
+    app = create_app('testing')
+    with app.app_context(), pytest.raises(ValueError):
+        generate_dataset(0, 5, 10)
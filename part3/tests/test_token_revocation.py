@@ -0,0 +1,119 @@
+import json
+import time
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from persistence.database import db
+from business_logic.models.revoked_token import RevokedToken
+from business_logic.token_revocation import BloomFilter, token_revocation_store
+from repositories.revoked_token_repository import RevokedTokenRepository
+
+
+@pytest.fixture
+def token(client):
+    """Register a user and return their access token"""
+    response = client.post('/api/v1/auth/register', json={
+        'first_name': 'Token', 'last_name': 'User',
+        'email': 'token@example.com', 'password': 'password123'
+    })
+    return json.loads(response.data)['access_token']
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test every added key is reported and few others are"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [str(uuid.uuid4()) for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+def test_logout_revokes_token(client, token):
+    """Test a token stops working once it is used to log out"""
+    headers = {'Authorization': f'Bearer {token}'}
+    assert client.get('/api/v1/auth/protected', headers=headers).status_code == 200
+    assert client.post('/api/v1/auth/logout', headers=headers).status_code == 200
+    response = client.get('/api/v1/auth/protected', headers=headers)
+    assert response.status_code == 401
+    assert json.loads(response.data)['error'] == 'Token has been revoked'
+    assert db.session.query(RevokedToken).count() == 1
+
+
+def test_check_skips_database_between_syncs(app):
+    """Test checks after the initial load run no SQL"""
+    token_revocation_store.is_revoked('warm-up')
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        for _ in range(100):
+            assert not token_revocation_store.is_revoked(str(uuid.uuid4()))
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert statements == []
+
+
+def test_sync_picks_up_other_processes(app):
+    """Test revocations written by another process are seen after a sync"""
+    token_revocation_store.is_revoked('warm-up')
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    RevokedTokenRepository().add('elsewhere', 'access', None, expires_at, datetime.utcnow())
+    token_revocation_store.sync()
+    assert token_revocation_store.is_revoked('elsewhere')
+
+
+def test_sync_picks_up_late_commits(app):
+    """Test a revocation stamped before the newest one seen, but committed after, is loaded"""
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    revoked_at = datetime.utcnow()
+    RevokedTokenRepository().add('first', 'access', None, expires_at, revoked_at)
+    token_revocation_store.sync()
+    # Another process stamped its revocation earlier but committed it only now
+    RevokedTokenRepository().add('late', 'refresh', None, expires_at, revoked_at - timedelta(seconds=2))
+    token_revocation_store.sync()
+    assert token_revocation_store.is_revoked('late')
+
+
+def test_expired_entries_are_pruned(app):
+    """Test tokens past their exp leave memory on sync and the table on the next revoke"""
+    token_revocation_store.revoke('stale', time.time() - 1)
+    token_revocation_store.sync()
+    assert not token_revocation_store.is_revoked('stale')
+    token_revocation_store.revoke('fresh', time.time() + 3600)
+    assert token_revocation_store.is_revoked('fresh')
+    assert db.session.get(RevokedToken, 'stale') is None
+
+
+def test_sync_only_reads(app):
+    """Test a sync runs no writes, so replica-routed requests stay unpinned"""
+    expires_at = datetime.utcnow() - timedelta(seconds=1)
+    RevokedTokenRepository().add('stale', 'access', None, expires_at, datetime.utcnow())
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        token_revocation_store.sync()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert statements and all(statement.lstrip().upper().startswith('SELECT') for statement in statements)
+    assert db.session.get(RevokedToken, 'stale') is not None
+
+
+def test_prune_command_deletes_expired_rows(app):
+    """Test flask prune-revoked-tokens removes only expired rows"""
+    now = datetime.utcnow()
+    RevokedTokenRepository().add('stale', 'access', None, now - timedelta(seconds=1), now)
+    RevokedTokenRepository().add('fresh', 'access', None, now + timedelta(hours=1), now)
+    result = app.test_cli_runner().invoke(args=['prune-revoked-tokens'])
+    assert 'Deleted 1 expired revoked tokens' in result.output
+    assert db.session.get(RevokedToken, 'stale') is None
+    assert db.session.get(RevokedToken, 'fresh') is not None
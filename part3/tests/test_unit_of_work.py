@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import event
+from persistence.database import db
+from persistence.unit_of_work import unit_of_work, in_unit_of_work
+from business_logic.models.user import User
+from business_logic.place_facade import place_facade
+from repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+def commits(app):
+    """Record every commit on the app's session"""
+    session = db.session()
+    recorded = []
+
+    def after_commit(session):
+        recorded.append(session)
+
+    event.listen(session, 'after_commit', after_commit)
+    yield recorded
+    event.remove(session, 'after_commit', after_commit)
+
+
+def make_user(email):
+    return User('Test', 'User', email, 'password123')
+
+
+def test_repositories_only_flush_inside(commits):
+    """Test repository writes inside a unit of work share one commit"""
+    repository = UserRepository()
+    with unit_of_work():
+        assert in_unit_of_work()
+        first = repository.add(make_user('first@example.com'))
+        repository.add(make_user('second@example.com'))
+        assert first.id is not None
+        assert commits == []
+    assert not in_unit_of_work()
+    assert len(commits) == 1
+
+
+def test_error_rolls_back_every_write(app):
+    """Test a failure discards writes made earlier in the unit of work"""
+    repository = UserRepository()
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            repository.add(make_user('kept@example.com'))
+            raise RuntimeError('boom')
+    assert repository.get_by_email('kept@example.com') is None
+
+
+def test_nested_units_join_the_outer_one(commits):
+    """Test only the outermost unit of work commits"""
+    repository = UserRepository()
+    with unit_of_work():
+        with unit_of_work():
+            repository.add(make_user('nested@example.com'))
+        assert commits == []
+    assert len(commits) == 1
+
+
+def test_update_place_commits_once(app, commits):
+    """Test a multi-step service write is a single transaction"""
+    owner = make_user('owner@example.com')
+    db.session.add(owner)
+    db.session.commit()
+    place = place_facade.create_place({
+        'title': 'Beach House', 'price': 100.0,
+        'latitude': 18.0, 'longitude': -66.0, 'owner_id': owner.id
+    })
+    del commits[:]
+    place_facade.update_place(place.id, {'title': 'Cabin', 'amenities': []})
+    assert len(commits) == 1
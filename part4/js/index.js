@@ -6,6 +6,12 @@
 // API configuration
 const API_URL = 'http://127.0.0.1:5000/api/v1';
 
+// Places requested per page (the backend allows up to 100)
+const PAGE_SIZE = 100;
+
+// Incremented on every load so a superseded load stops following its cursor
+let placesRequestId = 0;
+
 // Verificar si el usuario es administrador
 function checkAdminAccess() {
     const token = window.auth.getCookie('token');
@@ -95,27 +101,24 @@ function displayPlaces(places) {
     }
 
     container.innerHTML = places.map(place => createPlaceCard(place)).join('');
-    applyPriceFilter();
 }
 
 /**
- * Filter places by maximum price
+ * Build the URL of one page of places, letting the backend filter by maximum price
+ * @param {string} [cursor] - next_cursor returned by the previous page
+ * @returns {string} URL of the places endpoint to query
  */
-function applyPriceFilter() {
+function buildPlacesUrl(cursor) {
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
     const maxPrice = document.getElementById('max-price');
-    if (!maxPrice) return;
-
-    const value = maxPrice.value;
-    const cards = document.querySelectorAll('.place-card');
-
-    cards.forEach(card => {
-        const price = parseFloat(card.getAttribute('data-price'));
-        if (value === 'all' || price <= parseFloat(value)) {
-            card.style.display = 'block';
-        } else {
-            card.style.display = 'none';
-        }
-    });
+    if (!maxPrice || maxPrice.value === 'all') {
+        return `${API_URL}/places/?${params}`;
+    }
+    params.set('max_price', maxPrice.value);
+    return `${API_URL}/places/search?${params}`;
 }
 
 /**
@@ -137,29 +140,39 @@ function extractErrorMessage(data) {
 }
 
 /**
- * Load and display places from the backend
+ * Load and display places from the backend, following next_cursor until every page is read
  */
 async function fetchPlaces() {
+    const requestId = ++placesRequestId;
     try {
         const token = window.auth.getCookie('token');
-        const response = await fetch(`${API_URL}/places/`, {
-            headers: {
-                'Authorization': token ? `Bearer ${token}` : ''
+        const places = [];
+        let cursor = null;
+        do {
+            const response = await fetch(buildPlacesUrl(cursor), {
+                headers: {
+                    'Authorization': token ? `Bearer ${token}` : ''
+                }
+            });
+
+            if (!response.ok) {
+                const data = await response.json();
+                throw new Error(extractErrorMessage(data));
             }
-        });
 
-        if (!response.ok) {
-            const data = await response.json();
-            throw new Error(extractErrorMessage(data));
-        }
+            const result = await response.json();
+            places.push(...result.data);
+            cursor = result.next_cursor;
 
-        const result = await response.json();
+            // The filter changed while this load was running
+            if (requestId !== placesRequestId) return;
+        } while (cursor);
         
         // Store places in global variable for filtering
-        window.places = result.data;
+        window.places = places;
         
         // Display places
-        displayPlaces(result.data);
+        displayPlaces(places);
         
         // Show admin actions if user is admin
         const isAdmin = checkAdminAccess();
@@ -168,6 +181,7 @@ async function fetchPlaces() {
             adminActions.style.display = isAdmin ? 'block' : 'none';
         }
     } catch (error) {
+        if (requestId !== placesRequestId) return;
         console.error('Error:', error);
         const container = document.querySelector('.places-container');
         if (container) {
@@ -190,6 +204,6 @@ document.addEventListener('DOMContentLoaded', () => {
     
     const maxPrice = document.getElementById('max-price');
     if (maxPrice) {
-        maxPrice.addEventListener('change', applyPriceFilter);
+        maxPrice.addEventListener('change', fetchPlaces);
     }
 });